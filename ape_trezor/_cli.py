@@ -1,14 +1,18 @@
-from typing import TYPE_CHECKING, cast
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, cast
 
 import click
 from ape.cli.arguments import existing_alias_argument, non_existing_alias_argument
+from ape.cli.commands import ConnectedProviderCommand
 from ape.cli.options import ape_cli_context, skip_confirmation_option
-from trezorlib.cli.trezorctl import cli as trezorlib_cli
 
 from ape_trezor.exceptions import TrezorSigningError
 from ape_trezor.utils import DEFAULT_ETHEREUM_HD_PATH
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from ape.api.accounts import AccountAPI
 
     from ape_trezor.client import TrezorClient
@@ -69,18 +73,51 @@ hd_path_option = click.option(
 )
 
 
-def create_client(hd_path: "HDBasePath") -> "TrezorClient":
+device_id_option = click.option(
+    "--device-id",
+    help=(
+        "The ID of the device to use (defaults to the first device found). "
+        "Accounts added with it only sign using that device."
+    ),
+)
+
+
+def create_client(
+    hd_path: "HDBasePath", derive_locally: bool = False, device_id: Optional[str] = None
+) -> "TrezorClient":
     # NOTE: Abstracted for testing (and --help performance!) reasons.
     from ape_trezor.client import create_client as _create_client
 
-    return _create_client(hd_path)
+    return _create_client(hd_path, derive_locally=derive_locally, device_id=device_id)
+
+
+@cli.command()
+@ape_cli_context()
+def devices(cli_ctx):
+    """List the IDs of the connected Trezor devices"""
+
+    from ape_trezor.client import device_sessions
+
+    device_ids = device_sessions.enumerate_devices()
+    if not device_ids:
+        cli_ctx.logger.warning("No Trezor devices found.")
+        return
+
+    for device_id in device_ids:
+        click.echo(f"  {device_id}")
 
 
 @cli.command()
 @ape_cli_context()
 @non_existing_alias_argument()
 @hd_path_option
-def add(cli_ctx, alias, hd_path):
+@device_id_option
+@click.option(
+    "--verify",
+    is_flag=True,
+    help="Re-check the selected address on the device before adding it.",
+)
+def add(cli_ctx, alias, hd_path, device_id, verify):
     """Add a account from your Trezor hardware wallet"""
 
     if hd_path.path == DEFAULT_ETHEREUM_HD_PATH:
@@ -91,14 +128,220 @@ def add(cli_ctx, alias, hd_path):
 
     from ape_trezor.choices import AddressPromptChoice
 
-    client = create_client(hd_path)
+    # NOTE: Addresses are derived on the host from the root public key so paging is fast.
+    client = create_client(hd_path, derive_locally=True, device_id=device_id)
     choices = AddressPromptChoice(client, hd_path)
     address, account_hd_path = choices.get_user_selected_account()
+    if verify:
+        cli_ctx.logger.info("Please confirm the address on your device.")
+        client.verify_account_path(account_hd_path.address_n[-1], address)
+
     container = cli_ctx.account_manager.containers.get("trezor")
-    container.save_account(alias, address, str(account_hd_path))
+    container.save_account(alias, address, str(account_hd_path), device_id=device_id)
     cli_ctx.logger.success(f"Account '{address}' successfully added with alias '{alias}'.")
 
 
+@cli.command(short_help="Add a range of accounts from your Trezor hardware wallet")
+@ape_cli_context()
+@hd_path_option
+@device_id_option
+@click.option(
+    "--start",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="The first account index.",
+)
+@click.option(
+    "--count", type=click.IntRange(min=1), required=True, help="The number of accounts to add."
+)
+@click.option(
+    "--alias-template",
+    required=True,
+    help="The alias of each account, where '{i}' is replaced by its index, e.g. 'ops-{i}'.",
+)
+@click.option(
+    "--on-device",
+    is_flag=True,
+    help="Derive each address on the device instead of from the HD Path's public key.",
+)
+def add_range(cli_ctx, hd_path, device_id, start, count, alias_template, on_device):
+    """Add many accounts from your Trezor hardware wallet without prompting"""
+
+    _abort_on_invalid_range(cli_ctx, start, count)
+    _abort_on_invalid_alias_template(cli_ctx, alias_template)
+    if count > 1 and "{i}" not in alias_template:
+        cli_ctx.abort("The alias template must contain '{i}' to add multiple accounts.")
+
+    aliases = {i: alias_template.format(i=i) for i in range(start, start + count)}
+    _abort_on_existing_aliases(cli_ctx, aliases.values())
+
+    if hd_path.path == DEFAULT_ETHEREUM_HD_PATH:
+        cli_ctx.logger.warning(
+            "Using the default Ethereum HD Path is not recommended for 3rd party wallets. "
+            "Please use an alternative HD-Path for a safer integration."
+        )
+
+    # NOTE: All addresses are derived using the same device connection.
+    client = create_client(hd_path, derive_locally=not on_device, device_id=device_id)
+    addresses = client.get_account_paths(aliases)
+    accounts = [
+        (alias, address, str(hd_path.get_account_path(i)))
+        for (i, alias), address in zip(aliases.items(), addresses)
+    ]
+    container = cli_ctx.account_manager.containers.get("trezor")
+    container.save_accounts(accounts, device_id=device_id)
+    cli_ctx.logger.success(f"Added {len(accounts)} accounts ('{accounts[0][0]}' ...).")
+
+
+@cli.command(short_help="Export the addresses of a range of accounts")
+@ape_cli_context()
+@hd_path_option
+@device_id_option
+@click.option(
+    "--start",
+    type=click.IntRange(min=0),
+    default=0,
+    show_default=True,
+    help="The first account index.",
+)
+@click.option(
+    "--count", type=click.IntRange(min=1), required=True, help="The number of addresses to export."
+)
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(["csv", "jsonl"]),
+    default="csv",
+    show_default=True,
+    help="The output format.",
+)
+@click.option(
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="Where to write the addresses (defaults to stdout).",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="The number of addresses per chunk.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="The number of worker processes (defaults to CPUs).",
+)
+def export_addresses(
+    cli_ctx, hd_path, device_id, start, count, file_format, output, chunk_size, workers
+):
+    """
+    Export the addresses of a range of accounts under the HD Path. The device is only
+    asked for the HD Path's public key; the addresses are derived on this machine.
+    """
+    import csv
+    import json
+
+    from ape_trezor.bulk import map_chunks
+
+    _abort_on_invalid_range(cli_ctx, start, count)
+    client = create_client(hd_path, derive_locally=True, device_id=device_id)
+    try:
+        public_node = client.public_node
+    finally:
+        client.close()
+
+    account_ids = range(start, start + count)
+    addresses = map_chunks(
+        public_node.get_child_addresses, account_ids, chunk_size=chunk_size, max_workers=workers
+    )
+    csv_writer = csv.writer(output) if file_format == "csv" else None
+    if csv_writer is not None:
+        csv_writer.writerow(("index", "address", "hd_path"))
+
+    for account_id, address in zip(account_ids, addresses):
+        account_hd_path = str(hd_path.get_account_path(account_id))
+        if csv_writer is not None:
+            csv_writer.writerow((account_id, address, account_hd_path))
+        else:
+            row = {"index": account_id, "address": address, "hd_path": account_hd_path}
+            output.write(f"{json.dumps(row)}\n")
+
+
+@cli.command(cls=ConnectedProviderCommand, short_help="Find the accounts used on-chain")
+@ape_cli_context()
+@hd_path_option
+@device_id_option
+@click.option(
+    "--gap-limit",
+    type=click.IntRange(min=1),
+    default=20,
+    show_default=True,
+    help="Stop after this many consecutive unused accounts.",
+)
+@click.option("--start", type=int, default=0, show_default=True, help="The first account index.")
+@click.option(
+    "--alias-template",
+    help="Add the used accounts, where '{i}' in the alias is replaced by the index.",
+)
+def discover(cli_ctx, provider, hd_path, device_id, gap_limit, start, alias_template):
+    """
+    Find the accounts under the HD Path that have a nonce or balance on the
+    connected network, checking addresses in batched requests.
+    """
+
+    from ape_trezor.discovery import discover_accounts
+
+    if alias_template is not None:
+        _abort_on_invalid_alias_template(cli_ctx, alias_template)
+        if "{i}" not in alias_template:
+            cli_ctx.abort("The alias template must contain '{i}'.")
+
+    client = create_client(hd_path, derive_locally=True, device_id=device_id)
+    used_accounts = []
+    for i, address in discover_accounts(client, provider, gap_limit=gap_limit, start=start):
+        click.echo(f"  {i}: {address} ({hd_path.get_account_path(i)})")
+        used_accounts.append((i, address))
+
+    if not used_accounts:
+        cli_ctx.logger.warning("No used accounts found.")
+        return
+
+    elif alias_template is None:
+        return
+
+    accounts = [
+        (alias_template.format(i=i), address, str(hd_path.get_account_path(i)))
+        for i, address in used_accounts
+    ]
+    _abort_on_existing_aliases(cli_ctx, [alias for alias, *_ in accounts])
+    container = cli_ctx.account_manager.containers.get("trezor")
+    container.save_accounts(accounts, device_id=device_id)
+    cli_ctx.logger.success(f"Added {len(accounts)} used accounts.")
+
+
+def _abort_on_invalid_range(cli_ctx, start: int, count: int):
+    from trezorlib.tools import HARDENED_FLAG
+
+    # NOTE: Higher indices are hardened, which public key derivation cannot reach.
+    if start + count > HARDENED_FLAG:
+        cli_ctx.abort(f"The index range exceeds the maximum account index ({HARDENED_FLAG - 1}).")
+
+
+def _abort_on_invalid_alias_template(cli_ctx, alias_template: str):
+    # NOTE: Only '{i}' can be replaced, e.g. not '{j}' or '{0}'.
+    try:
+        alias_template.format(i=0)
+    except (KeyError, IndexError, ValueError, AttributeError, TypeError) as err:
+        cli_ctx.abort(f"Invalid alias template '{alias_template}': {err!r}.")
+
+
+def _abort_on_existing_aliases(cli_ctx, aliases: "Iterable[str]"):
+    if existing_aliases := set(aliases) & set(cli_ctx.account_manager.aliases):
+        cli_ctx.abort(f"Aliases already in use: {', '.join(sorted(existing_aliases))}.")
+
+
 def _filter_accounts(acct: "AccountAPI") -> bool:
     from ape_trezor.accounts import TrezorAccount
 
@@ -164,6 +407,85 @@ def sign_message(cli_ctx, alias, message):
     click.echo("Signature: " + signature.encode_rsv().hex())
 
 
+@cli.command(short_help="Sign many messages with your Trezor device")
+@ape_cli_context()
+@click.argument("alias")
+@click.argument("input_file", type=click.File("r"), default="-")
+@click.option(
+    "--message-type",
+    type=click.Choice(["text", "hex", "eip712"]),
+    default="text",
+    show_default=True,
+    help="The type of the messages, one per line (EIP-712 typed data as JSON).",
+)
+@click.option(
+    "--output",
+    type=click.Path(dir_okay=False, path_type=Path),
+    required=True,
+    help="The JSONL results file. When it exists, signing resumes after its results.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=2,
+    help="The number of verification threads.",
+)
+def sign_messages(cli_ctx, alias, input_file, message_type, output, workers):
+    """
+    Sign the messages in INPUT_FILE (or stdin) in one device session, writing
+    each message with its signature to the output file as it is verified.
+    """
+    import json
+    from collections import deque
+    from concurrent.futures import ThreadPoolExecutor
+    from itertools import islice, tee
+
+    from ape_trezor.bulk import read_messages, recover_signer, resume_jsonl, to_signable_message
+
+    if alias not in cli_ctx.account_manager.aliases:
+        cli_ctx.abort(f"Account with alias '{alias}' does not exist.")
+
+    account = cli_ctx.account_manager.load(alias)
+    if done := resume_jsonl(output):
+        cli_ctx.logger.info(f"Resuming after {done} signed message(s).")
+
+    messages, to_sign = tee(islice(enumerate(read_messages(input_file, message_type)), done, None))
+    signatures = account.sign_messages(
+        # NOTE: Typed data is signed as-is so the device can show its fields.
+        msg if message_type == "eip712" else to_signable_message(msg, message_type)
+        for _, msg in to_sign
+    )
+
+    with open(output, "a") as out, ThreadPoolExecutor(max_workers=workers) as executor:
+
+        def write_result(index, message, signature, signer_future):
+            signer = signer_future.result()
+            if signer != account.address:
+                cli_ctx.abort(
+                    f"Signer of message {index} resolves incorrectly, "
+                    f"got {signer}, expected {account.address}."
+                )
+
+            result = {"index": index, "message": message, "signature": signature.hex()}
+            out.write(f"{json.dumps(result)}\n")
+            out.flush()
+
+        # NOTE: Signatures are verified in the background while the device signs the
+        #   next message. Results are written in order once verified.
+        pending: deque = deque()
+        for (index, message), signature in zip(messages, signatures):
+            signature_bytes = signature.encode_rsv()
+            future = executor.submit(recover_signer, message, message_type, signature_bytes)
+            pending.append((index, message, signature_bytes, future))
+            while pending and pending[0][-1].done():
+                write_result(*pending.popleft())
+
+        while pending:
+            write_result(*pending.popleft())
+
+    cli_ctx.logger.success(f"Signed messages written to '{output}'.")
+
+
 @cli.command(short_help="Verify a message with your Trezor device")
 @ape_cli_context()
 @click.argument("message")
@@ -180,16 +502,134 @@ def verify_message(cli_ctx, message, signature):
         message = "Message cannot be verified. Check the signature and try again."
         raise TrezorSigningError(message) from exc
 
-    alias = (
-        cli_ctx.account_manager[signer_address].alias
-        if signer_address in cli_ctx.account_manager
-        else "n/a"
-    )
+    # NOTE: Use the Trezor accounts' address index before searching all accounts.
+    container = cli_ctx.account_manager.containers.get("trezor")
+    alias = container.get_alias(signer_address) if container is not None else None
+    if alias is None and signer_address in cli_ctx.account_manager:
+        alias = cli_ctx.account_manager[signer_address].alias
+
+    alias = alias or "n/a"
 
     click.echo(f"Signer: {signer_address}  {alias}")
 
 
-trezorlib_cli.help = """Use `trezorctl` commands
+@cli.command(short_help="Verify many signed messages at once")
+@ape_cli_context()
+@click.argument("input_file", type=click.File("r"), default="-")
+@click.option(
+    "--format",
+    "file_format",
+    type=click.Choice(["jsonl", "csv"]),
+    help="The input format (defaults to the file extension, or JSONL for stdin).",
+)
+@click.option(
+    "--output",
+    type=click.File("w"),
+    default="-",
+    help="Where to write the JSONL results (defaults to stdout).",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=1000,
+    help="The number of rows per chunk.",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    help="The number of worker processes (defaults to CPUs).",
+)
+def verify_messages(cli_ctx, input_file, file_format, output, chunk_size, workers):
+    """
+    Verify the (text) messages and signatures in INPUT_FILE (or stdin), given as
+    JSONL objects or CSV rows with ``message`` and ``signature`` fields.
+    Writes each row, in order, with its ``signer`` and ``alias`` as JSONL.
+    """
+    import json
+
+    from ape_trezor.bulk import read_rows, verify_messages
+
+    if file_format is None:
+        file_format = "csv" if input_file.name.lower().endswith(".csv") else "jsonl"
+
+    # Index all account aliases once, rather than searching the accounts per row.
+    aliases: dict[str, str] = {}
+    for container in cli_ctx.account_manager.containers.values():
+        for account in container.accounts:
+            if account.alias:
+                aliases.setdefault(account.address.lower(), account.alias)
+
+    rows = read_rows(input_file, file_format)
+    for result in verify_messages(rows, aliases, chunk_size=chunk_size, max_workers=workers):
+        output.write(f"{json.dumps(result)}\n")
 
-This is the trezor-maintained cli from `trezorlib`"""
-cli.add_command(trezorlib_cli, "ctl")
+
+@cli.command(short_help="Run a daemon holding the Trezor device connection")
+@ape_cli_context()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="The Unix socket to listen on (defaults to one in the plugin's data folder).",
+)
+def daemon(cli_ctx, socket_path):
+    """
+    Connect to the device once and sign for other ape processes (over a Unix
+    socket) until stopped. Trezor accounts use the daemon while it is running.
+    """
+
+    from ape_trezor.daemon import TrezorDaemon, get_socket_path
+
+    trezor_daemon = TrezorDaemon(socket_path or get_socket_path())
+    trezor_daemon.start()
+    cli_ctx.logger.success(
+        f"Trezor daemon listening at '{trezor_daemon.socket_path}'. Press Ctrl+C to stop."
+    )
+    try:
+        trezor_daemon.serve_forever()
+    except KeyboardInterrupt:
+        cli_ctx.logger.info("Trezor daemon stopped.")
+
+
+class LazyTrezorctlGroup(click.Group):
+    """
+    A stand-in for the ``trezorctl`` command group that only imports
+    ``trezorlib.cli`` (and all its commands, transports and messages) once it is used.
+    This keeps the other ``ape trezor`` commands (and ``--help``) fast.
+    """
+
+    @cached_property
+    def _group(self) -> click.Group:
+        from trezorlib.cli.trezorctl import cli as trezorlib_cli
+
+        trezorlib_cli.help = self.help
+        return trezorlib_cli
+
+    def make_context(
+        self,
+        info_name: Optional[str],
+        args: list[str],
+        parent: Optional[click.Context] = None,
+        **extra,
+    ) -> click.Context:
+        return self._group.make_context(info_name, args, parent=parent, **extra)
+
+    def invoke(self, ctx: click.Context):
+        return self._group.invoke(ctx)
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return self._group.list_commands(ctx)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        return self._group.get_command(ctx, cmd_name)
+
+
+cli.add_command(
+    LazyTrezorctlGroup(
+        "ctl",
+        help="""Use `trezorctl` commands
+
+This is the trezor-maintained cli from `trezorlib`""",
+        short_help="Use `trezorctl` commands",
+    )
+)
@@ -1,8 +1,9 @@
+import asyncio
 import json
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from functools import cached_property
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Literal, Optional, Union, cast
 
 from ape.api import AccountAPI, AccountContainerAPI, PluginConfig, TransactionAPI
 from ape.types import AddressType, MessageSignature, TransactionSignature
@@ -12,71 +13,181 @@ from eth_account.messages import SignableMessage, encode_defunct
 from eth_pydantic_types import HexBytes
 
 from ape_trezor.client import TrezorAccountClient
+from ape_trezor.daemon import DaemonAccountClient
 from ape_trezor.exceptions import TrezorAccountError, TrezorSigningError
 from ape_trezor.hdpath import HDPath
+from ape_trezor.scheduler import RequestPriority
+from ape_trezor.session import DEFAULT_SESSION_TTL
+from ape_trezor.store import AccountStore, JSONAccountStore, SQLiteAccountStore
 from ape_trezor.utils import DEFAULT_ETHEREUM_HD_PATH
 
 
 class TrezorConfig(PluginConfig):
     hd_path: str = DEFAULT_ETHEREUM_HD_PATH
 
+    account_store: Literal["json", "sqlite"] = "json"
+    """
+    Where to save accounts: a JSON file per account (the default) or a single
+    SQLite database, which is faster with many accounts.
+    """
+
+    session_ttl: int = DEFAULT_SESSION_TTL
+    """
+    The number of seconds to remember device sessions for, so that later ``ape``
+    processes resume the session rather than asking for the passphrase again.
+    Set to ``0`` to always start a new session.
+    """
+
+    transport: Optional[str] = None
+    """
+    The transport path (or path prefix) of the device to always connect to,
+    such as ``"udp:127.0.0.1:21324"`` for the emulator. By default, the last
+    working transport is tried first, before searching all of them.
+    """
+
 
 class AccountContainer(AccountContainerAPI):
-    @property
-    def _account_files(self) -> Iterator[Path]:
-        return self.data_folder.glob("*.json")
+    @cached_property
+    def _store(self) -> AccountStore:
+        config = cast(TrezorConfig, self.config_manager.get_config("trezor"))
+        if config.account_store == "sqlite":
+            return SQLiteAccountStore(
+                self.data_folder / "accounts.sqlite", json_folder=self.data_folder
+            )
+
+        return JSONAccountStore(self.data_folder)
 
     @property
     def aliases(self) -> Iterator[str]:
-        for p in self._account_files:
-            yield p.stem
+        yield from self._store.aliases
 
     def __len__(self) -> int:
-        return len([*self._account_files])
+        return len(self._store)
 
     @property
     def accounts(self) -> Iterator[AccountAPI]:
-        for account_file in self._account_files:
-            yield TrezorAccount(account_file_path=account_file)
+        for alias, account_data in self._store.records:
+            yield self._get_account(alias, account_data)
+
+    def __contains__(self, address: AddressType) -> bool:
+        return self._store.find_record(address) is not None
+
+    def __getitem__(self, address: AddressType) -> AccountAPI:
+        record = self._store.find_record(address)
+        if record is None:
+            raise KeyError(f"No local account {address}.")
+
+        return self._get_account(*record)
 
-    def save_account(self, alias: str, address: str, hd_path: str):
+    def get_alias(self, address: AddressType) -> Optional[str]:
         """
-        Save a new Trezor account to your ape configuration.
+        Get the alias of the account with the given address, without loading
+        any account.
+
+        Args:
+            address (AddressType): The address of the account.
+
+        Returns:
+            Optional[str]: The alias, or ``None`` when there is no such account.
+        """
+        record = self._store.find_record(address)
+        return None if record is None else record[0]
+
+    def save_account(self, alias: str, address: str, hd_path: str, device_id: Optional[str] = None):
+        """
+        Save a new Trezor account to your ape configuration. When given the ID of
+        the account's device, the account always signs using that device.
+        """
+        self._store.save(alias, address, hd_path, device_id=device_id)
+
+    def save_accounts(
+        self, accounts: Iterable[tuple[str, str, str]], device_id: Optional[str] = None
+    ):
+        """
+        Save many new Trezor accounts at once (in a single transaction when
+        using the SQLite account store).
+
+        Args:
+            accounts (Iterable[tuple[str, str, str]]): The alias, address and HD path
+              of each account.
+            device_id (Optional[str]): The ID of the accounts' device.
         """
-        account_data = {"address": address, "hdpath": hd_path}
-        path = self.data_folder.joinpath(f"{alias}.json")
-        path.write_text(json.dumps(account_data))
+        self._store.save_many(accounts, device_id=device_id)
 
     def delete_account(self, alias: str):
-        path = self.data_folder.joinpath(f"{alias}.json")
+        self._store.delete(alias)
 
-        if path.exists():
-            path.unlink()
+    def _get_account(self, alias: str, account_data: Optional[dict]) -> "TrezorAccount":
+        return TrezorAccount(
+            account_file_path=self.data_folder / f"{alias}.json", account_data=account_data
+        )
 
 
 class TrezorAccount(AccountAPI):
     account_file_path: Path
 
+    account_data: Optional[dict] = None
+    """
+    The account data, when not read from the account file (e.g. when using
+    the SQLite account store).
+    """
+
     @property
     def alias(self) -> str:
         return self.account_file_path.stem
 
+    # Parsed account file, keyed by the file's modification time and size.
+    _account_file_cache: Optional[tuple[tuple[int, int], dict]] = None
+
+    # Decoded address and HD path, keyed by their raw values in the account file.
+    _address_cache: Optional[tuple[str, AddressType]] = None
+    _hd_path_cache: Optional[tuple[str, HDPath]] = None
+
     @property
     def address(self) -> AddressType:
-        return self.network_manager.ethereum.decode_address(self.account_file["address"])
+        raw_address = self.account_file["address"]
+        if self._address_cache is None or self._address_cache[0] != raw_address:
+            address = self.network_manager.ethereum.decode_address(raw_address)
+            self._address_cache = (raw_address, address)
+
+        return self._address_cache[1]
 
     @property
     def hd_path(self) -> HDPath:
         raw_path = self.account_file["hdpath"]
-        return HDPath(raw_path)
+        if self._hd_path_cache is None or self._hd_path_cache[0] != raw_path:
+            self._hd_path_cache = (raw_path, HDPath(raw_path))
+
+        return self._hd_path_cache[1]
+
+    @property
+    def device_id(self) -> Optional[str]:
+        """
+        The ID of the account's device, or ``None`` when the account signs
+        using whichever device is connected.
+        """
+        return self.account_file.get("device_id")
 
     @property
     def account_file(self) -> dict:
-        return json.loads(self.account_file_path.read_text())
+        """
+        The account data. The account file is only parsed again when its
+        modification time or size changes.
+        """
+        if self.account_data is not None:
+            return self.account_data
+
+        stat = self.account_file_path.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        if self._account_file_cache is None or self._account_file_cache[0] != file_key:
+            account_data = json.loads(self.account_file_path.read_text())
+            self._account_file_cache = (file_key, account_data)
+
+        return self._account_file_cache[1]
 
     @cached_property
-    def client(self) -> TrezorAccountClient:
-        return _create_client(self.address, self.hd_path)
+    def client(self) -> Union[TrezorAccountClient, DaemonAccountClient]:
+        return _create_client(self.address, self.hd_path, device_id=self.device_id)
 
     def sign_message(self, msg: Any, **signer_options) -> Optional[MessageSignature]:
         if isinstance(msg, EIP712Message):
@@ -135,7 +246,145 @@ class TrezorAccount(AccountAPI):
 
         return MessageSignature(*signed_msg)
 
+    async def async_sign_message(
+        self, msg: Any, timeout: Optional[float] = None, **signer_options
+    ) -> Optional[MessageSignature]:
+        """
+        Await :meth:`~ape_trezor.accounts.TrezorAccount.sign_message`, signing on the
+        device's executor thread rather than blocking the event loop. Cancelling the
+        task, or timing out, aborts the request on the device.
+
+        Args:
+            msg (Any): The message to sign.
+            timeout (Optional[float]): The number of seconds to wait for the signature.
+
+        Raises:
+            ``asyncio.TimeoutError``: When not signed in time.
+
+        Returns:
+            Optional[``MessageSignature``]
+        """
+        return await self._run_async(
+            self.sign_message,
+            msg,
+            timeout=timeout,
+            priority=RequestPriority.MESSAGE,
+            **signer_options,
+        )
+
+    async def async_sign_transaction(
+        self, txn: TransactionAPI, timeout: Optional[float] = None, **signer_options
+    ) -> Optional[TransactionAPI]:
+        """
+        Await :meth:`~ape_trezor.accounts.TrezorAccount.sign_transaction`, signing on
+        the device's executor thread rather than blocking the event loop. Cancelling
+        the task, or timing out, aborts the request on the device.
+
+        Args:
+            txn (``TransactionAPI``): The transaction to sign.
+            timeout (Optional[float]): The number of seconds to wait for the signature.
+
+        Raises:
+            ``asyncio.TimeoutError``: When not signed in time.
+
+        Returns:
+            Optional[``TransactionAPI``]
+        """
+        return await self._run_async(
+            self.sign_transaction,
+            txn,
+            timeout=timeout,
+            priority=RequestPriority.TRANSACTION,
+            **signer_options,
+        )
+
+    async def async_get_address(
+        self, show_display: bool = False, timeout: Optional[float] = None
+    ) -> AddressType:
+        """
+        Get the account's address from the device, e.g. to check it matches
+        the address in the account file.
+
+        Args:
+            show_display (bool): Set to ``True`` to also show the address on the
+              device's screen.
+            timeout (Optional[float]): The number of seconds to wait for the address.
+
+        Raises:
+            ``asyncio.TimeoutError``: When the device does not respond in time.
+
+        Returns:
+            ``AddressType``
+        """
+        client = await self._get_client_async()
+        address = await client.async_get_address(show_display=show_display, timeout=timeout)
+        return self.network_manager.ethereum.decode_address(address)
+
+    async def _run_async(
+        self,
+        func: Callable,
+        *args,
+        timeout: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.DEFAULT,
+        **kwargs,
+    ) -> Any:
+        client = await self._get_client_async()
+        return await client.run_async(func, *args, timeout=timeout, priority=priority, **kwargs)
+
+    async def _get_client_async(self) -> Union[TrezorAccountClient, DaemonAccountClient]:
+        # NOTE: Connecting blocks (e.g. entering the PIN), so happens off the event loop.
+        return await asyncio.to_thread(getattr, self, "client")
+
+    def sign_messages(self, msgs: Iterable[Any]) -> Iterator[MessageSignature]:
+        """
+        Sign many messages in one device session. The messages are consumed and
+        the signatures yielded one at a time, so results can be handled (e.g.
+        verified or saved) while the device signs the next message.
+
+        Args:
+            msgs (Iterable[Any]): The messages to sign, of any type supported by
+              :meth:`~ape_trezor.accounts.TrezorAccount.sign_message`.
+
+        Returns:
+            Iterator[``MessageSignature``]: The signatures, in order.
+        """
+        for msg in msgs:
+            signature = self.sign_message(msg)
+            if signature is None:
+                raise TrezorSigningError("Failed to sign message.")
+
+            yield signature
+
     def sign_transaction(self, txn: TransactionAPI, **kwargs) -> Optional[TransactionAPI]:
+        txn_data = self._get_transaction_kwargs(txn)
+        if "max_gas_fee" in txn_data:
+            v, r, s = self.client.sign_dynamic_fee_transaction(**txn_data)
+        else:
+            v, r, s = self.client.sign_static_fee_transaction(**txn_data)
+
+        txn.signature = TransactionSignature(v=v, r=r, s=s)
+        return txn
+
+    def sign_transactions(self, txns: Iterable[TransactionAPI]) -> list[TransactionAPI]:
+        """
+        Sign many transactions in one device session, e.g. a nonce-ordered batch
+        of deployments. This avoids changing the device's safety checks level
+        around every transaction when using the default Ethereum HD path.
+
+        Args:
+            txns (Iterable[``TransactionAPI``]): The transactions to sign.
+
+        Returns:
+            list[``TransactionAPI``]: The signed transactions, in order.
+        """
+        txns = list(txns)
+        signatures = self.client.sign_batch(self._get_transaction_kwargs(t) for t in txns)
+        for txn, (v, r, s) in zip(txns, signatures):
+            txn.signature = TransactionSignature(v=v, r=r, s=s)
+
+        return txns
+
+    def _get_transaction_kwargs(self, txn: TransactionAPI) -> dict:
         txn_data = txn.model_dump(mode="json", by_alias=True)
 
         if "type" not in txn_data and "gasPrice" in txn_data:
@@ -171,19 +420,20 @@ class TrezorAccount(AccountAPI):
 
         if tx_type == HexBytes("0x00"):
             txn_data["gas_price"] = txn_data.pop("gasPrice", 0)
-            v, r, s = self.client.sign_static_fee_transaction(**txn_data)
         elif tx_type == HexBytes("0x02"):
             txn_data["max_gas_fee"] = txn_data.pop("maxFeePerGas", 0)
             txn_data["max_priority_fee"] = txn_data.pop("maxPriorityFeePerGas", 0)
             txn_data["access_list"] = txn_data.pop("accessList", [])
-            v, r, s = self.client.sign_dynamic_fee_transaction(**txn_data)
         else:
             raise TrezorAccountError(f"Message type {tx_type} is not supported.")
 
-        txn.signature = TransactionSignature(v=v, r=r, s=s)
-        return txn
+        return txn_data
 
 
-def _create_client(address: AddressType, hd_path: HDPath):
+def _create_client(address: AddressType, hd_path: HDPath, device_id: Optional[str] = None):
     # Separated so can be mocked easily in tests.
-    return TrezorAccountClient(address, hd_path)
+    # NOTE: Use the daemon's device connection when `ape trezor daemon` is running.
+    if daemon_client := DaemonAccountClient.connect(address, hd_path, device_id=device_id):
+        return daemon_client
+
+    return TrezorAccountClient(address, hd_path, device_id=device_id)
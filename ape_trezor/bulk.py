@@ -0,0 +1,228 @@
+import csv
+import json
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from eth_account.messages import SignableMessage
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_CHUNK_SIZE = 1000
+MESSAGE_TYPES = ("text", "hex", "eip712")
+
+
+def iter_chunks(items: Iterable[T], chunk_size: int) -> Iterator[list[T]]:
+    """
+    Split an iterable into lists of (at most) ``chunk_size`` items, lazily.
+    """
+    iterator = iter(items)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def map_chunks(
+    func: Callable[[list[T]], list[R]],
+    items: Iterable[T],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[R]:
+    """
+    Apply ``func`` to chunks of ``items`` across a process pool, yielding the
+    results in the order of the items. Only a few chunks per worker are in
+    flight at once, so memory stays bounded regardless of the number of items.
+
+    Args:
+        func (Callable[[list[T]], list[R]]): A (picklable) function mapping a chunk
+          of items to a list of results.
+        items (Iterable[T]): The items.
+        chunk_size (int): The number of items per chunk.
+        max_workers (Optional[int]): The number of worker processes. Defaults to
+          the number of CPUs. When ``1``, the chunks are processed in this process.
+
+    Returns:
+        Iterator[R]
+    """
+    chunks = iter_chunks(items, chunk_size)
+    if max_workers == 1:
+        for chunk in chunks:
+            yield from func(chunk)
+
+        return
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        yield from _map_bounded(executor, func, chunks, 2 * max_workers)
+
+
+def _map_bounded(
+    executor: Executor, func: Callable[[T], list[R]], chunks: Iterator[T], max_pending: int
+) -> Iterator[R]:
+    pending: deque[Future] = deque()
+    for chunk in chunks:
+        pending.append(executor.submit(func, chunk))
+        if len(pending) >= max_pending:
+            yield from pending.popleft().result()
+
+    while pending:
+        yield from pending.popleft().result()
+
+
+def read_rows(file: IO[str], file_format: str) -> Iterator[dict]:
+    """
+    Stream the rows of a JSONL file (one JSON object per line) or of a CSV file
+    with a header row.
+
+    Args:
+        file (IO[str]): The file to read.
+        file_format (str): ``"jsonl"`` or ``"csv"``.
+
+    Returns:
+        Iterator[dict]
+    """
+    if file_format == "csv":
+        yield from csv.DictReader(file)
+        return
+
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def recover_signers(rows: list[dict]) -> list[dict]:
+    """
+    Recover the signer of each EIP-191 (text) ``message`` from its ``signature``.
+    Rows that cannot be verified get an ``error`` instead of a ``signer``.
+    """
+    from eth_account.account import Account
+    from eth_account.messages import encode_defunct
+
+    results = []
+    for row in rows:
+        try:
+            message = encode_defunct(text=row["message"])
+            signer = Account.recover_message(message, signature=row["signature"])
+        except KeyError as err:
+            results.append({**row, "signer": None, "error": f"Missing field {err}."})
+        except Exception as err:
+            results.append({**row, "signer": None, "error": str(err) or repr(err)})
+        else:
+            results.append({**row, "signer": signer})
+
+    return results
+
+
+def verify_messages(
+    rows: Iterable[dict],
+    aliases: dict[str, str],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Recover the signers of many signed messages across a process pool.
+
+    Args:
+        rows (Iterable[dict]): Rows with a ``message`` and a ``signature``.
+        aliases (dict[str, str]): Account aliases by lower-case address.
+        chunk_size (int): The number of rows per chunk.
+        max_workers (Optional[int]): The number of worker processes.
+
+    Returns:
+        Iterator[dict[str, Any]]: Each row, in order, with the ``signer`` and its
+        ``alias`` (or an ``error``).
+    """
+    for result in map_chunks(recover_signers, rows, chunk_size, max_workers):
+        signer = result["signer"]
+        result["alias"] = aliases.get(signer.lower()) if signer else None
+        yield result
+
+
+def read_messages(file: IO[str], message_type: str) -> Iterator[Any]:
+    """
+    Stream the messages in a file, one per line: text, hex-encoded bytes or,
+    for ``"eip712"``, typed data as JSON.
+
+    Args:
+        file (IO[str]): The file to read.
+        message_type (str): One of ``"text"``, ``"hex"`` or ``"eip712"``.
+
+    Returns:
+        Iterator[Any]: The raw messages (``str``, or ``dict`` for typed data).
+    """
+    for line in file:
+        line = line.rstrip("\r\n")
+        if message_type == "text":
+            yield line
+        elif not line.strip():
+            continue
+        elif message_type == "eip712":
+            yield json.loads(line)
+        else:
+            yield line.strip()
+
+
+def to_signable_message(message: Any, message_type: str) -> "SignableMessage":
+    """
+    Encode a raw message from :meth:`~ape_trezor.bulk.read_messages`
+    (EIP-191 for text and hex, EIP-712 for typed data).
+    """
+    from eth_account.messages import encode_defunct, encode_typed_data
+
+    if message_type == "eip712":
+        return encode_typed_data(full_message=message)
+    elif message_type == "hex":
+        return encode_defunct(hexstr=message)
+
+    return encode_defunct(text=message)
+
+
+def recover_signer(message: Any, message_type: str, signature: bytes) -> str:
+    """
+    Recover the signer of a raw message from :meth:`~ape_trezor.bulk.read_messages`.
+    """
+    from eth_account.account import Account
+
+    signable_message = to_signable_message(message, message_type)
+    return Account.recover_message(signable_message, signature=signature)
+
+
+def resume_jsonl(path: Path) -> int:
+    """
+    Prepare to append to a JSONL results file written by an interrupted run.
+    A partially written last line is removed.
+
+    Args:
+        path (Path): The results file.
+
+    Returns:
+        int: The number of complete results in the file.
+    """
+    if not path.is_file():
+        return 0
+
+    count = 0
+    offset = 0
+    with open(path, "rb") as file:
+        for line in file:
+            if not line.endswith(b"\n"):
+                break
+
+            try:
+                json.loads(line)
+            except ValueError:
+                break
+
+            count += 1
+            offset += len(line)
+
+    if offset != path.stat().st_size:
+        with open(path, "r+b") as file:
+            file.truncate(offset)
+
+    return count
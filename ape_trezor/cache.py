@@ -0,0 +1,147 @@
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import Optional
+
+
+class AddressCache:
+    """
+    An on-disk cache of derived account addresses. Addresses are keyed by the
+    device ID, a fingerprint of the (passphrase) wallet and the account HD path.
+    The cache only remembers a single device at a time: connecting a different
+    device invalidates all the cached addresses.
+
+    Args:
+        path (Path): The path to the cache file.
+        max_size (int): The maximum number of addresses to keep. When full, the
+          least recently used addresses are evicted first.
+    """
+
+    DEFAULT_MAX_SIZE = 1000
+
+    def __init__(self, path: Path, max_size: int = DEFAULT_MAX_SIZE):
+        self.path = path
+        self.max_size = max_size
+        self._device_id: Optional[str] = None
+        self._addresses: OrderedDict[str, str] = OrderedDict()
+        self._loaded = False
+        self._batch_depth = 0
+        self._dirty = False
+
+    def __len__(self) -> int:
+        self._load()
+        return len(self._addresses)
+
+    @classmethod
+    def from_data_folder(cls, max_size: int = DEFAULT_MAX_SIZE) -> "AddressCache":
+        """
+        Get the address cache stored in the Trezor plugin's data folder.
+        """
+        from ape.utils.basemodel import ManagerAccessMixin
+
+        data_folder = ManagerAccessMixin.config_manager.DATA_FOLDER / "trezor"
+        return cls(data_folder / "cache" / "addresses.json", max_size=max_size)
+
+    def get(self, device_id: str, fingerprint: str, hd_path: str) -> Optional[str]:
+        """
+        Get a cached address, or ``None`` if it is not cached for the given device.
+        """
+        self._load()
+        if device_id != self._device_id:
+            return None
+
+        key = _get_key(fingerprint, hd_path)
+        address = self._addresses.get(key)
+        if address is not None:
+            self._addresses.move_to_end(key)
+
+        return address
+
+    def set(self, device_id: str, fingerprint: str, hd_path: str, address: str):
+        """
+        Cache an address and write the cache to disk (or, in a
+        :meth:`~ape_trezor.cache.AddressCache.batch`, when the batch ends).
+        """
+        self._load()
+        if device_id != self._device_id:
+            self._device_id = device_id
+            self._addresses.clear()
+
+        key = _get_key(fingerprint, hd_path)
+        self._addresses[key] = address
+        self._addresses.move_to_end(key)
+        while len(self._addresses) > self.max_size:
+            self._addresses.popitem(last=False)
+
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._save()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Write the addresses cached in the ``with`` block to disk once, at the end,
+        e.g. when deriving a range of addresses.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._save()
+
+    def clear(self):
+        """
+        Remove all cached addresses.
+        """
+        self._device_id = None
+        self._addresses.clear()
+        self._loaded = True
+        if self.path.is_file():
+            self.path.unlink()
+
+    def _load(self):
+        if self._loaded:
+            return
+
+        self._loaded = True
+        if not self.path.is_file():
+            return
+
+        try:
+            data = json.loads(self.path.read_text())
+            device_id = data["device_id"]
+            addresses = data["addresses"]
+        except (ValueError, KeyError, TypeError):
+            # Corrupted cache. It gets re-written on the next change.
+            return
+
+        self._device_id = device_id
+        self._addresses = OrderedDict(addresses)
+
+    def _save(self):
+        self._dirty = False
+        data = {"device_id": self._device_id, "addresses": self._addresses}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # NOTE: A unique temporary file, so concurrent processes never write to the same one.
+        with NamedTemporaryFile(
+            "w", dir=self.path.parent, prefix=f"{self.path.stem}.", suffix=".tmp", delete=False
+        ) as file:
+            json.dump(data, file)
+
+        try:
+            os.replace(file.name, self.path)
+        except OSError:
+            os.unlink(file.name)
+            raise
+
+
+def _get_key(fingerprint: str, hd_path: str) -> str:
+    return f"{fingerprint}:{hd_path}"
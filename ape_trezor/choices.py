@@ -1,18 +1,28 @@
-from typing import TYPE_CHECKING, Any, Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Literal, Optional, get_args
 
 import click
 from ape.cli import PromptChoice
 
+from ape_trezor.scheduler import RequestPriority
+
 if TYPE_CHECKING:
     from click import Context, Parameter
 
     from ape_trezor.client import TrezorClient
     from ape_trezor.hdpath import HDBasePath, HDPath
 
+PrefetchMode = Literal["next", "both"]
+
 
 class AddressPromptChoice(PromptChoice):
     """
     A class for handling prompting the user for an address selection.
+    While the user is looking at a page, the next page (and the previous one,
+    if ``prefetch`` is set to ``"both"``) is loaded in the background. Set
+    ``prefetch`` to ``None`` to only load the page being shown.
+    All device calls go through a single worker thread, so background loading
+    never interleaves with loading the page being shown.
     """
 
     DEFAULT_PAGE_SIZE = 10
@@ -23,12 +33,19 @@ class AddressPromptChoice(PromptChoice):
         hd_base_pth: "HDBasePath",
         index_offset: int = 0,
         page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: Optional[PrefetchMode] = "next",
     ):
+        if prefetch is not None and prefetch not in get_args(PrefetchMode):
+            raise ValueError(f"Invalid prefetch mode '{prefetch}'.")
+
         self.client = client
         self._hd_base_path = hd_base_pth
         self._index_offset = index_offset
         self._page_size = page_size
-        self._choice_index = None
+        self._prefetch = prefetch
+        self._choice_index: Optional[int] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._addresses: dict[int, Future] = {}
 
         # Must call ``_load_choices()`` to set address choices
         super().__init__([])
@@ -63,13 +80,19 @@ class AddressPromptChoice(PromptChoice):
         The user is able to page using special characters ``n`` and ``p``.
         """
         address = None
-        while address is None:
-            self._load_choices()
-            self.print_choices()
+        try:
+            while address is None:
+                self._load_choices()
+                self.print_choices()
+                self._prefetch_choices()
 
-            address = self._get_user_selection()
+                address = self._get_user_selection()
 
-        account_id = self._choice_index
+        finally:
+            self._shutdown()
+
+        # NOTE: The choice index is relative to the current page.
+        account_id = self._index_offset + (self._choice_index or 0)
         return address, self._hd_base_path.get_account_path(account_id)
 
     def _get_user_selection(self) -> str:
@@ -95,7 +118,42 @@ class AddressPromptChoice(PromptChoice):
     def _load_choices(self):
         end_range = self._index_offset + self._page_size
         index_range = range(self._index_offset, end_range)
-        self.choices = [self._get_address(i) for i in index_range]
+        self.choices = [self._request_address(i).result() for i in index_range]
+
+    def _prefetch_choices(self):
+        if not self._prefetch:
+            return
+
+        offsets = [self._index_offset + self._page_size]
+        if self._prefetch == "both" and self._is_incremented:
+            offsets.append(self._index_offset - self._page_size)
+
+        for offset in offsets:
+            for account_id in range(offset, offset + self._page_size):
+                self._request_address(account_id, RequestPriority.BACKGROUND)
+
+    def _request_address(
+        self, account_id: int, priority: RequestPriority = RequestPriority.DEFAULT
+    ) -> Future:
+        # NOTE: Each address is its own task so that shutting down only
+        #   waits for the address currently being loaded.
+        if account_id not in self._addresses:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1)
+
+            self._addresses[account_id] = self._executor.submit(
+                self._get_address, account_id, priority
+            )
+
+        return self._addresses[account_id]
+
+    def _shutdown(self):
+        if self._executor is not None:
+            # Wait for the running device call so later calls don't interleave with it.
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+        self._addresses = {}
 
-    def _get_address(self, account_id: int) -> str:
-        return self.client.get_account_path(account_id)
+    def _get_address(self, account_id: int, priority: RequestPriority) -> str:
+        return self.client.get_account_path(account_id, priority=priority)
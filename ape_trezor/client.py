@@ -1,12 +1,24 @@
-from collections.abc import Callable
-from typing import TYPE_CHECKING, Optional
+import asyncio
+import json
+import os
+import threading
+import weakref
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import cached_property
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
 
 from ape.logging import logger
+from eth_pydantic_types import HexBytes
+from eth_utils import keccak
 from trezorlib.client import TrezorClient as LibTrezorClient
 from trezorlib.client import get_default_client
 from trezorlib.device import apply_settings
 from trezorlib.ethereum import (
     get_address,
+    get_public_node,
     sign_message,
     sign_tx,
     sign_tx_eip1559,
@@ -14,9 +26,11 @@ from trezorlib.ethereum import (
     sign_typed_data_hash,
 )
 from trezorlib.exceptions import PinException, TrezorFailure
-from trezorlib.messages import SafetyCheckLevel
-from trezorlib.transport import TransportException
+from trezorlib.messages import EthereumAccessList, SafetyCheckLevel
+from trezorlib.transport import TransportException, enumerate_devices
 
+from ape_trezor.cache import AddressCache
+from ape_trezor.derivation import PublicNode
 from ape_trezor.exceptions import (
     InvalidHDPathError,
     InvalidPinError,
@@ -24,6 +38,9 @@ from ape_trezor.exceptions import (
     TrezorClientConnectionError,
     TrezorClientError,
 )
+from ape_trezor.instrumentation import call_device
+from ape_trezor.scheduler import RequestPriority, get_device_scheduler, scheduled
+from ape_trezor.session import SessionStore
 from ape_trezor.utils import DEFAULT_ETHEREUM_HD_PATH
 
 if TYPE_CHECKING:
@@ -32,41 +49,605 @@ if TYPE_CHECKING:
     from ape_trezor.hdpath import HDBasePath, HDPath
 
 
-def create_client(hd_path: "HDBasePath") -> "TrezorClient":
-    return TrezorClient(hd_path)
+class DeviceSessionRegistry:
+    """
+    A process-wide registry of device connections, keyed by device ID.
+    All clients for the same physical device share one connection, so the
+    transports are enumerated and the ``Initialize`` handshake runs only once.
+    Several devices can be connected at once, each found by its device ID.
+    Connections are reference counted: the device's transport session stays
+    open while a connection is acquired and is closed on the last release.
+    Once registered, the device's transport session is only opened and closed on
+    its scheduler thread (see :class:`~ape_trezor.scheduler.DeviceScheduler`),
+    without holding up the other devices.
+    Device session IDs are persisted, so the next process resumes the session
+    (without entering the passphrase again) rather than starting a new one.
+
+    Args:
+        session_store (Optional[:class:`~ape_trezor.session.SessionStore`]): Where to
+          persist session IDs. Defaults to the store in the plugin's data folder.
+        transport_resolver (Optional[:class:`~ape_trezor.client.TransportResolver`]):
+          Finds the device's transport. Defaults to the resolver using the plugin's
+          data folder and config.
+    """
 
+    def __init__(
+        self,
+        session_store: Optional[SessionStore] = None,
+        transport_resolver: Optional["TransportResolver"] = None,
+    ):
+        self._clients: dict[str, LibTrezorClient] = {}
+        self._ref_counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._session_store = session_store
+        self._transport_resolver = transport_resolver
 
-class TrezorClient:
+    @property
+    def session_store(self) -> SessionStore:
+        return self._session_store or SessionStore.from_data_folder()
+
+    @property
+    def transport_resolver(self) -> "TransportResolver":
+        return self._transport_resolver or TransportResolver.from_data_folder()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def acquire(self, device_id: Optional[str] = None) -> LibTrezorClient:
+        """
+        Get the connection to a device, connecting to it when needed.
+
+        Args:
+            device_id (Optional[str]): The ID of the device. Defaults to the device
+              already connected, or else the first device found.
+
+        Raises:
+            :class:`~ape_trezor.exceptions.TrezorClientError`: When the device
+              is not connected.
+
+        Returns:
+            LibTrezorClient
+        """
+        with self._lock:
+            if device_id is None and self._clients:
+                device_id = next(iter(self._clients))
+
+            if device_id in self._clients:
+                self._ref_counts[device_id] += 1
+                return self._clients[device_id]
+
+            client = self._find_device(device_id)
+            device_id = client.features.device_id or ""
+            self._clients[device_id] = client
+            self._ref_counts[device_id] = 1
+            # NOTE: Queued first (before any request using the client), but awaited
+            #   without the lock, so other devices are not held up by this one.
+            opened = self._submit(device_id, client.open)
+
+        try:
+            self._wait(device_id, opened)
+        except Exception:
+            self.release(client)
+            raise
+
+        return client
+
+    def enumerate_devices(self) -> list[str]:
+        """
+        Get the IDs of all the connected devices. This connects to each device
+        found on the transports (without keeping the connection).
+
+        Returns:
+            list[str]
+        """
+        with self._lock:
+            device_ids = list(self._clients)
+            device_ids.extend(
+                client.features.device_id or "" for client in self._iter_new_devices()
+            )
+
+        return device_ids
+
+    def release(self, client: LibTrezorClient):
+        """
+        Release a connection acquired with
+        :meth:`~ape_trezor.client.DeviceSessionRegistry.acquire`.
+        The connection is closed once it is no longer referenced.
+        """
+        with self._lock:
+            device_id = self._get_device_id(client)
+            if device_id is None:
+                return
+
+            self._ref_counts[device_id] -= 1
+            if self._ref_counts[device_id] > 0:
+                return
+
+            closed = self._close(device_id)
+
+        self._wait(device_id, closed)
+
+    def close(self, device_id: Optional[str] = None):
+        """
+        Close the connection to a device regardless of its references,
+        or to all devices when not given a device ID.
+        """
+        with self._lock:
+            device_ids = [device_id] if device_id is not None else [*self._clients]
+            closed = [(d, self._close(d)) for d in device_ids if d in self._clients]
+
+        for dev_id, future in closed:
+            self._wait(dev_id, future)
+
+    def _find_device(self, device_id: Optional[str]) -> LibTrezorClient:
+        tried_paths = set()
+        if not self._clients:
+            # NOTE: Tries the last working transport first, which usually has the device.
+            client = self._connect(device_id)
+            if device_id is None or client.features.device_id == device_id:
+                return client
+
+            tried_paths.add(client.transport.get_path())
+
+        for client in self._iter_new_devices(exclude_paths=tried_paths):
+            if client.features.device_id == device_id:
+                return client
+
+        raise TrezorClientError(f"Trezor device '{device_id}' is not connected.")
+
+    def _iter_new_devices(self, exclude_paths: Iterable[str] = ()) -> Iterator[LibTrezorClient]:
+        # Connects to each device on the transports that is not connected yet.
+        exclude_paths = {*exclude_paths, *(c.transport.get_path() for c in self._clients.values())}
+        for path in self.transport_resolver.enumerate_paths():
+            if path not in exclude_paths:
+                yield self._connect(path=path)
+
+    def _connect(
+        self, device_id: Optional[str] = None, path: Optional[str] = None
+    ) -> LibTrezorClient:
+        store = self.session_store
+        if device_id is not None:
+            session_id = store.get(device_id)
+        else:
+            # NOTE: Tries the most recent session first, so resuming takes a single handshake.
+            latest = store.get_latest()
+            device_id, session_id = latest if latest else (None, None)
+
+        client = _connect(self.transport_resolver, path=path, session_id=session_id)
+        connected_device_id = client.features.device_id or ""
+        if connected_device_id != device_id:
+            # Connected to another device than the one whose session was sent.
+            connected_session_id = store.get(connected_device_id)
+            if connected_session_id is not None:
+                # NOTE: Not on the device's scheduler, as the new client is not shared yet.
+                _resume_session(client, connected_session_id)
+
+        # NOTE: When the device rejected the session, it already started a new one.
+        self._save_session(connected_device_id, client)
+        return client
+
+    def _save_session(self, device_id: str, client: LibTrezorClient):
+        store = self.session_store
+        if isinstance(client.session_id, bytes):
+            store.set(device_id, client.session_id)
+        else:
+            store.delete(device_id)
+
+    def _get_device_id(self, client: LibTrezorClient) -> Optional[str]:
+        for device_id, registered_client in self._clients.items():
+            if registered_client is client:
+                return device_id
+
+        return None
+
+    def _close(self, device_id: str) -> Future:
+        client = self._clients.pop(device_id)
+        del self._ref_counts[device_id]
+        return self._submit(device_id, self._close_client, device_id, client)
+
+    def _submit(self, device_id: str, func: Callable, *args) -> Future:
+        # Opening and closing is queued ahead of the device's requests, in order.
+        scheduler = get_device_scheduler(device_id)
+        return scheduler.submit(func, *args, priority=RequestPriority.TRANSACTION)
+
+    def _wait(self, device_id: str, future: Future):
+        # NOTE: A request on the device's own thread cannot wait for the next one.
+        if not get_device_scheduler(device_id).is_current_thread:
+            future.result()
+
+    def _close_client(self, device_id: str, client: LibTrezorClient):
+        try:
+            # NOTE: Saved again, as some devices only allocate the session ID on first use.
+            self._save_session(device_id, client)
+            client.close()
+        except Exception as err:
+            logger.debug(f"Failed closing Trezor device session: {err}")
+
+
+class TransportResolver:
     """
-    This class is a client for the Trezor device.
+    Finds the transport (e.g. Trezor Bridge, WebUSB or the UDP emulator) of the
+    device to connect to. Enumerating all the transports is slow, especially when
+    the bridge is not running and has to time out, so the path of the last working
+    transport is remembered and tried first. All the transports are only enumerated
+    when the device is no longer found there.
+
+    Args:
+        cache_path (Path): The path to the file remembering the last transport path.
+        pinned_path (Optional[str]): A transport path, or path prefix such as
+          ``"webusb"``, to always connect with instead.
     """
 
-    def __init__(self, hd_root_path: "HDBasePath", client: Optional[LibTrezorClient] = None):
-        if not client:
+    def __init__(self, cache_path: Path, pinned_path: Optional[str] = None):
+        self.cache_path = cache_path
+        self.pinned_path = pinned_path
+
+    @classmethod
+    def from_data_folder(cls) -> "TransportResolver":
+        """
+        Get the resolver using the Trezor plugin's data folder, pinned to the
+        ``transport`` from the ``trezor`` config or else the ``TREZOR_PATH``
+        environment variable (when set).
+        """
+        from ape.utils.basemodel import ManagerAccessMixin
+
+        config_manager = ManagerAccessMixin.config_manager
+        pinned_path = getattr(config_manager.get_config("trezor"), "transport", None)
+        data_folder = config_manager.DATA_FOLDER / "trezor"
+        return cls(
+            data_folder / "cache" / "transport.json",
+            pinned_path=pinned_path or os.getenv("TREZOR_PATH"),
+        )
+
+    @property
+    def last_path(self) -> Optional[str]:
+        """
+        The path of the last transport the device was found on.
+        """
+        if not self.cache_path.is_file():
+            return None
+
+        try:
+            return json.loads(self.cache_path.read_text())["path"]
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def enumerate_paths(self) -> list[str]:
+        """
+        Get the transport paths of all the connected devices (on the pinned
+        transport, when pinned).
+        """
+        paths = [device.get_path() for device in enumerate_devices()]
+        if self.pinned_path:
+            return [p for p in paths if p.startswith(self.pinned_path)] or [self.pinned_path]
+
+        return paths
+
+    def connect(self, path: Optional[str] = None, **kwargs) -> LibTrezorClient:
+        """
+        Connect to a device.
+
+        Args:
+            path (Optional[str]): The transport path of the device. Defaults to
+              the first device found.
+            **kwargs: Additional arguments for ``trezorlib``'s ``TrezorClient``.
+
+        Raises:
+            ``TransportException``: When the device is not found.
+
+        Returns:
+            LibTrezorClient
+        """
+        if path:
+            return call_device(get_default_client, path, **kwargs)
+
+        elif self.pinned_path:
+            return call_device(get_default_client, self.pinned_path, **kwargs)
+
+        last_path = self.last_path
+        if last_path:
             try:
-                self.client = get_default_client()
-            except TransportException:
-                raise TrezorClientConnectionError()
-            # Handles an unhandled usb exception in Trezor transport
-            except Exception as exc:
-                raise TrezorClientError(f"Error: {exc}")
-        else:
-            self.client = client
+                return call_device(get_default_client, last_path, **kwargs)
+            except TransportException as err:
+                logger.debug(f"Trezor device not found at '{last_path}': {err}")
+
+        client = call_device(get_default_client, **kwargs)
+        self._save(client.transport.get_path())
+        return client
+
+    def _save(self, path: str):
+        if path == self.last_path:
+            return
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"path": path}))
+        tmp_path.replace(self.cache_path)
+
+
+def _connect(
+    resolver: TransportResolver, path: Optional[str] = None, session_id: Optional[bytes] = None
+) -> LibTrezorClient:
+    try:
+        return resolver.connect(path=path, session_id=session_id)
+    except TrezorFailure as err:
+        if session_id is None:
+            raise TrezorClientError(f"Error: {err}") from err
 
+        # The device failed to resume the session.
+        logger.debug(f"Failed resuming Trezor session: {err}")
+        return _connect(resolver, path=path)
+
+    except TransportException:
+        raise TrezorClientConnectionError()
+    # Handles an unhandled usb exception in Trezor transport
+    except Exception as exc:
+        raise TrezorClientError(f"Error: {exc}")
+
+
+def _resume_session(client: LibTrezorClient, session_id: bytes):
+    try:
+        call_device(client.init_device, session_id=session_id)
+    except TrezorFailure as err:
+        logger.debug(f"Failed resuming Trezor session: {err}")
+        call_device(client.init_device, new_session=True)
+
+
+def _serialize_transport_writes(client: LibTrezorClient):
+    # Cancelling writes a `Cancel` message from another thread while the device
+    # thread waits on the device, so the transport's writes must not interleave.
+    transport = client.transport
+    with _transport_write_locks_lock:
+        if transport in _transport_write_locks:
+            return
+
+        lock = _transport_write_locks[transport] = threading.Lock()
+        write = transport.write
+
+        def locked_write(*args, **kwargs):
+            with lock:
+                return write(*args, **kwargs)
+
+        transport.write = locked_write  # type: ignore[method-assign]
+
+
+_transport_write_locks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_transport_write_locks_lock = threading.Lock()
+
+device_sessions = DeviceSessionRegistry()
+
+
+async def run_on_device_thread(
+    device_key: str,
+    func: Callable,
+    *args,
+    timeout: Optional[float] = None,
+    cancel: Optional[Callable[[], None]] = None,
+    priority: RequestPriority = RequestPriority.DEFAULT,
+    **kwargs,
+) -> Any:
+    """
+    Await a blocking device call, made on the device's scheduler thread
+    (see :class:`~ape_trezor.scheduler.DeviceScheduler`).
+
+    Args:
+        device_key (str): Identifies the device, e.g. its device ID.
+        func (Callable): The blocking call.
+        *args: The call's arguments.
+        timeout (Optional[float]): The number of seconds to wait for the call.
+          Defaults to waiting until the call finishes.
+        cancel (Optional[Callable[[], None]]): Aborts the call on the device, when
+          the caller is cancelled or times out while the call is running.
+        priority (:class:`~ape_trezor.scheduler.RequestPriority`): The call's priority.
+        **kwargs: The call's keyword arguments.
+
+    Raises:
+        ``asyncio.TimeoutError``: When the call does not finish in time.
+
+    Returns:
+        Any: The call's result.
+    """
+    running = False
+    running_lock = threading.Lock()
+
+    def run():
+        nonlocal running
+        with running_lock:
+            running = True
+
+        try:
+            return func(*args, **kwargs)
+
+        finally:
+            # NOTE: Waits for a cancel being sent, so it never reaches the next request.
+            with running_lock:
+                running = False
+
+    future = get_device_scheduler(device_key).submit(run, priority=priority)
+    try:
+        return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        # NOTE: Calls still queued are dropped. Calls already waiting on the device
+        #   are aborted there, so the device thread is not held up by them.
+        with running_lock:
+            if running and cancel is not None:
+                try:
+                    cancel()
+                except Exception as err:
+                    logger.debug(f"Failed cancelling Trezor device call: {err}")
+
+        raise
+
+
+def create_client(
+    hd_path: "HDBasePath", derive_locally: bool = False, device_id: Optional[str] = None
+) -> "TrezorClient":
+    return TrezorClient(
+        hd_path,
+        derive_locally=derive_locally,
+        address_cache=AddressCache.from_data_folder(),
+        device_id=device_id,
+    )
+
+
+class TrezorClient:
+    """
+    This class is a client for the Trezor device.
+
+    Args:
+        hd_root_path (:class:`~ape_trezor.hdpath.HDBasePath`): The derivation path prefix.
+        client (Optional[LibTrezorClient]): An already connected device client.
+        derive_locally (bool): Set to ``True`` to fetch the public node of the root path
+          once and derive the account addresses on the host instead of asking the device
+          for every address.
+        address_cache (Optional[:class:`~ape_trezor.cache.AddressCache`]): A cache to
+          read account addresses from first and to store newly derived addresses in.
+        device_id (Optional[str]): The ID of the device to connect to, when not given
+          a client. Defaults to the first device found.
+    """
+
+    def __init__(
+        self,
+        hd_root_path: "HDBasePath",
+        client: Optional[LibTrezorClient] = None,
+        derive_locally: bool = False,
+        address_cache: Optional[AddressCache] = None,
+        device_id: Optional[str] = None,
+    ):
+        self._owns_client = not client
+        self.client = client or device_sessions.acquire(device_id)
         self._hd_root_path = hd_root_path
+        self._derive_locally = derive_locally
+        self._address_cache = address_cache
+
+    def close(self):
+        """
+        Release the device connection (when it was acquired by this client).
+        """
+        if self._owns_client:
+            device_sessions.release(self.client)
+            self._owns_client = False
+
+    @property
+    def device_id(self) -> str:
+        """
+        The ID of the connected device.
+        """
+        return self.client.features.device_id or ""
+
+    @property
+    def device_key(self) -> str:
+        """
+        Identifies the device, e.g. for :func:`~ape_trezor.scheduler.get_device_scheduler`.
+        """
+        return self.device_id
+
+    @cached_property
+    def public_node(self) -> PublicNode:
+        """
+        The extended public key of the root path, requested from the device once.
+        """
+        response = self._call_device(get_public_node, self._hd_root_path)
+        return PublicNode(response.node.public_key, response.node.chain_code)
+
+    @cached_property
+    def wallet_fingerprint(self) -> str:
+        """
+        Identifies the wallet of the current session. Wallets protected by a passphrase
+        are told apart using a hash of the root path's public node (the public node
+        itself is not exposed). Empty when passphrase protection is disabled.
+        """
+        if not self.client.features.passphrase_protection:
+            return ""
+
+        node = self.public_node
+        return keccak(node.public_key + node.chain_code)[:8].hex()
+
+    def get_account_path(
+        self, account_id: int, priority: RequestPriority = RequestPriority.DEFAULT
+    ) -> str:
+        """
+        Get the address of an account.
+
+        Args:
+            account_id (int): The account index.
+            priority (:class:`~ape_trezor.scheduler.RequestPriority`): The priority of
+              the device request, e.g. ``BACKGROUND`` when prefetching.
+
+        Returns:
+            str: The address.
+        """
+        if self._address_cache is None:
+            return self._derive_address(account_id, priority)
+
+        hd_path = str(self._hd_root_path.get_account_path(account_id))
+        cache_args = (self.device_id, self.wallet_fingerprint, hd_path)
+        address = self._address_cache.get(*cache_args)
+        if address is None:
+            address = self._derive_address(account_id, priority)
+            self._address_cache.set(*cache_args, address)
+
+        return address
+
+    def get_account_paths(
+        self, account_ids: Iterable[int], priority: RequestPriority = RequestPriority.DEFAULT
+    ) -> list[str]:
+        """
+        Get the addresses of a range of accounts, writing newly cached addresses
+        to disk once rather than once per address.
+        """
+        if self._address_cache is None:
+            return [self.get_account_path(i, priority) for i in account_ids]
+
+        with self._address_cache.batch():
+            return [self.get_account_path(i, priority) for i in account_ids]
+
+    def _derive_address(self, account_id: int, priority: RequestPriority) -> str:
+        if self._derive_locally:
+            return self.public_node.get_child_address(account_id)
 
-    def get_account_path(self, account_id: int) -> str:
         account_path = self._hd_root_path.get_account_path(account_id)
+        return str(self._call_device(get_address, account_path, priority=priority))
+
+    def verify_account_path(self, account_id: int, address: str):
+        """
+        Re-derive the address of the given account on the device itself, showing it
+        on the device's screen, and ensure it matches the given address. Use this to
+        double-check addresses that were derived on the host.
+
+        Raises:
+            :class:`~ape_trezor.exceptions.TrezorClientError`: When the addresses
+              do not match.
+        """
+        account_path = self._hd_root_path.get_account_path(account_id)
+        device_address = str(self._call_device(get_address, account_path, show_display=True))
+        if device_address.lower() != address.lower():
+            raise TrezorClientError(
+                f"Address mismatch for '{account_path}': "
+                f"device returned '{device_address}', expected '{address}'."
+            )
+
+    def _call_device(
+        self,
+        lib_call: Callable,
+        hd_path: "HDPath",
+        priority: RequestPriority = RequestPriority.DEFAULT,
+        **kwargs,
+    ) -> Any:
+        scheduler = get_device_scheduler(self.device_key)
+        return scheduler.call(self._request, lib_call, hd_path, priority=priority, **kwargs)
+
+    def _request(self, lib_call: Callable, hd_path: "HDPath", **kwargs) -> Any:
         try:
-            message_type = get_address(self.client, account_path.address_n)
-            return str(message_type)
+            return call_device(lib_call, self.client, hd_path.address_n, hd_path=hd_path, **kwargs)
 
         except PinException as err:
             raise InvalidPinError() from err
 
         except TrezorFailure as err:
             if "forbidden key path" in str(err).lower():
-                raise InvalidHDPathError(str(account_path))
+                raise InvalidHDPathError(str(hd_path))
 
             code = 0 if not err.code else err.code.value
             raise TrezorClientError(str(err), status=code) from err
@@ -87,6 +668,13 @@ class TrezorAccountClient:
     """
     This class represents an account on the Trezor device when you know the full
     account HD path.
+
+    Args:
+        address (ChecksumAddress): The account's address.
+        account_hd_path (:class:`~ape_trezor.hdpath.HDPath`): The account's HD path.
+        client (Optional[LibTrezorClient]): An already connected device client.
+        device_id (Optional[str]): The ID of the account's device, when not given
+          a client. Defaults to the first device found.
     """
 
     def __init__(
@@ -94,15 +682,11 @@ class TrezorAccountClient:
         address: "ChecksumAddress",
         account_hd_path: "HDPath",
         client: Optional[LibTrezorClient] = None,
+        device_id: Optional[str] = None,
     ):
-        if not client:
-            try:
-                self.client = get_default_client()
-            except TransportException:
-                raise TrezorClientConnectionError()
-        else:
-            self.client = client
-
+        self._owns_client = not client
+        self.client = client or device_sessions.acquire(device_id)
+        _serialize_transport_writes(self.client)
         self._address = address
         self._account_hd_path = account_hd_path
 
@@ -113,17 +697,104 @@ class TrezorAccountClient:
     def address(self) -> str:
         return self._address
 
+    @property
+    def device_key(self) -> str:
+        """
+        Identifies the device, e.g. for :func:`~ape_trezor.scheduler.get_device_scheduler`.
+        """
+        return self.client.features.device_id or ""
+
+    def close(self):
+        """
+        Release the device connection (when it was acquired by this client).
+        """
+        if self._owns_client:
+            device_sessions.release(self.client)
+            self._owns_client = False
+
+    @scheduled(RequestPriority.DEFAULT)
+    def get_address(self, show_display: bool = False) -> str:
+        """
+        Get the account's address from the device.
+
+        Args:
+            show_display (bool): Set to ``True`` to also show the address on the
+              device's screen.
+
+        Returns:
+            str
+        """
+        address = call_device(
+            get_address,
+            self.client,
+            self._account_hd_path.address_n,
+            show_display=show_display,
+            hd_path=self._account_hd_path,
+        )
+        return str(address)
+
+    async def async_get_address(
+        self, show_display: bool = False, timeout: Optional[float] = None
+    ) -> str:
+        """
+        Await :meth:`~ape_trezor.client.TrezorAccountClient.get_address`.
+        """
+        return await self.run_async(self.get_address, show_display=show_display, timeout=timeout)
+
+    async def run_async(
+        self,
+        func: Callable,
+        *args,
+        timeout: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.DEFAULT,
+        **kwargs,
+    ) -> Any:
+        """
+        Await a blocking call using this client, made on the device's scheduler
+        thread. Cancelling the task, or timing out, aborts the request on the device.
+
+        Args:
+            func (Callable): The blocking call, e.g. one of this client's methods.
+            *args: The call's arguments.
+            timeout (Optional[float]): The number of seconds to wait for the call.
+            priority (:class:`~ape_trezor.scheduler.RequestPriority`): The call's
+              priority.
+            **kwargs: The call's keyword arguments.
+
+        Raises:
+            ``asyncio.TimeoutError``: When the call does not finish in time.
+
+        Returns:
+            Any: The call's result.
+        """
+        return await run_on_device_thread(
+            self.device_key,
+            func,
+            *args,
+            timeout=timeout,
+            cancel=self.client.cancel,
+            priority=priority,
+            **kwargs,
+        )
+
+    @scheduled(RequestPriority.MESSAGE)
     def sign_personal_message(self, message: bytes) -> tuple[int, bytes, bytes]:
         """
         Sign an Ethereum message only following the EIP 191 specification and
         using your Trezor device. You will need to follow the prompts on the device
         to validate the message data.
         """
-        ethereum_message_signature = sign_message(
-            self.client, self._account_hd_path.address_n, message
+        ethereum_message_signature = call_device(
+            sign_message,
+            self.client,
+            self._account_hd_path.address_n,
+            message,
+            hd_path=self._account_hd_path,
+            payload=message,
         )
         return extract_signature_vrs_bytes(signature_bytes=ethereum_message_signature.signature)
 
+    @scheduled(RequestPriority.MESSAGE)
     def sign_typed_data(self, data: dict) -> tuple[int, bytes, bytes]:
         """
         Sends a dict of data to the device and is much more obvious and secure
@@ -135,9 +806,17 @@ class TrezorAccountClient:
         Returns:
             tuple[int, bytes, bytes]: A signature tuple.
         """
-        signed_data = sign_typed_data(self.client, self._account_hd_path.address_n, data)
+        signed_data = call_device(
+            sign_typed_data,
+            self.client,
+            self._account_hd_path.address_n,
+            data,
+            hd_path=self._account_hd_path,
+            payload=data,
+        )
         return extract_signature_vrs_bytes(signature_bytes=signed_data.signature)
 
+    @scheduled(RequestPriority.MESSAGE)
     def sign_typed_data_hash(
         self, domain_hash: bytes, message_hash: bytes
     ) -> tuple[int, bytes, bytes]:
@@ -153,21 +832,67 @@ class TrezorAccountClient:
         Returns:
             tuple[int, bytes, bytes]: A signature tuple.
         """
-        signed_data = sign_typed_data_hash(
-            self.client, self._account_hd_path.address_n, domain_hash, message_hash=message_hash
+        signed_data = call_device(
+            sign_typed_data_hash,
+            self.client,
+            self._account_hd_path.address_n,
+            domain_hash,
+            message_hash=message_hash,
+            hd_path=self._account_hd_path,
+            payload=domain_hash + (message_hash or b""),
         )
         return extract_signature_vrs_bytes(signature_bytes=signed_data.signature)
 
+    @scheduled(RequestPriority.TRANSACTION)
     def sign_static_fee_transaction(self, **kwargs) -> tuple[int, bytes, bytes]:
         return self._sign_transaction(sign_tx, **kwargs)
 
+    @scheduled(RequestPriority.TRANSACTION)
     def sign_dynamic_fee_transaction(self, **kwargs) -> tuple[int, bytes, bytes]:
         return self._sign_transaction(sign_tx_eip1559, **kwargs)
 
+    @scheduled(RequestPriority.TRANSACTION)
+    def sign_batch(self, transactions: Iterable[dict]) -> list[tuple[int, bytes, bytes]]:
+        """
+        Sign many transactions in a single device session. When using the default
+        Ethereum HD path, the safety checks level is only switched once for the
+        whole batch rather than once per transaction.
+
+        Args:
+            transactions (Iterable[dict]): The keyword arguments of
+              :meth:`~ape_trezor.client.TrezorAccountClient.sign_static_fee_transaction`
+              or, when including ``max_gas_fee``,
+              :meth:`~ape_trezor.client.TrezorAccountClient.sign_dynamic_fee_transaction`
+              for each transaction.
+
+        Returns:
+            list[tuple[int, bytes, bytes]]: A signature tuple per transaction, in order.
+        """
+        signatures = []
+        with self._default_path_signing():
+            for txn in transactions:
+                lib_call = sign_tx_eip1559 if "max_gas_fee" in txn else sign_tx
+                signatures.append(self._sign(lib_call, **txn))
+
+        return signatures
+
     def _sign_transaction(self, lib_call: Callable, **kwargs) -> tuple[int, bytes, bytes]:
-        did_change = self._allow_default_ethereum_account_signing()
+        with self._default_path_signing():
+            return self._sign(lib_call, **kwargs)
+
+    def _sign(self, lib_call: Callable, **kwargs) -> tuple[int, bytes, bytes]:
+        if kwargs.get("access_list"):
+            kwargs["access_list"] = [_to_access_list_item(x) for x in kwargs["access_list"]]
+
         try:
-            return lib_call(self.client, self._account_hd_path.address_n, **kwargs)
+            return call_device(
+                lib_call,
+                self.client,
+                self._account_hd_path.address_n,
+                hd_path=self._account_hd_path,
+                payload=kwargs.get("data"),
+                **kwargs,
+            )
 
         except TrezorFailure as err:
             forbidden_key_path = "forbidden key path" in str(err).lower()
@@ -177,28 +902,55 @@ class TrezorAccountClient:
 
             raise TrezorAccountError(str(err)) from err
 
-        finally:
-            if did_change:
-                apply_settings(self.client, safety_checks=SafetyCheckLevel.Strict)
-
-    def _allow_default_ethereum_account_signing(self) -> bool:
-        key_path = self._account_hd_path.path
-        prefix = DEFAULT_ETHEREUM_HD_PATH[:-2]
-        is_default_ethereum_path = key_path.startswith(prefix)
-        if not is_default_ethereum_path:
-            return False
+    @contextmanager
+    def _default_path_signing(self) -> Iterator[None]:
+        # NOTE: `client.features` is kept up-to-date by `trezorlib` (it is refreshed on
+        #   connecting and after applying settings), so it tells the current level
+        #   without another device round-trip.
+        original_level = self.client.features.safety_checks
+        if not self._is_default_ethereum_path or original_level in _LENIENT_SAFETY_CHECKS:
+            # No need to change the settings.
+            yield
+            return
 
         logger.warning(
             "Using account with default Ethereum HD Path - "
             "switching safety level check to 'PromptTemporarily'. "
             "Please ensure you are only using addresses on the Ethereum ecosystem."
         )
-        apply_settings(self.client, safety_checks=SafetyCheckLevel.PromptTemporarily)
-        return True
+        call_device(apply_settings, self.client, safety_checks=SafetyCheckLevel.PromptTemporarily)
+        try:
+            yield
+
+        finally:
+            restored_level = original_level or SafetyCheckLevel.Strict
+            call_device(apply_settings, self.client, safety_checks=restored_level)
+
+    @property
+    def _is_default_ethereum_path(self) -> bool:
+        prefix = DEFAULT_ETHEREUM_HD_PATH[:-2]
+        return self._account_hd_path.path.startswith(prefix)
+
+
+def _to_access_list_item(item: Any) -> EthereumAccessList:
+    if isinstance(item, EthereumAccessList):
+        return item
+
+    storage_keys = item.get("storageKeys", item.get("storage_keys", []))
+    return EthereumAccessList(
+        address=item["address"], storage_keys=[HexBytes(k) for k in storage_keys]
+    )
+
+
+_LENIENT_SAFETY_CHECKS = (SafetyCheckLevel.PromptTemporarily, SafetyCheckLevel.PromptAlways)
 
 
 __all__ = [
     "create_client",
+    "device_sessions",
+    "DeviceSessionRegistry",
+    "run_on_device_thread",
+    "TransportResolver",
     "TrezorClient",
     "TrezorAccountClient",
 ]
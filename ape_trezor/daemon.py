@@ -0,0 +1,387 @@
+import json
+import os
+import socket
+import socketserver
+import struct
+import threading
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional
+
+from ape.logging import logger
+
+from ape_trezor.exceptions import (
+    InvalidPinError,
+    TrezorAccountError,
+    TrezorClientError,
+    TrezorSigningError,
+)
+from ape_trezor.hdpath import HDPath
+from ape_trezor.scheduler import RequestPriority
+
+if TYPE_CHECKING:
+    from trezorlib.client import TrezorClient as LibTrezorClient
+
+# A frame is a 4-byte big-endian payload length followed by a JSON payload.
+_FRAME_HEADER = struct.Struct(">I")
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# The `TrezorAccountClient` methods the daemon handles.
+ACCOUNT_METHODS = (
+    "get_address",
+    "sign_personal_message",
+    "sign_typed_data",
+    "sign_typed_data_hash",
+    "sign_static_fee_transaction",
+    "sign_dynamic_fee_transaction",
+    "sign_batch",
+)
+
+
+def get_socket_path() -> Path:
+    """
+    The path of the daemon's socket in the Trezor plugin's data folder.
+    """
+    from ape.utils.basemodel import ManagerAccessMixin
+
+    return ManagerAccessMixin.config_manager.DATA_FOLDER / "trezor" / "daemon.sock"
+
+
+class TrezorDaemon:
+    """
+    A long-lived process owning the device connection, so other ``ape`` processes
+    can sign without opening the device (and entering the PIN or passphrase) again.
+    It handles the :class:`~ape_trezor.client.TrezorAccountClient` operations over
+    a Unix domain socket that only the current user can access. Device calls are
+    made one at a time, in priority order, by the device's scheduler.
+
+    Args:
+        socket_path (Path): The path of the socket to listen on.
+        client (Optional[LibTrezorClient]): The device connection. Defaults to
+          connecting to the device.
+    """
+
+    def __init__(self, socket_path: Path, client: Optional["LibTrezorClient"] = None):
+        self.socket_path = socket_path
+        self._client = client
+        self._owns_client = client is None
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+    @property
+    def client(self) -> "LibTrezorClient":
+        if self._client is None:
+            from ape_trezor.client import device_sessions
+
+            self._client = device_sessions.acquire()
+
+        return self._client
+
+    def start(self):
+        """
+        Connect to the device and start listening, without handling requests yet.
+
+        Raises:
+            :class:`~ape_trezor.exceptions.TrezorAccountError`: When a daemon is
+              already running.
+        """
+        if _is_running(self.socket_path):
+            raise TrezorAccountError(f"Trezor daemon already running at '{self.socket_path}'.")
+
+        # Connect first, so PIN and passphrase prompts happen on start.
+        _ = self.client
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        self.socket_path.unlink(missing_ok=True)
+        handler = type("Handler", (_RequestHandler,), {"daemon": self})
+        previous_umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), handler)
+        finally:
+            os.umask(previous_umask)
+
+        self._server.daemon_threads = True
+
+    def serve_forever(self):
+        """
+        Handle requests until :meth:`~ape_trezor.daemon.TrezorDaemon.shutdown`
+        is called (e.g. from another thread) or the process is interrupted.
+        """
+        if self._server is None:
+            self.start()
+
+        assert self._server is not None  # For mypy.
+        try:
+            self._server.serve_forever()
+        finally:
+            self.close()
+
+    def shutdown(self):
+        if self._server is not None:
+            self._server.shutdown()
+
+    def close(self):
+        if self._server is not None:
+            self._server.server_close()
+            self._server = None
+            self.socket_path.unlink(missing_ok=True)
+
+        if self._owns_client and self._client is not None:
+            from ape_trezor.client import device_sessions
+
+            device_sessions.release(self._client)
+            self._client = None
+
+    def handle(self, request: dict) -> Any:
+        method = request.get("method")
+        if method == "ping":
+            return "pong"
+
+        elif method == "get_device_id":
+            return self.client.features.device_id or ""
+
+        elif method not in ACCOUNT_METHODS:
+            raise TrezorAccountError(f"Unknown Trezor daemon method '{method}'.")
+
+        from ape_trezor.client import TrezorAccountClient
+
+        account_client = TrezorAccountClient(
+            request["address"], HDPath(request["hd_path"]), client=self.client
+        )
+        return getattr(account_client, method)(*request["args"], **request["kwargs"])
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    daemon: TrezorDaemon
+
+    def handle(self):
+        try:
+            while (request := _read_frame(self.request)) is not None:
+                try:
+                    response = {"result": self.daemon.handle(request)}
+                except Exception as err:
+                    logger.error(f"Trezor daemon request failed: {err}")
+                    response = {"error": _encode_error(err)}
+
+                _write_frame(self.request, response)
+
+        except (OSError, TrezorAccountError) as err:
+            # The connection broke or sent an invalid frame.
+            logger.debug(f"Trezor daemon connection closed: {err}")
+
+
+class DaemonAccountClient:
+    """
+    A stand-in for :class:`~ape_trezor.client.TrezorAccountClient` that signs
+    through a running :class:`~ape_trezor.daemon.TrezorDaemon`.
+    """
+
+    def __init__(self, address: str, account_hd_path: HDPath, socket_path: Path):
+        self._address = address
+        self._account_hd_path = account_hd_path
+        self.socket_path = socket_path
+        self._socket: Optional[socket.socket] = None
+        self._lock = threading.Lock()
+
+    def __str__(self):
+        return self._address
+
+    @classmethod
+    def connect(
+        cls,
+        address: str,
+        account_hd_path: HDPath,
+        socket_path: Optional[Path] = None,
+        device_id: Optional[str] = None,
+    ) -> Optional["DaemonAccountClient"]:
+        """
+        Get a client for the running daemon, or ``None`` when it is not running
+        (or is connected to another device than the one with the given ID).
+        """
+        socket_path = socket_path or get_socket_path()
+        if not socket_path.exists():
+            return None
+
+        client = cls(address, account_hd_path, socket_path)
+        try:
+            client._request("ping")
+            if device_id is not None and client._request("get_device_id") != device_id:
+                client.close()
+                return None
+
+        except (OSError, TrezorAccountError):
+            client.close()
+            return None
+
+        return client
+
+    @property
+    def address(self) -> str:
+        return self._address
+
+    @property
+    def device_key(self) -> str:
+        return f"daemon:{self.socket_path}"
+
+    def close(self):
+        with self._lock:
+            if self._socket is not None:
+                self._socket.close()
+                self._socket = None
+
+    def get_address(self, show_display: bool = False) -> str:
+        return self._request("get_address", show_display=show_display)
+
+    async def async_get_address(
+        self, show_display: bool = False, timeout: Optional[float] = None
+    ) -> str:
+        return await self.run_async(self.get_address, show_display=show_display, timeout=timeout)
+
+    async def run_async(
+        self,
+        func: Callable,
+        *args,
+        timeout: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.DEFAULT,
+        **kwargs,
+    ) -> Any:
+        """
+        Await a blocking call using this client, made on the daemon's scheduler thread.
+        """
+        from ape_trezor.client import run_on_device_thread
+
+        # NOTE: Requests already sent to the daemon are not aborted.
+        return await run_on_device_thread(
+            self.device_key, func, *args, timeout=timeout, priority=priority, **kwargs
+        )
+
+    def sign_personal_message(self, message: bytes) -> tuple[int, bytes, bytes]:
+        return self._request_signature("sign_personal_message", message)
+
+    def sign_typed_data(self, data: dict) -> tuple[int, bytes, bytes]:
+        return self._request_signature("sign_typed_data", data)
+
+    def sign_typed_data_hash(
+        self, domain_hash: bytes, message_hash: bytes
+    ) -> tuple[int, bytes, bytes]:
+        return self._request_signature("sign_typed_data_hash", domain_hash, message_hash)
+
+    def sign_static_fee_transaction(self, **kwargs) -> tuple[int, bytes, bytes]:
+        return self._request_signature("sign_static_fee_transaction", **kwargs)
+
+    def sign_dynamic_fee_transaction(self, **kwargs) -> tuple[int, bytes, bytes]:
+        return self._request_signature("sign_dynamic_fee_transaction", **kwargs)
+
+    def sign_batch(self, transactions: Iterable[dict]) -> list[tuple[int, bytes, bytes]]:
+        return [(v, r, s) for v, r, s in self._request("sign_batch", list(transactions))]
+
+    def _request_signature(self, method: str, *args, **kwargs) -> tuple[int, bytes, bytes]:
+        v, r, s = self._request(method, *args, **kwargs)
+        return v, r, s
+
+    def _request(self, method: str, *args, **kwargs) -> Any:
+        request = {
+            "method": method,
+            "address": self._address,
+            "hd_path": self._account_hd_path.path,
+            "args": args,
+            "kwargs": kwargs,
+        }
+        with self._lock:
+            if self._socket is None:
+                self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._socket.connect(str(self.socket_path))
+
+            try:
+                _write_frame(self._socket, request)
+                response = _read_frame(self._socket)
+            except OSError:
+                self._socket.close()
+                self._socket = None
+                raise
+
+        if response is None:
+            raise TrezorAccountError("Trezor daemon closed the connection.")
+        elif "error" in response:
+            raise _decode_error(response["error"])
+
+        return response["result"]
+
+
+def _is_running(socket_path: Path) -> bool:
+    if not socket_path.exists():
+        return False
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(socket_path))
+        except OSError:
+            return False
+
+    return True
+
+
+def _write_frame(sock: socket.socket, data: Any):
+    payload = json.dumps(data, default=_encode_bytes, separators=(",", ":")).encode()
+    sock.sendall(_FRAME_HEADER.pack(len(payload)) + payload)
+
+
+def _read_frame(sock: socket.socket) -> Optional[Any]:
+    header = _read_exactly(sock, _FRAME_HEADER.size)
+    if header is None:
+        return None
+
+    (size,) = _FRAME_HEADER.unpack(header)
+    if size > MAX_FRAME_SIZE:
+        raise TrezorAccountError(f"Trezor daemon frame too large ({size} bytes).")
+
+    payload = _read_exactly(sock, size)
+    if payload is None:
+        return None
+
+    return json.loads(payload, object_hook=_decode_bytes)
+
+
+def _read_exactly(sock: socket.socket, size: int) -> Optional[bytes]:
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return None
+
+        data += chunk
+
+    return bytes(data)
+
+
+def _encode_bytes(value: Any) -> Any:
+    if isinstance(value, (bytes, bytearray)):
+        return {"$bytes": bytes(value).hex()}
+
+    raise TypeError(f"Cannot send '{type(value).__name__}' to the Trezor daemon.")
+
+
+def _decode_bytes(value: dict) -> Any:
+    if len(value) == 1 and "$bytes" in value:
+        return bytes.fromhex(value["$bytes"])
+
+    return value
+
+
+def _encode_error(err: Exception) -> dict:
+    return {
+        "type": type(err).__name__,
+        "message": str(err),
+        "status": getattr(err, "status", 0),
+    }
+
+
+def _decode_error(error: dict) -> TrezorAccountError:
+    error_type = error.get("type")
+    message = error.get("message", "")
+    if error_type == "InvalidPinError":
+        return InvalidPinError()
+    elif error_type == "TrezorSigningError":
+        return TrezorSigningError(message)
+    elif error_type in ("TrezorClientError", "TrezorClientConnectionError"):
+        return TrezorClientError(message, status=error.get("status", 0))
+
+    return TrezorAccountError(message)
@@ -0,0 +1,51 @@
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+from eth_utils import keccak, to_checksum_address
+from slip10.utils import SECP256K1
+
+if TYPE_CHECKING:
+    from eth_typing.evm import ChecksumAddress
+
+
+class PublicNode:
+    """
+    An extended public key (compressed public key and chain code) for an HD base path.
+    Fetched once from the device, it allows deriving the non-hardened child addresses
+    on the host without another device round-trip per address.
+    """
+
+    def __init__(self, public_key: bytes, chain_code: bytes):
+        self.public_key = public_key
+        self.chain_code = chain_code
+
+    def get_child_public_key(self, index: int) -> bytes:
+        """
+        Derive the compressed public key of the child at the given (non-hardened) index.
+        """
+        public_key, _ = SECP256K1.derive_public_child(self.public_key, self.chain_code, index)
+        return public_key
+
+    def get_child_address(self, index: int) -> "ChecksumAddress":
+        """
+        Derive the checksummed Ethereum address of the child at the given index.
+        """
+        return public_key_to_address(self.get_child_public_key(index))
+
+    def get_child_addresses(self, indices: Iterable[int]) -> list["ChecksumAddress"]:
+        """
+        Derive the addresses of many children. Nodes are picklable, so this can
+        be mapped over chunks of indices in worker processes.
+        """
+        return [self.get_child_address(i) for i in indices]
+
+
+def public_key_to_address(public_key: bytes) -> "ChecksumAddress":
+    """
+    Convert a compressed secp256k1 public key to a checksummed Ethereum address.
+    """
+    point = ec.EllipticCurvePublicKey.from_encoded_point(ec.SECP256K1(), public_key)
+    uncompressed = point.public_bytes(Encoding.X962, PublicFormat.UncompressedPoint)
+    return to_checksum_address(keccak(uncompressed[1:])[-20:])
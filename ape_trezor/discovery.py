@@ -0,0 +1,102 @@
+from collections.abc import Iterator
+from typing import TYPE_CHECKING, Any, Optional
+
+from ape.exceptions import ProviderError
+
+if TYPE_CHECKING:
+    from ape.api.providers import ProviderAPI
+
+    from ape_trezor.client import TrezorClient
+
+DEFAULT_GAP_LIMIT = 20
+
+
+def discover_accounts(
+    client: "TrezorClient",
+    provider: "ProviderAPI",
+    gap_limit: int = DEFAULT_GAP_LIMIT,
+    start: int = 0,
+    window_size: Optional[int] = None,
+) -> Iterator[tuple[int, str]]:
+    """
+    Find the accounts under the client's HD base path that have been used
+    on-chain (i.e. have a nonce or a balance). Addresses are checked a window
+    at a time, using a single batched JSON-RPC request per window, until
+    ``gap_limit`` consecutive addresses are unused.
+
+    Args:
+        client (:class:`~ape_trezor.client.TrezorClient`): The client deriving
+          the account addresses.
+        provider (``ProviderAPI``): The connected provider.
+        gap_limit (int): The number of consecutive unused accounts to stop after.
+        start (int): The first account index.
+        window_size (Optional[int]): The number of addresses to check per request.
+          Defaults to the gap limit.
+
+    Returns:
+        Iterator[tuple[int, str]]: The index and address of each used account.
+    """
+    window_size = window_size or gap_limit
+    index = start
+    next_unused = start
+    while index - next_unused < gap_limit:
+        account_ids = range(index, index + window_size)
+        addresses = client.get_account_paths(account_ids)
+        for account_id, address, used in zip(
+            account_ids, addresses, get_activity(provider, addresses)
+        ):
+            if used:
+                next_unused = account_id + 1
+                yield account_id, address
+
+        index += window_size
+
+
+def get_activity(provider: "ProviderAPI", addresses: list[str]) -> list[bool]:
+    """
+    Check which addresses have a nonce or a balance, in one batched request.
+    """
+    requests = [
+        (method, [address, "latest"])
+        for address in addresses
+        for method in ("eth_getTransactionCount", "eth_getBalance")
+    ]
+    results = [_to_int(x) for x in make_batch_request(provider, requests)]
+    return [nonce > 0 or balance > 0 for nonce, balance in zip(results[::2], results[1::2])]
+
+
+def make_batch_request(provider: "ProviderAPI", requests: list[tuple[str, list]]) -> list[Any]:
+    """
+    Make many JSON-RPC requests in one batch. Falls back to making the requests
+    one at a time when the provider does not support batching.
+
+    Raises:
+        ``ProviderError``: When any of the requests fail.
+
+    Returns:
+        list[Any]: The result of each request, in order.
+    """
+    web3 = getattr(provider, "web3", None)
+    try:
+        responses = web3.provider.make_batch_request(requests)  # type: ignore[union-attr]
+    except (AttributeError, NotImplementedError):
+        return [provider.make_request(method, params) for method, params in requests]
+
+    if not isinstance(responses, list):
+        # The whole batch failed.
+        responses = [responses]
+
+    results = []
+    for response in responses:
+        if "error" in response:
+            error = response["error"]
+            message = error.get("message", error) if isinstance(error, dict) else error
+            raise ProviderError(f"Batch request failed: {message}")
+
+        results.append(response["result"])
+
+    return results
+
+
+def _to_int(value: Any) -> int:
+    return int(value, 16) if isinstance(value, str) else int(value)
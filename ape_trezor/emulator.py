@@ -0,0 +1,403 @@
+import time
+from collections import Counter, deque
+from collections.abc import Generator, Sequence
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_keys import keys
+from eth_utils import keccak
+from mnemonic import Mnemonic
+from slip10 import SLIP10
+from trezorlib import messages
+from trezorlib.mapping import DEFAULT_MAPPING
+from trezorlib.transport import Transport
+
+from ape_trezor.derivation import public_key_to_address
+
+if TYPE_CHECKING:
+    from trezorlib.client import TrezorClient as LibTrezorClient
+    from trezorlib.protobuf import MessageType
+
+DEFAULT_MNEMONIC = " ".join(["abandon"] * 11 + ["about"])
+DEFAULT_DEVICE_ID = "EMULATOR00000000000000000"
+
+# A device flow yields requests to the host, receives the host's responses
+# and returns its result (e.g. the final response of the flow).
+DeviceFlow = Generator[Any, Any, Any]
+
+
+class EmulatorTransport(Transport):
+    """
+    An in-process, software-only Trezor device for tests and benchmarks.
+    It answers the Ethereum messages this plugin uses (addresses, public keys,
+    message, transaction and typed data signing, including the data-chunk and
+    typed data field requests) as well as ``ApplySettings``, using keys derived
+    from a mnemonic. No hardware, USB, bridge or network is involved and the
+    device never asks for user confirmation.
+
+    Args:
+        mnemonic (str): The BIP-39 mnemonic of the emulated wallet.
+        passphrase (str): The wallet passphrase. When given, the device reports
+          passphrase protection as enabled (the passphrase is never requested).
+        latency (Union[float, dict[str, float]]): Seconds to wait before answering
+          each message, or a mapping of message names (e.g. ``"EthereumGetAddress"``)
+          to seconds, to emulate a device's round-trip time.
+        device_id (str): The ID reported by the device.
+    """
+
+    PATH_PREFIX = "emulator"
+    # NOTE: Never returned when enumerating real devices.
+    ENABLED = False
+
+    def __init__(
+        self,
+        mnemonic: str = DEFAULT_MNEMONIC,
+        passphrase: str = "",
+        latency: Union[float, dict[str, float]] = 0.0,
+        device_id: str = DEFAULT_DEVICE_ID,
+    ):
+        self.latency = latency
+        self.device_id = device_id
+        self.passphrase_protection = bool(passphrase)
+        self.safety_checks = messages.SafetyCheckLevel.Strict
+        self.label = "Emulator"
+        self.message_counts: Counter[str] = Counter()
+        self._wallet = SLIP10.from_seed(Mnemonic.to_seed(mnemonic, passphrase))
+        self._nodes: dict[tuple[int, ...], SLIP10] = {}
+        self._responses: deque[tuple[int, bytes]] = deque()
+        self._flow: Optional[DeviceFlow] = None
+
+    def get_path(self) -> str:
+        return f"{self.PATH_PREFIX}:{self.device_id}"
+
+    def begin_session(self):
+        pass
+
+    def end_session(self):
+        pass
+
+    def read(self) -> tuple[int, bytes]:
+        return self._responses.popleft()
+
+    def write(self, message_type: int, message_data: bytes):
+        message = DEFAULT_MAPPING.decode(message_type, message_data)
+        name = type(message).__name__
+        self.message_counts[name] += 1
+        latency = self.latency.get(name, 0) if isinstance(self.latency, dict) else self.latency
+        if latency:
+            time.sleep(latency)
+
+        response = self._handle(message)
+        self._responses.append(DEFAULT_MAPPING.encode(response))
+
+    def get_address(self, address_n: Sequence[int]) -> str:
+        """
+        The address of the given account in the emulated wallet.
+        """
+        return public_key_to_address(self._get_node(address_n).pubkey)
+
+    def get_private_key(self, address_n: Sequence[int]) -> bytes:
+        """
+        The private key of the given account in the emulated wallet.
+        """
+        return self._get_node(address_n).privkey
+
+    def _get_node(self, address_n: Sequence[int]) -> SLIP10:
+        key = tuple(address_n)
+        if key not in self._nodes:
+            self._nodes[key] = self._wallet.get_child_from_path(list(address_n))
+
+        return self._nodes[key]
+
+    def _handle(self, message: "MessageType") -> "MessageType":
+        if self._flow is not None:
+            try:
+                return self._flow.send(message)
+            except StopIteration as result:
+                self._flow = None
+                return result.value
+
+        if isinstance(message, (messages.Initialize, messages.GetFeatures)):
+            return self._get_features()
+
+        elif isinstance(message, messages.ApplySettings):
+            if message.safety_checks is not None:
+                self.safety_checks = message.safety_checks
+            if message.label is not None:
+                self.label = message.label
+
+            return messages.Success(message="Settings applied")
+
+        elif isinstance(message, (messages.EndSession, messages.LockDevice)):
+            return messages.Success()
+
+        elif isinstance(message, messages.EthereumGetAddress):
+            return messages.EthereumAddress(address=self.get_address(message.address_n))
+
+        elif isinstance(message, messages.EthereumGetPublicKey):
+            node = self._get_node(message.address_n)
+            return messages.EthereumPublicKey(
+                node=messages.HDNodeType(
+                    depth=node.depth,
+                    fingerprint=int.from_bytes(node.parent_fingerprint, "big"),
+                    child_num=node.index,
+                    chain_code=node.chaincode,
+                    public_key=node.pubkey,
+                ),
+                xpub=node.get_xpub(),
+            )
+
+        elif isinstance(message, messages.EthereumSignMessage):
+            private_key = self.get_private_key(message.address_n)
+            signed = Account.sign_message(encode_defunct(message.message), private_key)
+            return messages.EthereumMessageSignature(
+                signature=signed.signature, address=self.get_address(message.address_n)
+            )
+
+        elif isinstance(message, messages.EthereumSignTypedHash):
+            return self._sign_typed_hash(
+                message.address_n, message.domain_separator_hash, message.message_hash
+            )
+
+        elif isinstance(message, (messages.EthereumSignTx, messages.EthereumSignTxEIP1559)):
+            return self._start_flow(self._sign_tx(message))
+
+        elif isinstance(message, messages.EthereumSignTypedData):
+            return self._start_flow(self._sign_typed_data(message))
+
+        return messages.Failure(
+            code=messages.FailureType.UnexpectedMessage,
+            message=f"Unexpected message {type(message).__name__}",
+        )
+
+    def _start_flow(self, flow: DeviceFlow) -> "MessageType":
+        try:
+            request = next(flow)
+        except StopIteration as result:
+            return result.value
+
+        self._flow = flow
+        return request
+
+    def _get_features(self) -> messages.Features:
+        return messages.Features(
+            vendor="trezor.io",
+            major_version=2,
+            minor_version=8,
+            patch_version=0,
+            device_id=self.device_id,
+            model="T",
+            internal_model="T2T1",
+            label=self.label,
+            initialized=True,
+            unlocked=True,
+            pin_protection=False,
+            passphrase_protection=self.passphrase_protection,
+            safety_checks=self.safety_checks,
+            session_id=self.device_id.encode().ljust(32, b"\x00")[:32],
+            capabilities=[messages.Capability.Ethereum],
+        )
+
+    def _sign_tx(
+        self, message: Union[messages.EthereumSignTx, messages.EthereumSignTxEIP1559]
+    ) -> DeviceFlow:
+        data = message.data_initial_chunk or b""
+        data_length = message.data_length or 0
+        while len(data) < data_length:
+            ack = yield messages.EthereumTxRequest(data_length=min(data_length - len(data), 1024))
+            data += messages.EthereumTxAck.ensure_isinstance(ack).data_chunk
+
+        txn: dict = {
+            "nonce": _to_int(message.nonce),
+            "gas": _to_int(message.gas_limit),
+            "to": message.to or b"",
+            "value": _to_int(message.value),
+            "data": data,
+            "chainId": message.chain_id,
+        }
+        if isinstance(message, messages.EthereumSignTxEIP1559):
+            txn["type"] = 2
+            txn["maxFeePerGas"] = _to_int(message.max_gas_fee)
+            txn["maxPriorityFeePerGas"] = _to_int(message.max_priority_fee)
+            txn["accessList"] = [
+                {
+                    "address": item.address,
+                    "storageKeys": [f"0x{k.hex()}" for k in item.storage_keys],
+                }
+                for item in message.access_list
+            ]
+        else:
+            txn["gasPrice"] = _to_int(message.gas_price)
+
+        signed = Account.sign_transaction(txn, self.get_private_key(message.address_n))
+        if isinstance(message, messages.EthereumSignTx):
+            # The device only sends the recovery bit for EIP-155 signatures.
+            v = signed.v - (2 * message.chain_id + 35)
+        else:
+            v = signed.v
+
+        return messages.EthereumTxRequest(
+            signature_v=v,
+            signature_r=signed.r.to_bytes(32, "big"),
+            signature_s=signed.s.to_bytes(32, "big"),
+        )
+
+    def _sign_typed_data(self, message: messages.EthereumSignTypedData) -> DeviceFlow:
+        # Request the definitions of all the involved structs.
+        types: dict[str, Sequence[messages.EthereumStructMember]] = {}
+        pending = ["EIP712Domain", message.primary_type]
+        while pending:
+            struct_name = pending.pop(0)
+            if struct_name in types:
+                continue
+
+            ack = yield messages.EthereumTypedDataStructRequest(name=struct_name)
+            members = messages.EthereumTypedDataStructAck.ensure_isinstance(ack).members
+            types[struct_name] = members
+            for member in members:
+                field_type = member.type.entry_type or member.type
+                if field_type.struct_name:
+                    pending.append(field_type.struct_name)
+
+        # Request the values, hashing them like the device does.
+        hasher = _TypedDataHasher(types)
+        domain_hash = yield from hasher.hash_struct("EIP712Domain", [0])
+        message_hash = None
+        if message.primary_type != "EIP712Domain":
+            message_hash = yield from hasher.hash_struct(message.primary_type, [1])
+
+        return self._sign_typed_hash(message.address_n, domain_hash, message_hash)
+
+    def _sign_typed_hash(
+        self, address_n: Sequence[int], domain_hash: bytes, message_hash: Optional[bytes]
+    ) -> messages.EthereumTypedDataSignature:
+        digest = keccak(b"\x19\x01" + domain_hash + (message_hash or b""))
+        private_key = keys.PrivateKey(self.get_private_key(address_n))
+        signature = private_key.sign_msg_hash(digest)
+        return messages.EthereumTypedDataSignature(
+            signature=signature.to_bytes()[:64] + bytes([signature.v + 27]),
+            address=self.get_address(address_n),
+        )
+
+
+class _TypedDataHasher:
+    """
+    Implements EIP-712 ``hashStruct``, requesting the field values from the host
+    with ``EthereumTypedDataValueRequest`` messages.
+    """
+
+    def __init__(self, types: dict[str, Sequence[messages.EthereumStructMember]]):
+        self.types = types
+
+    def hash_struct(self, struct_name: str, member_path: list[int]) -> DeviceFlow:
+        encoded = self.get_type_hash(struct_name)
+        for index, member in enumerate(self.types[struct_name]):
+            encoded += yield from self.encode_field(member.type, [*member_path, index])
+
+        return keccak(encoded)
+
+    def encode_field(
+        self, field_type: messages.EthereumFieldType, member_path: list[int]
+    ) -> DeviceFlow:
+        data_type = field_type.data_type
+        if data_type == messages.EthereumDataType.STRUCT:
+            assert field_type.struct_name is not None
+            return (yield from self.hash_struct(field_type.struct_name, member_path))
+
+        value = yield from self.request_value(member_path)
+        if data_type == messages.EthereumDataType.ARRAY:
+            assert field_type.entry_type is not None
+            encoded = b""
+            for index in range(_to_int(value)):
+                encoded += yield from self.encode_field(
+                    field_type.entry_type, [*member_path, index]
+                )
+
+            return keccak(encoded)
+
+        elif data_type == messages.EthereumDataType.STRING or (
+            data_type == messages.EthereumDataType.BYTES and not field_type.size
+        ):
+            return keccak(value)
+
+        elif data_type == messages.EthereumDataType.BYTES:
+            return value.ljust(32, b"\x00")
+
+        elif data_type == messages.EthereumDataType.INT:
+            number = int.from_bytes(value, "big", signed=True)
+            return number.to_bytes(32, "big", signed=True)
+
+        # Unsigned integers, booleans and addresses.
+        return value.rjust(32, b"\x00")
+
+    def request_value(self, member_path: list[int]) -> DeviceFlow:
+        ack = yield messages.EthereumTypedDataValueRequest(member_path=member_path)
+        return messages.EthereumTypedDataValueAck.ensure_isinstance(ack).value
+
+    def get_type_hash(self, struct_name: str) -> bytes:
+        dependencies = sorted(self._get_dependencies(struct_name) - {struct_name})
+        encoded_type = "".join(self._encode_type(name) for name in (struct_name, *dependencies))
+        return keccak(text=encoded_type)
+
+    def _encode_type(self, struct_name: str) -> str:
+        members = ",".join(f"{_get_type_name(m.type)} {m.name}" for m in self.types[struct_name])
+        return f"{struct_name}({members})"
+
+    def _get_dependencies(self, struct_name: str, found: Optional[set] = None) -> set[str]:
+        found = found if found is not None else set()
+        if struct_name in found:
+            return found
+
+        found.add(struct_name)
+        for member in self.types[struct_name]:
+            field_type = member.type.entry_type or member.type
+            if field_type.struct_name:
+                self._get_dependencies(field_type.struct_name, found)
+
+        return found
+
+
+def _get_type_name(field_type: messages.EthereumFieldType) -> str:
+    data_type = field_type.data_type
+    if data_type == messages.EthereumDataType.ARRAY:
+        assert field_type.entry_type is not None
+        return f"{_get_type_name(field_type.entry_type)}[{field_type.size or ''}]"
+    elif data_type == messages.EthereumDataType.STRUCT:
+        return field_type.struct_name or ""
+    elif data_type == messages.EthereumDataType.UINT:
+        return f"uint{(field_type.size or 32) * 8}"
+    elif data_type == messages.EthereumDataType.INT:
+        return f"int{(field_type.size or 32) * 8}"
+    elif data_type == messages.EthereumDataType.BYTES:
+        return f"bytes{field_type.size}" if field_type.size else "bytes"
+
+    return data_type.name.lower()
+
+
+def _to_int(value: Optional[bytes]) -> int:
+    return int.from_bytes(value or b"", "big")
+
+
+def create_emulator_client(**kwargs) -> "LibTrezorClient":
+    """
+    Create a ``trezorlib`` client connected to a new
+    :class:`~ape_trezor.emulator.EmulatorTransport`.
+
+    Args:
+        **kwargs: Arguments for :class:`~ape_trezor.emulator.EmulatorTransport`.
+
+    Returns:
+        LibTrezorClient
+    """
+    from trezorlib.client import TrezorClient as LibTrezorClient
+    from trezorlib.ui import ClickUI
+
+    return LibTrezorClient(EmulatorTransport(**kwargs), ui=ClickUI())
+
+
+__all__ = [
+    "create_emulator_client",
+    "DEFAULT_MNEMONIC",
+    "EmulatorTransport",
+]
@@ -1,5 +1,13 @@
-from ape.utils import cached_property
-from trezorlib.tools import Address, parse_path
+import threading
+from collections.abc import Iterator
+from typing import Optional
+
+from trezorlib.tools import HARDENED_FLAG, Address, parse_path
+
+# HD path objects by type and path, so identical paths are parsed once and shared.
+_interned: dict[tuple[type, str], "HDPath"] = {}
+_interned_lock = threading.Lock()
+MAX_INTERNED = 10_000
 
 
 class HDPath:
@@ -7,24 +15,71 @@ class HDPath:
     A class representing an HD path. This class is the base class
     for both account specific HD paths (:class:`~ape_trezor.hdpath.HDPath`)
     as well as the derivation HD path class :class:`~ape_trezor.hdpath.HDBasePath`.
+    HD paths are immutable and interned: creating the same path again returns
+    the existing object.
     """
 
-    def __init__(self, path: str):
+    __slots__ = ("_path", "_address_n")
+
+    _path: str
+    _address_n: tuple[int, ...]
+
+    def __new__(cls, path: str):
         path = path.rstrip("/")
+        if hd_path := _interned.get((cls, path)):
+            return hd_path
+
         if not path.startswith("m/"):
             raise ValueError("HD path must begin with m/")
 
-        self.path = path
+        return cls._create(path, tuple(parse_path(path)))
+
+    @classmethod
+    def _create(cls, path: str, address_n: tuple[int, ...]) -> "HDPath":
+        with _interned_lock:
+            if hd_path := _interned.get((cls, path)):
+                # Created by another thread meanwhile.
+                return hd_path
+
+            hd_path = object.__new__(cls)
+            object.__setattr__(hd_path, "_path", path)
+            object.__setattr__(hd_path, "_address_n", address_n)
+            if len(_interned) >= MAX_INTERNED:
+                # Evict the oldest path.
+                _interned.pop(next(iter(_interned)), None)
+
+            _interned[(cls, path)] = hd_path
+            return hd_path
+
+    def __setattr__(self, name: str, value):
+        # NOTE: Interned paths are shared, so changing one would change it for every holder.
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
 
     def __str__(self):
-        return self.path
+        return self._path
 
     def __repr__(self):
         return f"<{self}>"
 
-    @cached_property
+    def __eq__(self, other) -> bool:
+        return type(other) is type(self) and other._path == self._path
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._path))
+
+    def __reduce__(self):
+        return type(self), (self._path,)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
     def address_n(self) -> Address:
-        return parse_path(self.path)
+        return Address(list(self._address_n))
 
 
 class HDBasePath(HDPath):
@@ -33,10 +88,41 @@ class HDBasePath(HDPath):
     :class:`~ape_trezor.hdpath.HDPath`.
     """
 
-    def __init__(self, base_path=None):
-        base_path = base_path or "m/44'/60'/0'/0"
-        base_path = base_path.rstrip("/")
-        super().__init__(base_path)
+    __slots__ = ()
+
+    def __new__(cls, base_path: Optional[str] = None):
+        return super().__new__(cls, base_path or "m/44'/60'/0'/0")
+
+    def get_account_path(self, account_id: int) -> HDPath:
+        """
+        Get the path of an account under this path.
+
+        Args:
+            account_id (int): The (non-hardened) account index.
+
+        Raises:
+            ValueError: When the account index is not an integer from ``0`` to ``2**31 - 1``.
+
+        Returns:
+            :class:`~ape_trezor.hdpath.HDPath`
+        """
+        if (
+            not isinstance(account_id, int)
+            or isinstance(account_id, bool)
+            or not 0 <= account_id < HARDENED_FLAG
+        ):
+            raise ValueError(f"Invalid account index '{account_id}'.")
+
+        path = f"{self._path}/{account_id}"
+        if hd_path := _interned.get((HDPath, path)):
+            return hd_path
+
+        # NOTE: Extends the parsed base path rather than parsing the account path.
+        return HDPath._create(path, (*self._address_n, account_id))
 
-    def get_account_path(self, account_id) -> HDPath:
-        return HDPath(f"{self.path}/{account_id}")
+    def iter_children(self, start: int, stop: int) -> Iterator[HDPath]:
+        """
+        Iterate over the account paths for the indices from ``start`` up to ``stop``.
+        """
+        for account_id in range(start, stop):
+            yield self.get_account_path(account_id)
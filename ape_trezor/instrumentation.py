@@ -0,0 +1,201 @@
+import json
+import time
+from bisect import bisect_left
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional
+
+from ape.logging import logger
+
+if TYPE_CHECKING:
+    from ape_trezor.hdpath import HDPath
+
+# The device message each instrumented `trezorlib` call starts with.
+MESSAGE_TYPES = {
+    "get_default_client": "Initialize",
+    "init_device": "Initialize",
+    "get_address": "EthereumGetAddress",
+    "get_public_node": "EthereumGetPublicKey",
+    "sign_message": "EthereumSignMessage",
+    "sign_tx": "EthereumSignTx",
+    "sign_tx_eip1559": "EthereumSignTxEIP1559",
+    "sign_typed_data": "EthereumSignTypedData",
+    "sign_typed_data_hash": "EthereumSignTypedHash",
+    "apply_settings": "ApplySettings",
+}
+
+
+@dataclass(frozen=True)
+class DeviceCallEvent:
+    """
+    A completed call to the device, passed to each instrumentation hook.
+    Events carry both the start time and the duration, so they map directly
+    to spans, e.g. for an OpenTelemetry exporter.
+    """
+
+    name: str
+    """The ``trezorlib`` function, e.g. ``"sign_tx"``."""
+
+    message_type: str
+    """The device message the call starts with, e.g. ``"EthereumSignTx"``."""
+
+    hd_path: Optional[str]
+    """The HD path used in the call, if any."""
+
+    payload_size: int
+    """The size in bytes of the signed payload (message, calldata or typed data)."""
+
+    start_time_ns: int
+    """When the call started, in nanoseconds since the epoch."""
+
+    duration: float
+    """How long the call took, in seconds (including any user confirmation)."""
+
+    error: Optional[BaseException] = None
+    """The error raised by the call, if it failed."""
+
+    @property
+    def outcome(self) -> str:
+        return "ok" if self.error is None else "error"
+
+
+InstrumentationHook = Callable[[DeviceCallEvent], None]
+
+_hooks: tuple[InstrumentationHook, ...] = ()
+
+
+def add_hook(hook: InstrumentationHook):
+    """
+    Call ``hook`` with a :class:`~ape_trezor.instrumentation.DeviceCallEvent`
+    after every device call. Hooks run in the thread making the call; errors
+    raised by a hook are logged and ignored.
+    """
+    global _hooks
+    _hooks = (*_hooks, hook)
+
+
+def remove_hook(hook: InstrumentationHook):
+    """
+    Stop calling a hook added with :meth:`~ape_trezor.instrumentation.add_hook`.
+    """
+    global _hooks
+    _hooks = tuple(h for h in _hooks if h != hook)
+
+
+def call_device(
+    lib_call: Callable,
+    *args,
+    hd_path: Optional["HDPath"] = None,
+    payload: Any = None,
+    **kwargs,
+) -> Any:
+    """
+    Make a ``trezorlib`` call, reporting it to the instrumentation hooks.
+    When there are no hooks, this only calls ``lib_call``.
+    """
+    hooks = _hooks
+    if not hooks:
+        return lib_call(*args, **kwargs)
+
+    start_time_ns = time.time_ns()
+    start = time.perf_counter()
+    error = None
+    try:
+        return lib_call(*args, **kwargs)
+
+    except BaseException as err:
+        error = err
+        raise
+
+    finally:
+        duration = time.perf_counter() - start
+        name = getattr(lib_call, "__name__", "unknown")
+        event = DeviceCallEvent(
+            name=name,
+            message_type=MESSAGE_TYPES.get(name, "unknown"),
+            hd_path=None if hd_path is None else str(hd_path),
+            payload_size=_get_payload_size(payload),
+            start_time_ns=start_time_ns,
+            duration=duration,
+            error=error,
+        )
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as hook_err:
+                # NOTE: Never replaces the result (or error) of the device call.
+                logger.debug(f"Trezor instrumentation hook failed: {hook_err!r}")
+
+
+def _get_payload_size(payload: Any) -> int:
+    if payload is None:
+        return 0
+    elif isinstance(payload, (bytes, str)):
+        return len(payload)
+
+    return len(json.dumps(payload, default=str))
+
+
+class DeviceCallHistogram:
+    """
+    An instrumentation hook recording device call durations per ``trezorlib``
+    function in memory.
+
+    Usage example::
+
+        from ape_trezor.instrumentation import DeviceCallHistogram, add_hook
+
+        histogram = DeviceCallHistogram()
+        add_hook(histogram)
+        ...
+        print(histogram.get_mean("sign_tx"))
+
+    Args:
+        buckets (tuple[float, ...]): The upper bounds, in seconds, of the buckets.
+    """
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self.counts: dict[str, list[int]] = {}
+        self.totals: dict[str, float] = {}
+        self.errors: dict[str, int] = {}
+
+    def __call__(self, event: DeviceCallEvent):
+        if event.name not in self.counts:
+            # NOTE: The last bucket counts calls slower than all the bounds.
+            self.counts[event.name] = [0] * (len(self.buckets) + 1)
+            self.totals[event.name] = 0.0
+            self.errors[event.name] = 0
+
+        self.counts[event.name][bisect_left(self.buckets, event.duration)] += 1
+        self.totals[event.name] += event.duration
+        if event.error is not None:
+            self.errors[event.name] += 1
+
+    def get_count(self, name: str) -> int:
+        """
+        The number of recorded calls to a ``trezorlib`` function.
+        """
+        return sum(self.counts.get(name, []))
+
+    def get_mean(self, name: str) -> float:
+        """
+        The mean duration, in seconds, of the calls to a ``trezorlib`` function.
+        """
+        count = self.get_count(name)
+        return self.totals[name] / count if count else 0.0
+
+    def reset(self):
+        self.counts = {}
+        self.totals = {}
+        self.errors = {}
+
+
+__all__ = [
+    "add_hook",
+    "DeviceCallEvent",
+    "DeviceCallHistogram",
+    "remove_hook",
+]
@@ -0,0 +1,88 @@
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, TypeVar
+
+from ape_trezor.scheduler import RequestPriority, get_device_scheduler
+
+if TYPE_CHECKING:
+    from ape.api import TransactionAPI
+    from ape.types import MessageSignature
+
+    from ape_trezor.accounts import TrezorAccount
+
+T = TypeVar("T")
+
+
+def map_accounts(
+    func: Callable[["TrezorAccount"], T],
+    accounts: Iterable["TrezorAccount"],
+    priority: RequestPriority = RequestPriority.DEFAULT,
+) -> list[T]:
+    """
+    Call a function with each account, in parallel across the accounts' devices.
+    Calls for accounts on the same device are made one at a time, on the device's
+    scheduler thread (see :class:`~ape_trezor.scheduler.DeviceScheduler`).
+
+    Args:
+        func (Callable[[:class:`~ape_trezor.accounts.TrezorAccount`], T]): The function
+          to call, e.g. signing a batch using the account.
+        accounts (Iterable[:class:`~ape_trezor.accounts.TrezorAccount`]): The accounts.
+        priority (:class:`~ape_trezor.scheduler.RequestPriority`): The calls' priority,
+          e.g. ``BACKGROUND`` for exports.
+
+    Returns:
+        list[T]: The result for each account, in order.
+    """
+    return _map_devices([(account, func, (account,)) for account in accounts], priority)
+
+
+def sign_transaction_batches(
+    batches: Iterable[tuple["TrezorAccount", Iterable["TransactionAPI"]]],
+) -> list[list["TransactionAPI"]]:
+    """
+    Sign batches of transactions, each with its account, in parallel across devices.
+
+    Args:
+        batches (Iterable[tuple[TrezorAccount, Iterable[``TransactionAPI``]]]): Each
+          account and the transactions for it to sign.
+
+    Returns:
+        list[list[``TransactionAPI``]]: The signed transactions of each batch, in order.
+    """
+    return _map_devices(
+        [(account, account.sign_transactions, (list(txns),)) for account, txns in batches],
+        RequestPriority.TRANSACTION,
+    )
+
+
+def sign_message_batches(
+    batches: Iterable[tuple["TrezorAccount", Iterable]],
+) -> list[list["MessageSignature"]]:
+    """
+    Sign batches of messages, each with its account, in parallel across devices.
+
+    Args:
+        batches (Iterable[tuple[TrezorAccount, Iterable]]): Each account and the
+          messages for it to sign.
+
+    Returns:
+        list[list[``MessageSignature``]]: The signatures of each batch, in order.
+    """
+    return _map_devices(
+        [(account, _sign_messages, (account, list(msgs))) for account, msgs in batches],
+        RequestPriority.MESSAGE,
+    )
+
+
+def _sign_messages(account: "TrezorAccount", msgs: list) -> list["MessageSignature"]:
+    return list(account.sign_messages(msgs))
+
+
+def _map_devices(
+    calls: list[tuple["TrezorAccount", Callable, tuple]], priority: RequestPriority
+) -> list:
+    # NOTE: Accounts connect to their device here, one at a time.
+    futures = [
+        get_device_scheduler(account.client.device_key).submit(func, *args, priority=priority)
+        for account, func, args in calls
+    ]
+    return [future.result() for future in futures]
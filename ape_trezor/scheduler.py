@@ -0,0 +1,248 @@
+import heapq
+import itertools
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from enum import IntEnum
+from functools import wraps
+from typing import Any, Optional
+
+
+class RequestPriority(IntEnum):
+    """
+    The priority of a device request. Requests with a lower value are made first;
+    requests with the same priority are made in the order they were submitted.
+    """
+
+    TRANSACTION = 0
+    """Signing transactions, which are usually time-sensitive."""
+
+    MESSAGE = 1
+    """Signing messages and typed data."""
+
+    DEFAULT = 2
+    """Requests without a specific priority."""
+
+    BACKGROUND = 3
+    """Requests nobody is waiting on yet, e.g. prefetching addresses."""
+
+
+@dataclass(frozen=True)
+class RequestStats:
+    """
+    The queue metrics of the requests with one priority.
+    """
+
+    queued: int
+    """The number of requests waiting to be made."""
+
+    completed: int
+    """The number of requests made (successfully or not)."""
+
+    total_wait: float
+    """The total time, in seconds, the made requests waited in the queue."""
+
+    max_wait: float
+    """The longest time, in seconds, a made request waited in the queue."""
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.completed if self.completed else 0.0
+
+
+@dataclass
+class _Request:
+    func: Callable
+    args: tuple
+    kwargs: dict
+    future: Future
+    priority: RequestPriority
+    submit_time: float
+
+
+class DeviceScheduler:
+    """
+    Makes all the requests to one device, one at a time, on a dedicated thread.
+    ``trezorlib`` clients are not thread-safe, so requests from any thread are
+    queued here and made in priority order, e.g. letting a transaction signature
+    jump ahead of queued background address derivations. Requests made from the
+    scheduler's own thread (e.g. nested requests) run immediately.
+
+    Args:
+        device_key (str): Identifies the device, e.g. its device ID.
+    """
+
+    def __init__(self, device_key: str):
+        self.device_key = device_key
+        self._queue: list[tuple[int, int, _Request]] = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._completed = {p: 0 for p in RequestPriority}
+        self._total_wait = {p: 0.0 for p in RequestPriority}
+        self._max_wait = {p: 0.0 for p in RequestPriority}
+
+    @property
+    def queue_depth(self) -> int:
+        """
+        The number of requests waiting to be made.
+        """
+        with self._condition:
+            return len(self._queue)
+
+    @property
+    def is_current_thread(self) -> bool:
+        """
+        Whether the caller is running on this scheduler's thread, i.e. in a request.
+        """
+        return threading.current_thread() is self._thread
+
+    def submit(
+        self, func: Callable, *args, priority: RequestPriority = RequestPriority.DEFAULT, **kwargs
+    ) -> Future:
+        """
+        Queue a request.
+
+        Args:
+            func (Callable): The blocking call making the request.
+            *args: The call's arguments.
+            priority (:class:`~ape_trezor.scheduler.RequestPriority`): The request's
+              priority.
+            **kwargs: The call's keyword arguments.
+
+        Returns:
+            ``concurrent.futures.Future``: The request's result. Cancelling it before
+            the request is made drops the request.
+        """
+        future: Future = Future()
+        request = _Request(func, args, kwargs, future, priority, time.perf_counter())
+        with self._condition:
+            heapq.heappush(self._queue, (priority, next(self._counter), request))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f"trezor-{self.device_key}", daemon=True
+                )
+                self._thread.start()
+
+            self._condition.notify()
+
+        return future
+
+    def call(
+        self, func: Callable, *args, priority: RequestPriority = RequestPriority.DEFAULT, **kwargs
+    ) -> Any:
+        """
+        Make a request, waiting for its turn and its result.
+
+        Args:
+            func (Callable): The blocking call making the request.
+            *args: The call's arguments.
+            priority (:class:`~ape_trezor.scheduler.RequestPriority`): The request's
+              priority.
+            **kwargs: The call's keyword arguments.
+
+        Returns:
+            Any: The call's result.
+        """
+        if self.is_current_thread:
+            # NOTE: Nested in a request, which already has the device.
+            return func(*args, **kwargs)
+
+        return self.submit(func, *args, priority=priority, **kwargs).result()
+
+    def get_stats(self) -> dict[RequestPriority, RequestStats]:
+        """
+        Get the queue metrics, per priority.
+        """
+        with self._condition:
+            queued = {p: 0 for p in RequestPriority}
+            for priority, *_ in self._queue:
+                queued[RequestPriority(priority)] += 1
+
+            return {
+                p: RequestStats(
+                    queued=queued[p],
+                    completed=self._completed[p],
+                    total_wait=self._total_wait[p],
+                    max_wait=self._max_wait[p],
+                )
+                for p in RequestPriority
+            }
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._queue:
+                    self._condition.wait()
+
+                *_, request = heapq.heappop(self._queue)
+
+            if not request.future.set_running_or_notify_cancel():
+                # Cancelled while queued.
+                continue
+
+            wait = time.perf_counter() - request.submit_time
+            result, error = None, None
+            try:
+                result = request.func(*request.args, **request.kwargs)
+            except BaseException as err:
+                error = err
+
+            # NOTE: Counted before resolving the future, so callers see the request completed.
+            with self._condition:
+                self._completed[request.priority] += 1
+                self._total_wait[request.priority] += wait
+                self._max_wait[request.priority] = max(self._max_wait[request.priority], wait)
+
+            if error is not None:
+                request.future.set_exception(error)
+            else:
+                request.future.set_result(result)
+
+
+_schedulers: dict[str, DeviceScheduler] = {}
+_schedulers_lock = threading.Lock()
+
+
+def get_device_scheduler(device_key: str) -> DeviceScheduler:
+    """
+    Get the scheduler making a device's requests.
+
+    Args:
+        device_key (str): Identifies the device, e.g. its device ID.
+
+    Returns:
+        :class:`~ape_trezor.scheduler.DeviceScheduler`
+    """
+    with _schedulers_lock:
+        if device_key not in _schedulers:
+            _schedulers[device_key] = DeviceScheduler(device_key)
+
+        return _schedulers[device_key]
+
+
+def scheduled(priority: RequestPriority) -> Callable[[Callable], Callable]:
+    """
+    Make a client method a request on the client's device scheduler (its
+    ``device_key`` property identifies the device).
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self, *args, **kwargs):
+            scheduler = get_device_scheduler(self.device_key)
+            return scheduler.call(method, self, *args, priority=priority, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "DeviceScheduler",
+    "get_device_scheduler",
+    "RequestPriority",
+    "RequestStats",
+]
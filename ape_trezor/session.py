@@ -0,0 +1,105 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_SESSION_TTL = 15 * 60
+
+
+class SessionStore:
+    """
+    An on-disk store of device session IDs, keyed by device ID, so that another
+    process can resume the session (and its cached passphrase) instead of starting
+    a new one. Since a session ID unlocks the session's passphrase wallet, the file
+    is only readable by the current user and session IDs expire after a TTL.
+
+    Args:
+        path (Path): The path to the session file.
+        ttl (int): The number of seconds a session ID is kept after it was last used.
+          Set to ``0`` to not persist session IDs.
+    """
+
+    def __init__(self, path: Path, ttl: int = DEFAULT_SESSION_TTL):
+        self.path = path
+        self.ttl = ttl
+
+    @classmethod
+    def from_data_folder(cls) -> "SessionStore":
+        """
+        Get the session store in the Trezor plugin's data folder, using the
+        ``session_ttl`` from the ``trezor`` config.
+        """
+        from ape.utils.basemodel import ManagerAccessMixin
+
+        config_manager = ManagerAccessMixin.config_manager
+        ttl = getattr(config_manager.get_config("trezor"), "session_ttl", DEFAULT_SESSION_TTL)
+        # NOTE: Not next to the account files, which are all the `*.json` files there.
+        return cls(config_manager.DATA_FOLDER / "trezor" / "cache" / "sessions.json", ttl=ttl)
+
+    def get(self, device_id: str) -> Optional[bytes]:
+        """
+        Get the session ID of a device, or ``None`` when there is none or it expired.
+        """
+        entry = self._load().get(device_id)
+        if entry is None:
+            return None
+
+        return bytes.fromhex(entry["session_id"])
+
+    def get_latest(self) -> Optional[tuple[str, bytes]]:
+        """
+        Get the device ID and session ID of the most recently used session.
+        """
+        sessions = self._load()
+        if not sessions:
+            return None
+
+        device_id = max(sessions, key=lambda x: sessions[x]["expires"])
+        return device_id, bytes.fromhex(sessions[device_id]["session_id"])
+
+    def set(self, device_id: str, session_id: bytes):
+        """
+        Store the session ID of a device, renewing its TTL.
+        """
+        if self.ttl <= 0:
+            return
+
+        sessions = self._load()
+        sessions[device_id] = {"session_id": session_id.hex(), "expires": time.time() + self.ttl}
+        self._save(sessions)
+
+    def delete(self, device_id: str):
+        """
+        Forget the session ID of a device, e.g. when the device rejected it.
+        """
+        sessions = self._load()
+        if sessions.pop(device_id, None) is not None:
+            self._save(sessions)
+
+    def _load(self) -> dict[str, dict]:
+        if self.ttl <= 0 or not self.path.is_file():
+            return {}
+
+        try:
+            sessions = json.loads(self.path.read_text())
+            now = time.time()
+            return {
+                device_id: entry
+                for device_id, entry in sessions.items()
+                if entry["expires"] > now and bytes.fromhex(entry["session_id"])
+            }
+        except (ValueError, KeyError, TypeError, AttributeError):
+            # Corrupted store. It gets re-written on the next change.
+            return {}
+
+    def _save(self, sessions: dict[str, dict]):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.unlink(missing_ok=True)
+        # NOTE: Created with owner-only permissions, so the session IDs are never exposed.
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as file:
+            json.dump(sessions, file)
+
+        tmp_path.replace(self.path)
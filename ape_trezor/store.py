@@ -0,0 +1,356 @@
+import json
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Optional, Union
+
+from ape.logging import logger
+
+
+class JSONAccountStore:
+    """
+    Stores each Trezor account in its own ``<alias>.json`` file (the default).
+    Accounts are found by address using an in-memory index, which is built by
+    reading all the account files once and is kept up-to-date on saving and
+    deleting accounts. Each lookup lists the folder and compares each file's
+    modification time and size, so only the files added, removed or rewritten
+    by something else are read again.
+
+    Args:
+        folder (Path): The folder with the account files.
+    """
+
+    def __init__(self, folder: Path):
+        self.folder = folder
+        self._index: Optional[_AddressIndex] = None
+        # The (modification time, size) of each indexed account file, by alias.
+        self._index_stats: dict[str, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self._account_files)
+
+    @property
+    def _account_files(self) -> Iterator[Path]:
+        return self.folder.glob("*.json")
+
+    @property
+    def aliases(self) -> Iterator[str]:
+        for path in self._account_files:
+            yield path.stem
+
+    @property
+    def records(self) -> Iterator[tuple[str, Optional[dict]]]:
+        """
+        The alias of each account. The account data is read lazily
+        from the account files, so it is always ``None``.
+        """
+        for alias in self.aliases:
+            yield alias, None
+
+    def get_path(self, alias: str) -> Path:
+        return self.folder / f"{alias}.json"
+
+    def get(self, alias: str) -> Optional[dict]:
+        path = self.get_path(alias)
+        return json.loads(path.read_text()) if path.is_file() else None
+
+    def find_record(self, address: str) -> Optional[tuple[str, Optional[dict]]]:
+        """
+        Find an account by its address (case-insensitive).
+
+        Returns:
+            Optional[tuple[str, Optional[dict]]]: The alias and (always ``None``)
+            account data, or ``None`` when there is no account with the address.
+        """
+        alias = self._get_index().find(address)
+        return None if alias is None else (alias, None)
+
+    def save(self, alias: str, address: str, hd_path: str, device_id: Optional[str] = None):
+        account_data = _to_account_data(address, hd_path, device_id)
+        self.get_path(alias).write_text(json.dumps(account_data))
+        self._update_index(alias, address)
+
+    def save_many(self, accounts: Iterable[tuple[str, str, str]], device_id: Optional[str] = None):
+        """
+        Save many accounts, given as ``(alias, address, hd_path)`` tuples,
+        of the device with the given ID.
+        """
+        for alias, address, hd_path in accounts:
+            account_data = _to_account_data(address, hd_path, device_id)
+            self.get_path(alias).write_text(json.dumps(account_data))
+            self._update_index(alias, address)
+
+    def delete(self, alias: str):
+        path = self.get_path(alias)
+        if path.exists():
+            path.unlink()
+
+        self._update_index(alias)
+
+    def _get_index(self) -> "_AddressIndex":
+        if self._index is None:
+            self._index = _AddressIndex()
+            self._index_stats = {}
+
+        stats = self._get_file_stats()
+        for alias in set(self._index_stats) - set(stats):
+            # Removed by something else.
+            self._index.remove(alias)
+            del self._index_stats[alias]
+
+        for alias, stat in stats.items():
+            if self._index_stats.get(alias) != stat:
+                # Added or rewritten by something else.
+                self._index_stats[alias] = stat
+                self._index.remove(alias)
+                try:
+                    address = json.loads(self.get_path(alias).read_text())["address"]
+                except (OSError, ValueError, KeyError, TypeError):
+                    # Not an account file.
+                    continue
+
+                self._index.add(alias, address)
+
+        return self._index
+
+    def _update_index(self, alias: str, address: Optional[str] = None):
+        if self._index is None:
+            return
+
+        self._index.remove(alias)
+        self._index_stats.pop(alias, None)
+        if address is None:
+            return
+
+        self._index.add(alias, address)
+        if stat := self._get_file_stat(self.get_path(alias)):
+            self._index_stats[alias] = stat
+
+    def _get_file_stats(self) -> dict[str, tuple[int, int]]:
+        stats = {}
+        for path in self._account_files:
+            if stat := self._get_file_stat(path):
+                stats[path.stem] = stat
+
+        return stats
+
+    def _get_file_stat(self, path: Path) -> Optional[tuple[int, int]]:
+        try:
+            stat = path.stat()
+        except OSError:
+            # Removed meanwhile.
+            return None
+
+        return stat.st_mtime_ns, stat.st_size
+
+
+class _AddressIndex:
+    def __init__(self):
+        self._addresses: dict[str, str] = {}
+        self._aliases: dict[str, set[str]] = {}
+
+    def add(self, alias: str, address: str):
+        self.remove(alias)
+        address = address.lower()
+        self._addresses[alias] = address
+        self._aliases.setdefault(address, set()).add(alias)
+
+    def remove(self, alias: str):
+        address = self._addresses.pop(alias, None)
+        if address is None:
+            return
+
+        self._aliases[address].discard(alias)
+        if not self._aliases[address]:
+            del self._aliases[address]
+
+    def find(self, address: str) -> Optional[str]:
+        aliases = self._aliases.get(address.lower())
+        return min(aliases) if aliases else None
+
+
+class SQLiteAccountStore:
+    """
+    Stores all the Trezor accounts in a single SQLite database, indexed by alias
+    and by address, so listing and resolving accounts does not read a file per
+    account. When first created, the database imports the accounts from the
+    ``<alias>.json`` files in ``json_folder`` (the files are left as they are).
+    Deleting an account also deletes its ``<alias>.json`` file, so the account
+    does not come back when switching back to the JSON store.
+
+    Args:
+        path (Path): The path to the database file.
+        json_folder (Optional[Path]): The folder with the account files to import.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS accounts (
+            alias TEXT PRIMARY KEY,
+            address TEXT NOT NULL COLLATE NOCASE,
+            hdpath TEXT NOT NULL,
+            device_id TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS accounts_address ON accounts (address)",
+        "CREATE TABLE IF NOT EXISTS metadata (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    )
+
+    def __init__(self, path: Path, json_folder: Optional[Path] = None):
+        self.path = path
+        self.json_folder = json_folder
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._connect().execute("SELECT COUNT(*) FROM accounts").fetchone()
+
+        return count
+
+    @property
+    def aliases(self) -> Iterator[str]:
+        with self._lock:
+            rows = self._connect().execute("SELECT alias FROM accounts ORDER BY alias").fetchall()
+
+        for (alias,) in rows:
+            yield alias
+
+    @property
+    def records(self) -> Iterator[tuple[str, Optional[dict]]]:
+        """
+        The alias and data of each account.
+        """
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute("SELECT alias, address, hdpath, device_id FROM accounts ORDER BY alias")
+                .fetchall()
+            )
+
+        for alias, *account_row in rows:
+            yield alias, _to_account_data(*account_row)
+
+    def get(self, alias: str) -> Optional[dict]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT address, hdpath, device_id FROM accounts WHERE alias = ?", (alias,)
+                )
+                .fetchone()
+            )
+
+        return None if row is None else _to_account_data(*row)
+
+    def find_record(self, address: str) -> Optional[tuple[str, Optional[dict]]]:
+        """
+        Find an account by its address (case-insensitive), using the address index.
+
+        Returns:
+            Optional[tuple[str, Optional[dict]]]: The alias and account data,
+            or ``None`` when there is no account with the address.
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT alias, address, hdpath, device_id FROM accounts "
+                    "WHERE address = ? ORDER BY alias LIMIT 1",
+                    (address,),
+                )
+                .fetchone()
+            )
+
+        return None if row is None else (row[0], _to_account_data(*row[1:]))
+
+    def save(self, alias: str, address: str, hd_path: str, device_id: Optional[str] = None):
+        self.save_many([(alias, address, hd_path)], device_id=device_id)
+
+    def save_many(self, accounts: Iterable[tuple[str, str, str]], device_id: Optional[str] = None):
+        """
+        Save many accounts, given as ``(alias, address, hd_path)`` tuples,
+        of the device with the given ID, in a single transaction.
+        """
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany(
+                    "INSERT OR REPLACE INTO accounts (alias, address, hdpath, device_id) "
+                    "VALUES (?, ?, ?, ?)",
+                    ((*account, device_id) for account in accounts),
+                )
+
+    def delete(self, alias: str):
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM accounts WHERE alias = ?", (alias,))
+
+        if self.json_folder is not None:
+            (self.json_folder / f"{alias}.json").unlink(missing_ok=True)
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is not None:
+            return self._connection
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.path, check_same_thread=False)
+        with connection:
+            for statement in self.SCHEMA:
+                connection.execute(statement)
+
+            columns = {row[1] for row in connection.execute("PRAGMA table_info(accounts)")}
+            if "device_id" not in columns:
+                # Created before accounts were bound to devices.
+                connection.execute("ALTER TABLE accounts ADD COLUMN device_id TEXT")
+
+            migrated = connection.execute(
+                "SELECT value FROM metadata WHERE key = 'json_migrated'"
+            ).fetchone()
+            if not migrated:
+                self._migrate(connection)
+                connection.execute(
+                    "INSERT INTO metadata (key, value) VALUES ('json_migrated', '1')"
+                )
+
+        self._connection = connection
+        return connection
+
+    def _migrate(self, connection: sqlite3.Connection):
+        if self.json_folder is None:
+            return
+
+        rows = []
+        for path in sorted(self.json_folder.glob("*.json")):
+            try:
+                data = json.loads(path.read_text())
+                rows.append((path.stem, data["address"], data["hdpath"], data.get("device_id")))
+            except (ValueError, KeyError, TypeError):
+                logger.warning(f"Skipped migrating invalid Trezor account file '{path}'.")
+
+        connection.executemany(
+            "INSERT OR IGNORE INTO accounts (alias, address, hdpath, device_id) "
+            "VALUES (?, ?, ?, ?)",
+            rows,
+        )
+        if rows:
+            logger.info(f"Migrated {len(rows)} Trezor account(s) to '{self.path}'.")
+
+
+def _to_account_data(address: str, hd_path: str, device_id: Optional[str] = None) -> dict:
+    account_data = {"address": address, "hdpath": hd_path}
+    if device_id is not None:
+        account_data["device_id"] = device_id
+
+    return account_data
+
+
+AccountStore = Union[JSONAccountStore, SQLiteAccountStore]
@@ -0,0 +1,66 @@
+import json
+from pathlib import Path
+from tempfile import mkdtemp
+
+import ape
+import pytest
+
+from ape_trezor.accounts import AccountContainer, TrezorAccount
+from ape_trezor.emulator import create_emulator_client
+
+ape.config.DATA_FOLDER = Path(mkdtemp()).resolve()
+
+ADDRESS = "0xAb5801a7D398351b8bE11C439e05C5B3259aeC9B"
+HD_PATH = "m/44'/1'/0'/0/0"
+
+# Seconds each message takes on the emulated device.
+DEVICE_LATENCY = 0.002
+
+
+class StubAccountClient:
+    """
+    Returns a fixed signature so only the account-side work is measured.
+    """
+
+    SIGNATURE = (27, b"\x01" * 32, b"\x02" * 32)
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: self.SIGNATURE
+
+
+@pytest.fixture(scope="session")
+def stub_client():
+    return StubAccountClient()
+
+
+@pytest.fixture(scope="session")
+def trezor_account(tmp_path_factory, stub_client):
+    path = tmp_path_factory.mktemp("account") / "bench.json"
+    path.write_text(json.dumps({"address": ADDRESS, "hdpath": HD_PATH}))
+    account = TrezorAccount(account_file_path=path)
+    account.__dict__["client"] = stub_client
+    return account
+
+
+@pytest.fixture(scope="session")
+def make_container(tmp_path_factory):
+    containers: dict[int, AccountContainer] = {}
+
+    def fn(num_accounts: int) -> AccountContainer:
+        if num_accounts not in containers:
+            data_folder = tmp_path_factory.mktemp(f"trezor_{num_accounts}")
+            container = AccountContainer(name="trezor", account_type=TrezorAccount)
+            container.__dict__["data_folder"] = data_folder
+            for index in range(num_accounts):
+                container.save_account(f"account_{index}", ADDRESS, f"{HD_PATH[:-2]}/{index}")
+
+            containers[num_accounts] = container
+
+        return containers[num_accounts]
+
+    return fn
+
+
+@pytest.fixture
+def emulator_client():
+    return create_emulator_client(latency=DEVICE_LATENCY)
@@ -0,0 +1,99 @@
+import pytest
+from ape_ethereum.transactions import DynamicFeeTransaction, StaticFeeTransaction
+from eip712 import EIP712Message
+from eip712.messages import extract_eip712_struct_message
+from eth_account.messages import encode_defunct, encode_typed_data
+from eth_pydantic_types import abi
+
+from ape_trezor.hdpath import HDBasePath, HDPath
+
+TO_ADDRESS = "0xE3747e6341E0d3430e6Ea9e2346cdDCc2F8a4b5b"
+CALLDATA_SIZES = {"small": 4, "large": 64 * 1024}
+ACCESS_LIST_SIZES = (0, 32)
+
+
+class Mail(EIP712Message):
+    contents: abi.string
+
+
+MAIL = Mail(contents="Hello, Bob!", eip712_name="Ether Mail", eip712_version="1")
+TYPED_DATA = extract_eip712_struct_message(MAIL)
+
+
+def _access_list(size: int) -> list[dict]:
+    return [
+        {"address": TO_ADDRESS, "storageKeys": [f"0x{index:064x}" for index in range(4)]}
+        for _ in range(size)
+    ]
+
+
+@pytest.mark.parametrize("calldata", CALLDATA_SIZES)
+def test_sign_static_fee_transaction(benchmark, trezor_account, calldata):
+    txn = StaticFeeTransaction(
+        chainId=1,
+        to=TO_ADDRESS,
+        gas=21000,
+        nonce=0,
+        value=1,
+        gasPrice=1,
+        data=b"\x01" * CALLDATA_SIZES[calldata],
+    )
+    benchmark(trezor_account.sign_transaction, txn)
+
+
+@pytest.mark.parametrize("access_list_size", ACCESS_LIST_SIZES)
+@pytest.mark.parametrize("calldata", CALLDATA_SIZES)
+def test_sign_dynamic_fee_transaction(benchmark, trezor_account, calldata, access_list_size):
+    txn = DynamicFeeTransaction(
+        chainId=1,
+        to=TO_ADDRESS,
+        gas=21000,
+        nonce=0,
+        value=1,
+        maxFeePerGas=2,
+        maxPriorityFeePerGas=1,
+        data=b"\x01" * CALLDATA_SIZES[calldata],
+        accessList=_access_list(access_list_size),
+    )
+    benchmark(trezor_account.sign_transaction, txn)
+
+
+@pytest.mark.parametrize(
+    "message",
+    (
+        MAIL,
+        TYPED_DATA,
+        encode_defunct(text="Hello Apes"),
+        encode_typed_data(full_message=TYPED_DATA),
+        "Hello Apes",
+        12345678,
+        b"Hello Apes",
+    ),
+    ids=("eip712", "dict", "eip191", "typed_hash", "str", "int", "bytes"),
+)
+def test_sign_message(benchmark, trezor_account, message):
+    benchmark(trezor_account.sign_message, message)
+
+
+def test_hd_path_address_n(benchmark):
+    benchmark(lambda: HDPath("m/44'/60'/0'/0/12345").address_n)
+
+
+def test_hd_path_iter_children(benchmark):
+    base_path = HDBasePath("m/44'/1'/0'/0")
+    benchmark(lambda: [p.address_n for p in base_path.iter_children(0, 1000)])
+
+
+@pytest.mark.parametrize("num_accounts", (10, 1_000, 10_000))
+class TestAccountContainer:
+    def test_accounts(self, benchmark, make_container, num_accounts):
+        container = make_container(num_accounts)
+        benchmark(lambda: [a.address for a in container.accounts])
+
+    def test_aliases(self, benchmark, make_container, num_accounts):
+        container = make_container(num_accounts)
+        benchmark(lambda: list(container.aliases))
+
+    def test_len(self, benchmark, make_container, num_accounts):
+        container = make_container(num_accounts)
+        benchmark(len, container)
@@ -0,0 +1,18 @@
+import pytest
+
+from ape_trezor.choices import AddressPromptChoice
+from ape_trezor.client import TrezorClient
+from ape_trezor.hdpath import HDBasePath
+
+
+@pytest.mark.parametrize("derive_locally", (False, True), ids=("device", "local"))
+def test_load_choices(benchmark, emulator_client, derive_locally):
+    hd_path = HDBasePath()
+
+    def load_choices():
+        client = TrezorClient(hd_path, client=emulator_client, derive_locally=derive_locally)
+        choices = AddressPromptChoice(client, hd_path, prefetch=None)
+        choices._load_choices()
+        choices._shutdown()
+
+    benchmark(load_choices)
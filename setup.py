@@ -7,6 +7,7 @@ extras_require = {
         "pytest-xdist",  # Multi-process runner
         "pytest-cov",  # Coverage analyzer plugin
         "pytest-mock",  # For creating mocks
+        "pytest-benchmark",  # For the benchmarks suite
         "hypothesis>=6.2.0,<7.0",  # Strategy-based fuzzer
     ],
     "lint": [
@@ -72,6 +73,7 @@ setup(
         "eth-ape>=0.8.43,<0.9",
         "click>=8.1.8,<9",
         "trezor[ethereum]>=0.13.9,<0.14",
+        "slip10>=1.0.1,<2",  # Host-side HD public key derivation
         # ApeWorX packages
         "eth-pydantic-types>=0.2.0,<0.3",
         "eip712>=0.3",
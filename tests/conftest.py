@@ -8,14 +8,18 @@ from ape._cli import cli as root_ape_cli
 from click.testing import CliRunner
 from eth_pydantic_types import HexBytes
 from eth_typing import HexAddress, HexStr
+from mnemonic import Mnemonic
+from slip10 import SLIP10
 
 from ape_trezor import _cli
+from ape_trezor.derivation import PublicNode
 from ape_trezor.hdpath import HDBasePath, HDPath
 from ape_trezor.utils import DEFAULT_ETHEREUM_HD_PATH
 
 ape.config.DATA_FOLDER = Path(mkdtemp()).resolve()
 
 TEST_ADDRESS = HexAddress(HexStr("0x0A78AAAAA2122100000b9046f0A085AB2E111113"))
+TEST_MNEMONIC = " ".join(["abandon"] * 11 + ["about"])
 
 
 @pytest.fixture(scope="session")
@@ -98,3 +102,11 @@ def hd_path():
 @pytest.fixture(scope="session")
 def account_hd_path():
     return HDPath("m/44'/60'/0'/1")
+
+
+@pytest.fixture(scope="session")
+def public_node(hd_path):
+    # The public node of the default HD path for the "abandon ... about" test mnemonic.
+    seed = Mnemonic.to_seed(TEST_MNEMONIC)
+    chain_code, public_key = SLIP10.from_seed(seed).get_extended_pubkey_from_path(hd_path.path)
+    return PublicNode(public_key, chain_code)
@@ -1,7 +1,14 @@
+import asyncio
+import json
+from pathlib import Path
+
 import pytest
 from ape_ethereum.transactions import DynamicFeeTransaction, StaticFeeTransaction
 from eth_account.messages import encode_defunct
 
+from ape_trezor.accounts import TrezorAccount
+from ape_trezor.client import TrezorAccountClient
+
 
 @pytest.fixture
 def trezor_account(mocker, accounts, address, account_hd_path, mock_client):
@@ -61,6 +68,30 @@ def test_sign_personal_message(trezor_account, mock_client, constants):
     mock_client.sign_personal_message.assert_called_once_with(b"Hello Apes")
 
 
+def test_async_sign_message(mocker, trezor_account, address, account_hd_path, constants):
+    device_client = mocker.MagicMock()
+    account_client = TrezorAccountClient(address, account_hd_path, client=device_client)
+    trezor_account.__dict__["client"] = account_client
+    patch = mocker.patch("ape_trezor.client.sign_message")
+    patch.return_value.signature = constants.SIG_R + constants.SIG_S + bytes([constants.SIG_V])
+    actual = asyncio.run(trezor_account.async_sign_message("Hello Apes", timeout=5))
+    assert actual.v == constants.SIG_V
+    assert actual.r == constants.SIG_R
+    assert actual.s == constants.SIG_S
+    patch.assert_called_once_with(device_client, account_hd_path.address_n, b"Hello Apes")
+
+
+def test_sign_messages(trezor_account, mock_client, constants):
+    mock_client.sign_personal_message.return_value = (
+        constants.SIG_V,
+        constants.SIG_R,
+        constants.SIG_S,
+    )
+    signatures = trezor_account.sign_messages(["Hello", "Apes"])
+    assert [s.v for s in signatures] == [constants.SIG_V] * 2
+    assert mock_client.sign_personal_message.call_count == 2
+
+
 def test_sign_static_fee_transaction(
     trezor_account, static_fee_transaction, mock_client, constants
 ):
@@ -107,3 +138,37 @@ def test_sign_dynamic_fee_transaction(
         max_priority_fee=constants.MAX_PRIORITY_FEE_PER_GAS,
         access_list=[],
     )
+
+
+def test_sign_transactions(
+    trezor_account, static_fee_transaction, dynamic_fee_transaction, mock_client, constants
+):
+    signature = (constants.SIG_V, constants.SIG_R, constants.SIG_S)
+    mock_client.sign_batch.side_effect = lambda txns: [signature for _ in txns]
+    actual = trezor_account.sign_transactions([static_fee_transaction, dynamic_fee_transaction])
+    assert actual == [static_fee_transaction, dynamic_fee_transaction]
+    assert all(t.signature.v == constants.SIG_V for t in actual)
+    assert mock_client.sign_batch.call_count == 1
+
+
+def test_account_file_is_cached(mocker, tmp_path, key_file_data):
+    account_file_path = tmp_path / "cached.json"
+    account_file_path.write_text(json.dumps(key_file_data))
+    account = TrezorAccount(account_file_path=account_file_path)
+    read_text = mocker.spy(Path, "read_text")
+
+    assert account.account_file == key_file_data
+    assert account.address == key_file_data["address"]
+    hd_path = account.hd_path
+    assert account.hd_path is hd_path
+    assert _count_reads(read_text, account_file_path) == 1
+
+    # Changing the file invalidates the cache.
+    new_hd_path = "m/44'/60'/0'/0/12"
+    account_file_path.write_text(json.dumps({**key_file_data, "hdpath": new_hd_path}))
+    assert account.hd_path.path == new_hd_path
+    assert _count_reads(read_text, account_file_path) == 2
+
+
+def _count_reads(read_text, path: Path) -> int:
+    return len([c for c in read_text.call_args_list if c.args[0] == path])
@@ -0,0 +1,87 @@
+import io
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from ape_trezor.bulk import (
+    iter_chunks,
+    map_chunks,
+    read_messages,
+    read_rows,
+    recover_signer,
+    resume_jsonl,
+    to_signable_message,
+    verify_messages,
+)
+
+
+def _double(chunk: list[int]) -> list[int]:
+    return [2 * x for x in chunk]
+
+
+@pytest.fixture(scope="module")
+def signer():
+    return Account.create()
+
+
+@pytest.fixture(scope="module")
+def signed_rows(signer):
+    return [
+        {"message": m, "signature": signer.sign_message(encode_defunct(text=m)).signature.hex()}
+        for m in ("a", "b", "c")
+    ]
+
+
+def test_iter_chunks():
+    assert list(iter_chunks(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+
+@pytest.mark.parametrize("max_workers", (1, 2))
+def test_map_chunks(max_workers):
+    results = map_chunks(_double, iter(range(100)), chunk_size=7, max_workers=max_workers)
+    assert list(results) == [2 * x for x in range(100)]
+
+
+def test_read_rows():
+    jsonl = io.StringIO('{"message": "a", "signature": "0x01"}\n\n{"message": "b"}\n')
+    assert list(read_rows(jsonl, "jsonl")) == [
+        {"message": "a", "signature": "0x01"},
+        {"message": "b"},
+    ]
+    csv = io.StringIO("message,signature\na,0x01\n")
+    assert list(read_rows(csv, "csv")) == [{"message": "a", "signature": "0x01"}]
+
+
+def test_verify_messages(signer, signed_rows):
+    rows = [*signed_rows, {"message": "d", "signature": "0x1234"}, {"message": "e"}]
+    aliases = {signer.address.lower(): "signer"}
+    results = list(verify_messages(rows, aliases, chunk_size=2, max_workers=1))
+
+    assert [r["message"] for r in results] == ["a", "b", "c", "d", "e"]
+    assert all(r["signer"] == signer.address for r in results[:3])
+    assert all(r["alias"] == "signer" for r in results[:3])
+    assert results[3]["signer"] is None
+    assert results[3]["error"]
+    assert results[4]["error"] == "Missing field 'signature'."
+
+
+def test_read_messages():
+    assert list(read_messages(io.StringIO("a\n\nb c\n"), "text")) == ["a", "", "b c"]
+    assert list(read_messages(io.StringIO("0x01\n\n0x02\n"), "hex")) == ["0x01", "0x02"]
+    assert list(read_messages(io.StringIO('{"a": 1}\n'), "eip712")) == [{"a": 1}]
+
+
+@pytest.mark.parametrize("message,message_type", (("Hello Apes", "text"), ("0xdeadbeef", "hex")))
+def test_recover_signer(signer, message, message_type):
+    signature = signer.sign_message(to_signable_message(message, message_type)).signature
+    assert recover_signer(message, message_type, signature) == signer.address
+
+
+def test_resume_jsonl(tmp_path):
+    path = tmp_path / "results.jsonl"
+    assert resume_jsonl(path) == 0
+
+    path.write_text('{"index": 0}\n{"index": 1}\n{"ind')
+    assert resume_jsonl(path) == 2
+    assert path.read_text() == '{"index": 0}\n{"index": 1}\n'
@@ -0,0 +1,72 @@
+import pytest
+
+from ape_trezor.cache import AddressCache
+
+DEVICE_ID = "DEVICE_ID"
+HD_PATH = "m/44'/60'/0'/0/0"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AddressCache(tmp_path / "addresses.json", max_size=2)
+
+
+def test_get_when_not_cached(cache):
+    assert cache.get(DEVICE_ID, "", HD_PATH) is None
+
+
+def test_set(cache, address):
+    cache.set(DEVICE_ID, "", HD_PATH, address)
+    assert cache.get(DEVICE_ID, "", HD_PATH) == address
+    assert cache.get(DEVICE_ID, "other-wallet", HD_PATH) is None
+
+    # Persisted to disk.
+    assert AddressCache(cache.path).get(DEVICE_ID, "", HD_PATH) == address
+
+
+def test_set_evicts_least_recently_used(cache, address):
+    cache.set(DEVICE_ID, "", "m/0", address)
+    cache.set(DEVICE_ID, "", "m/1", address)
+    cache.get(DEVICE_ID, "", "m/0")
+    cache.set(DEVICE_ID, "", "m/2", address)
+    assert len(cache) == 2
+    assert cache.get(DEVICE_ID, "", "m/1") is None
+    assert cache.get(DEVICE_ID, "", "m/0") == address
+
+
+def test_set_different_device_invalidates(cache, address):
+    cache.set(DEVICE_ID, "", HD_PATH, address)
+    cache.set("OTHER_DEVICE_ID", "", "m/0", address)
+    assert len(cache) == 1
+    assert cache.get(DEVICE_ID, "", HD_PATH) is None
+
+
+def test_load_corrupted(cache, address):
+    cache.path.write_text("{not json")
+    assert cache.get(DEVICE_ID, "", HD_PATH) is None
+    cache.set(DEVICE_ID, "", HD_PATH, address)
+    assert AddressCache(cache.path).get(DEVICE_ID, "", HD_PATH) == address
+
+
+def test_clear(cache, address):
+    cache.set(DEVICE_ID, "", HD_PATH, address)
+    cache.clear()
+    assert len(cache) == 0
+    assert not cache.path.is_file()
+
+
+def test_batch(mocker, cache, address):
+    save = mocker.spy(cache, "_save")
+    with cache.batch():
+        cache.set(DEVICE_ID, "", "m/0", address)
+        cache.set(DEVICE_ID, "", "m/1", address)
+        assert not cache.path.exists()
+
+    save.assert_called_once_with()
+    assert AddressCache(cache.path).get(DEVICE_ID, "", "m/1") == address
+
+
+def test_save_leaves_no_temporary_files(cache, address):
+    cache.set(DEVICE_ID, "", HD_PATH, address)
+    cache.set(DEVICE_ID, "", "m/1", address)
+    assert [p.name for p in cache.path.parent.iterdir()] == [cache.path.name]
@@ -1,5 +1,8 @@
+import pytest
+
 from ape_trezor.choices import AddressPromptChoice
 from ape_trezor.hdpath import HDBasePath
+from ape_trezor.scheduler import RequestPriority
 
 
 def test_get_user_selected_account(mocker, mock_client, address):
@@ -18,3 +21,30 @@ def test_get_user_selected_account(mocker, mock_client, address):
     selected_address, hdpath = choices.get_user_selected_account()
     assert selected_address == address
     assert str(hdpath) == "m/44'/60'/0'/0/1"
+
+
+def test_prefetch_next_page(mock_client):
+    mock_client.get_account_path.side_effect = lambda account_id, **_: f"address_{account_id}"
+    choices = AddressPromptChoice(mock_client, HDBasePath(), page_size=2)
+    choices._load_choices()
+    choices._prefetch_choices()
+    assert choices._request_address(3).result() == "address_3"
+    assert mock_client.get_account_path.call_count == 4
+
+    # The shown page is loaded first, before the prefetched (background) one.
+    priorities = [c.kwargs["priority"] for c in mock_client.get_account_path.call_args_list]
+    assert priorities == [RequestPriority.DEFAULT] * 2 + [RequestPriority.BACKGROUND] * 2
+
+    # Paging forward uses the prefetched addresses.
+    choices._page_from_choice("n")
+    choices._load_choices()
+    assert choices.choices == ["address_2", "address_3"]
+    assert mock_client.get_account_path.call_count == 4
+
+    choices._shutdown()
+    assert choices._executor is None
+
+
+def test_invalid_prefetch(mock_client):
+    with pytest.raises(ValueError, match="Invalid prefetch mode 'nxt'"):
+        AddressPromptChoice(mock_client, HDBasePath(), prefetch="nxt")
@@ -1,9 +1,23 @@
+import json
+import subprocess
+import sys
+
 import pytest
 from ape.logging import LogLevel
 from ape.utils import ZERO_ADDRESS
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_utils import to_checksum_address
+
+from ape_trezor.client import TrezorAccountClient
+from ape_trezor.emulator import create_emulator_client
+from ape_trezor.hdpath import HDPath
 
 NEW_ACCOUNT_ALIAS = "NEW_ACCOUNT"
 
+# Microseconds it may take to import the CLI module (including its imports).
+IMPORT_TIME_BUDGET = 500_000
+
 
 @pytest.fixture
 def clean(accounts):
@@ -27,6 +41,10 @@ def mock_client_factory(mocker):
 @pytest.fixture
 def mock_client(mocker, mock_client_factory):
     mock_client = mocker.MagicMock()
+    mock_client.device_id = "DEVICE_ID"
+    mock_client.get_account_paths.side_effect = lambda ids: [
+        mock_client.get_account_path(i) for i in ids
+    ]
     mock_client_factory.return_value = mock_client
     return mock_client
 
@@ -75,6 +93,173 @@ def test_add_uses_hd_path_from_config(
     assert str(account.hd_path) == "m/1'/60'/0'/0/0"
 
 
+def test_add_verify(mock_client, runner, cli, clean, mock_client_factory):
+    mock_client.get_account_path.return_value = ZERO_ADDRESS
+    result = runner.invoke(cli, ("add", NEW_ACCOUNT_ALIAS, "--verify"), input="0\n")
+    assert result.exit_code == 0, result.output
+    assert mock_client_factory.call_args[1]["derive_locally"] is True
+    mock_client.verify_account_path.assert_called_once_with(0, ZERO_ADDRESS)
+
+
+def test_devices(mocker, runner, cli):
+    mocker.patch(
+        "ape_trezor.client.device_sessions.enumerate_devices",
+        return_value=["DEVICE_A", "DEVICE_B"],
+    )
+    result = runner.invoke(cli, ("devices",))
+    assert result.exit_code == 0, result.output
+    assert result.output.split() == ["DEVICE_A", "DEVICE_B"]
+
+
+def test_add_range(mock_client, runner, cli, accounts, mock_client_factory):
+    mock_client.get_account_path.side_effect = lambda i: to_checksum_address(f"0x{i + 1:040x}")
+    container = accounts.containers["trezor"]
+    args = ("add-range", "--start", "5", "--count", "3", "--alias-template", "bulk-{i}")
+    try:
+        result = runner.invoke(cli, (*args, "--hd-path", "m/44'/1'/0'/0"))
+        assert result.exit_code == 0, result.output
+        assert mock_client_factory.call_args[1]["derive_locally"] is True
+        account = accounts.load("bulk-6")
+        assert account.address == to_checksum_address(f"0x{7:040x}")
+        assert str(account.hd_path) == "m/44'/1'/0'/0/6"
+        # Only bound to the device when given its ID.
+        assert account.device_id is None
+        assert {"bulk-5", "bulk-7"} <= set(container.aliases)
+
+        # Does not overwrite existing accounts.
+        result = runner.invoke(cli, args)
+        assert result.exit_code != 0
+        assert "Aliases already in use: bulk-5, bulk-6, bulk-7." in result.output
+
+    finally:
+        for i in range(5, 8):
+            container.delete_account(f"bulk-{i}")
+
+
+@pytest.mark.parametrize(
+    "args,error",
+    (
+        (("--start", "-1", "--count", "1"), "-1 is not in the range x>=0"),
+        (("--count", "0"), "0 is not in the range x>=1"),
+        (("--start", "2147483647", "--count", "2"), "exceeds the maximum account index"),
+    ),
+)
+def test_add_range_invalid_range(mock_client, runner, cli, args, error):
+    result = runner.invoke(cli, ("add-range", *args, "--alias-template", "ops-{i}"))
+    assert result.exit_code != 0
+    assert error in result.output
+    mock_client.get_account_path.assert_not_called()
+
+
+@pytest.mark.parametrize("alias_template", ("ops-{i}-{j}", "ops-{0}", "ops-{i!z}", "ops-{"))
+def test_add_range_invalid_alias_template(mock_client, runner, cli, alias_template):
+    args = ("add-range", "--count", "2", "--alias-template", alias_template)
+    result = runner.invoke(cli, args)
+    assert result.exit_code != 0
+    assert f"Invalid alias template '{alias_template}'" in result.output
+    mock_client.get_account_path.assert_not_called()
+
+
+def test_add_range_with_device_id(mock_client, runner, cli, accounts, mock_client_factory):
+    mock_client.get_account_path.side_effect = lambda i: to_checksum_address(f"0x{i + 1:040x}")
+    container = accounts.containers["trezor"]
+    args = ("add-range", "--count", "2", "--alias-template", "device-{i}")
+    try:
+        result = runner.invoke(cli, (*args, "--device-id", "DEVICE_ID"))
+        assert result.exit_code == 0, result.output
+        assert mock_client_factory.call_args[1]["device_id"] == "DEVICE_ID"
+        assert accounts.load("device-1").device_id == "DEVICE_ID"
+
+    finally:
+        for i in range(2):
+            container.delete_account(f"device-{i}")
+
+
+def test_discover(mock_client, runner, cli, accounts):
+    # The test accounts are funded on the local test network.
+    funded = [a.address for a in accounts.test_accounts][:3]
+    mock_client.get_account_path.side_effect = lambda i: (
+        funded[i] if i < len(funded) else to_checksum_address(f"0x{i + 1:040x}")
+    )
+    container = accounts.containers["trezor"]
+    args = ("discover", "--network", "ethereum:local:test", "--gap-limit", "2")
+    try:
+        result = runner.invoke(cli, (*args, "--alias-template", "found-{i}"))
+        assert result.exit_code == 0, result.output
+        assert all(address in result.output for address in funded)
+        assert container.get_alias(funded[2]) == "found-2"
+
+    finally:
+        for i in range(len(funded)):
+            container.delete_account(f"found-{i}")
+
+
+@pytest.mark.parametrize("alias_template", ("found-{i}-{j}", "found-{0}"))
+def test_discover_invalid_alias_template(mock_client, runner, cli, alias_template):
+    result = runner.invoke(cli, ("discover", "--alias-template", alias_template))
+    assert result.exit_code != 0
+    assert f"Invalid alias template '{alias_template}'" in result.output
+    mock_client.get_account_path.assert_not_called()
+
+
+@pytest.mark.parametrize("workers", ("1", "2"))
+def test_export_addresses(mock_client, runner, cli, public_node, workers):
+    mock_client.public_node = public_node
+    args = ("export-addresses", "--count", "5", "--chunk-size", "2", "--workers", workers)
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    lines = result.output.splitlines()
+    assert lines[0] == "index,address,hd_path"
+    assert lines[1] == "0,0x9858EfFD232B4033E47d90003D41EC34EcaEda94,m/44'/60'/0'/0/0"
+    assert lines[2] == "1,0x6Fac4D18c912343BF86fa7049364Dd4E424Ab9C0,m/44'/60'/0'/0/1"
+    assert len(lines) == 6
+    mock_client.close.assert_called_once_with()
+
+
+def test_export_addresses_jsonl(mock_client, runner, cli, public_node):
+    mock_client.public_node = public_node
+    args = ("export-addresses", "--start", "1", "--count", "1", "--format", "jsonl")
+    result = runner.invoke(cli, (*args, "--workers", "1"))
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output) == {
+        "index": 1,
+        "address": "0x6Fac4D18c912343BF86fa7049364Dd4E424Ab9C0",
+        "hd_path": "m/44'/60'/0'/0/1",
+    }
+
+
+@pytest.mark.parametrize(
+    "args,error",
+    (
+        (("--start", "-1", "--count", "1"), "-1 is not in the range x>=0"),
+        (("--count", "-3"), "-3 is not in the range x>=1"),
+        (("--start", "2147483647", "--count", "2"), "exceeds the maximum account index"),
+    ),
+)
+def test_export_addresses_invalid_range(mock_client, runner, cli, args, error):
+    result = runner.invoke(cli, ("export-addresses", *args))
+    assert result.exit_code != 0
+    assert error in result.output
+    assert "index,address" not in result.output
+    mock_client.close.assert_not_called()
+
+
+def test_export_addresses_device_id(mock_client, runner, cli, public_node, mock_client_factory):
+    mock_client.public_node = public_node
+    args = ("export-addresses", "--count", "1", "--device-id", "DEVICE_ID", "--workers", "1")
+    result = runner.invoke(cli, args)
+    assert result.exit_code == 0, result.output
+    assert mock_client_factory.call_args[1]["device_id"] == "DEVICE_ID"
+
+
+@pytest.mark.parametrize("option", ("--chunk-size", "--workers"))
+def test_export_addresses_invalid_option(mock_client, runner, cli, option):
+    result = runner.invoke(cli, ("export-addresses", "--count", "5", option, "0"))
+    assert result.exit_code != 0
+    assert "0 is not in the range x>=1" in result.output
+    mock_client.close.assert_not_called()
+
+
 def test_list(runner, cli, existing_key_file):
     result = runner.invoke(cli, "list", catch_exceptions=False)
     assert result.exit_code == 0, result.output
@@ -98,3 +283,98 @@ def test_sign_message_when_account_does_not_exist(runner, cli):
     result = runner.invoke(cli, ("sign-message", alias, "MESSAGE"))
     assert result.exit_code != 0
     assert f"Account with alias '{alias}' does not exist." in result.output
+
+
+def test_verify_message(runner, cli, accounts, clean):
+    signer = Account.create()
+    signature = signer.sign_message(encode_defunct(text="MESSAGE")).signature.hex()
+    container = accounts.containers["trezor"]
+
+    result = runner.invoke(cli, ("verify-message", "MESSAGE", signature))
+    assert result.exit_code == 0, result.output
+    assert f"Signer: {signer.address}  n/a" in result.output
+
+    container.save_account(NEW_ACCOUNT_ALIAS, signer.address, "m/44'/60'/0'/0/0")
+    result = runner.invoke(cli, ("verify-message", "MESSAGE", signature))
+    assert result.exit_code == 0, result.output
+    assert f"Signer: {signer.address}  {NEW_ACCOUNT_ALIAS}" in result.output
+
+
+def test_verify_messages(runner, cli):
+    signer = Account.create()
+    signature = signer.sign_message(encode_defunct(text="MESSAGE")).signature.hex()
+    input_lines = [json.dumps({"message": "MESSAGE", "signature": signature})] * 3
+    result = runner.invoke(cli, ("verify-messages", "--workers", "1"), input="\n".join(input_lines))
+    assert result.exit_code == 0, result.output
+    results = [json.loads(line) for line in result.output.splitlines()]
+    assert [r["signer"] for r in results] == [signer.address] * 3
+    assert all(r["alias"] is None for r in results)
+
+
+def test_sign_messages_invalid_workers(runner, cli):
+    result = runner.invoke(cli, ("sign-messages", NEW_ACCOUNT_ALIAS, "--workers", "0"), input="")
+    assert result.exit_code != 0
+    assert "0 is not in the range x>=1" in result.output
+
+
+@pytest.mark.parametrize("option", ("--chunk-size", "--workers"))
+def test_verify_messages_invalid_option(runner, cli, option):
+    result = runner.invoke(cli, ("verify-messages", option, "0"), input="")
+    assert result.exit_code != 0
+    assert "0 is not in the range x>=1" in result.output
+
+
+def test_sign_messages(mocker, runner, cli, accounts, clean, tmp_path):
+    emulator_client = create_emulator_client()
+    hd_path = HDPath("m/44'/1'/0'/0/0")
+    address = emulator_client.transport.get_address(hd_path.address_n)
+    accounts.containers["trezor"].save_account(NEW_ACCOUNT_ALIAS, address, hd_path.path)
+    mocker.patch(
+        "ape_trezor.accounts._create_client",
+        return_value=TrezorAccountClient(address, hd_path, client=emulator_client),
+    )
+    output = tmp_path / "signatures.jsonl"
+
+    # Resumes after the first (and a partially written) result.
+    first_result = {"index": 0, "message": "first", "signature": "0x00"}
+    output.write_text(f'{json.dumps(first_result)}\n{{"index": 1')
+    result = runner.invoke(
+        cli,
+        ("sign-messages", NEW_ACCOUNT_ALIAS, "--output", str(output)),
+        input="first\nsecond\nthird\n",
+    )
+    assert result.exit_code == 0, result.output
+
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r["message"] for r in results] == ["first", "second", "third"]
+    assert [r["index"] for r in results] == [0, 1, 2]
+    signature = results[1]["signature"]
+    assert Account.recover_message(encode_defunct(text="second"), signature=signature) == address
+    assert emulator_client.transport.message_counts["EthereumSignMessage"] == 2
+
+
+def test_import_time():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import ape_trezor._cli"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = line.split("|")
+        imports[name.strip()] = int(cumulative)
+
+    # `trezorctl` is only imported when using `ape trezor ctl`.
+    assert "trezorlib.cli.trezorctl" not in imports
+    assert imports["ape_trezor._cli"] < IMPORT_TIME_BUDGET
+
+
+def test_ctl(runner, cli):
+    result = runner.invoke(cli, ("ctl", "--help"), catch_exceptions=False)
+    assert result.exit_code == 0, result.output
+    assert "This is the trezor-maintained cli from `trezorlib`" in result.output
+    assert "ethereum" in result.output
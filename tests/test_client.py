@@ -1,15 +1,41 @@
+import asyncio
+import threading
+import time
+
 import ape
 import pytest
 from ape.logging import LogLevel
+from ape.utils import ZERO_ADDRESS
 from eth_pydantic_types import HexBytes
-from trezorlib.messages import SafetyCheckLevel
-
-from ape_trezor.client import TrezorAccountClient, TrezorClient, extract_signature_vrs_bytes
+from trezorlib.exceptions import TrezorFailure
+from trezorlib.messages import Failure, FailureType, SafetyCheckLevel
+from trezorlib.transport import TransportException
+
+from ape_trezor.cache import AddressCache
+from ape_trezor.client import (
+    DeviceSessionRegistry,
+    TransportResolver,
+    TrezorAccountClient,
+    TrezorClient,
+    device_sessions,
+    extract_signature_vrs_bytes,
+)
+from ape_trezor.emulator import create_emulator_client
+from ape_trezor.exceptions import TrezorClientError
+from ape_trezor.hdpath import HDPath
+from ape_trezor.scheduler import get_device_scheduler
+from ape_trezor.session import SessionStore
+
+SESSION_ID = bytes(range(32))
+TRANSPORT_PATH = "webusb:001:1"
 
 
 @pytest.fixture
 def mock_device_client(mocker):
-    return mocker.MagicMock()
+    client = mocker.MagicMock()
+    client.features.safety_checks = SafetyCheckLevel.Strict
+    client.transport.get_path.return_value = TRANSPORT_PATH
+    return client
 
 
 @pytest.fixture
@@ -37,6 +63,12 @@ def signature():
     )
 
 
+@pytest.fixture(autouse=True)
+def clean_device_sessions():
+    yield
+    device_sessions.close()
+
+
 @pytest.fixture(autouse=True)
 def apply_settings_patch(mocker):
     return mocker.patch("ape_trezor.client.apply_settings")
@@ -87,6 +119,271 @@ class TestTrezorClient:
         actual = client.get_account_path(1)
         assert actual == address
 
+    def test_get_account_path_derive_locally(
+        self, mocker, hd_path, mock_device_client, mock_get_address, public_node
+    ):
+        patch = mocker.patch("ape_trezor.client.get_public_node")
+        patch.return_value.node.public_key = public_node.public_key
+        patch.return_value.node.chain_code = public_node.chain_code
+        client = TrezorClient(hd_path, client=mock_device_client, derive_locally=True)
+
+        assert client.get_account_path(0) == "0x9858EfFD232B4033E47d90003D41EC34EcaEda94"
+        assert client.get_account_path(1) == "0x6Fac4D18c912343BF86fa7049364Dd4E424Ab9C0"
+
+        # The public node is only requested once and addresses are never fetched.
+        patch.assert_called_once_with(mock_device_client, hd_path.address_n)
+        assert mock_get_address.call_count == 0
+
+    def test_get_account_path_uses_cache(
+        self, tmp_path, hd_path, mock_device_client, mock_get_address, address
+    ):
+        mock_device_client.features.device_id = "DEVICE_ID"
+        mock_device_client.features.passphrase_protection = False
+        mock_get_address.return_value = address
+        cache = AddressCache(tmp_path / "addresses.json")
+        client = TrezorClient(hd_path, client=mock_device_client, address_cache=cache)
+        assert client.get_account_path(1) == address
+        assert client.get_account_path(1) == address
+        assert mock_get_address.call_count == 1
+        assert cache.get("DEVICE_ID", "", "m/44'/60'/0'/0/1") == address
+
+    def test_get_account_paths(
+        self, mocker, tmp_path, hd_path, mock_device_client, mock_get_address, address
+    ):
+        mock_device_client.features.device_id = "DEVICE_ID"
+        mock_device_client.features.passphrase_protection = False
+        mock_get_address.return_value = address
+        cache = AddressCache(tmp_path / "addresses.json")
+        save = mocker.spy(cache, "_save")
+        client = TrezorClient(hd_path, client=mock_device_client, address_cache=cache)
+        assert client.get_account_paths(range(3)) == [address] * 3
+        save.assert_called_once_with()
+
+    def test_verify_account_path(self, client, mock_get_address, address, hd_path):
+        mock_get_address.return_value = address
+        client.verify_account_path(1, address.lower())
+        mock_get_address.assert_called_once_with(
+            client.client, hd_path.get_account_path(1).address_n, show_display=True
+        )
+
+    def test_verify_account_path_mismatch(self, client, mock_get_address, address):
+        mock_get_address.return_value = address
+        with pytest.raises(TrezorClientError, match="Address mismatch"):
+            client.verify_account_path(1, ZERO_ADDRESS)
+
+
+class TestDeviceSessionRegistry:
+    def test_acquire_shares_connection(self, patch_create_default_client, mock_device_client):
+        mock_device_client.features.device_id = "DEVICE_ID"
+        client_0 = device_sessions.acquire()
+        client_1 = device_sessions.acquire("DEVICE_ID")
+        assert client_0 == client_1 == mock_device_client
+        assert patch_create_default_client.call_count == 1
+        assert mock_device_client.open.call_count == 1
+
+    def test_acquire_device_not_connected(
+        self, mocker, patch_create_default_client, mock_device_client
+    ):
+        mocker.patch("ape_trezor.client.enumerate_devices", return_value=[])
+        mock_device_client.features.device_id = "DEVICE_ID"
+        with pytest.raises(TrezorClientError, match="'OTHER_DEVICE_ID' is not connected"):
+            device_sessions.acquire("OTHER_DEVICE_ID")
+
+    def test_release(self, patch_create_default_client, mock_device_client):
+        client = device_sessions.acquire()
+        device_sessions.acquire()
+        device_sessions.release(client)
+        assert len(device_sessions) == 1
+        assert mock_device_client.close.call_count == 0
+
+        device_sessions.release(client)
+        assert len(device_sessions) == 0
+        assert mock_device_client.close.call_count == 1
+
+    def test_open_and_close_on_scheduler_thread(
+        self, patch_create_default_client, mock_device_client
+    ):
+        mock_device_client.features.device_id = "DEVICE_ID"
+        threads = []
+        mock_device_client.open.side_effect = lambda: threads.append(
+            threading.current_thread().name
+        )
+        mock_device_client.close.side_effect = lambda: threads.append(
+            threading.current_thread().name
+        )
+        device_sessions.release(device_sessions.acquire())
+        assert threads == ["trezor-DEVICE_ID"] * 2
+
+    def test_account_clients_share_connection(
+        self, patch_create_default_client, address, account_hd_path, mock_device_client
+    ):
+        account_clients = [TrezorAccountClient(address, account_hd_path) for _ in range(5)]
+        assert all(c.client == mock_device_client for c in account_clients)
+        assert patch_create_default_client.call_count == 1
+
+        for account_client in account_clients:
+            account_client.close()
+
+        assert len(device_sessions) == 0
+        assert mock_device_client.close.call_count == 1
+
+    @pytest.fixture
+    def session_store(self, tmp_path):
+        return SessionStore(tmp_path / "sessions.json")
+
+    @pytest.fixture
+    def registry(self, session_store, tmp_path):
+        resolver = TransportResolver(tmp_path / "transport.json")
+        registry = DeviceSessionRegistry(session_store=session_store, transport_resolver=resolver)
+        yield registry
+        registry.close()
+
+    def test_acquire_resumes_session(
+        self, registry, session_store, patch_create_default_client, mock_device_client
+    ):
+        mock_device_client.features.device_id = "DEVICE_ID"
+        mock_device_client.session_id = SESSION_ID
+        session_store.set("DEVICE_ID", SESSION_ID)
+        registry.acquire()
+        patch_create_default_client.assert_called_once_with(session_id=SESSION_ID)
+        mock_device_client.init_device.assert_not_called()
+
+    def test_acquire_when_session_rejected(
+        self, registry, session_store, patch_create_default_client, mock_device_client
+    ):
+        mock_device_client.features.device_id = "DEVICE_ID"
+        mock_device_client.session_id = b"new"
+        session_store.set("DEVICE_ID", SESSION_ID)
+        patch_create_default_client.side_effect = (
+            TrezorFailure(Failure(code=FailureType.DataError, message="Invalid session")),
+            mock_device_client,
+        )
+        assert registry.acquire() == mock_device_client
+        assert patch_create_default_client.call_count == 2
+        assert session_store.get("DEVICE_ID") == b"new"
+        mock_device_client.init_device.assert_not_called()
+
+    def test_acquire_when_session_expired(
+        self, registry, session_store, patch_create_default_client, mock_device_client
+    ):
+        # The device silently starts a new session instead of resuming an expired one.
+        mock_device_client.features.device_id = "DEVICE_ID"
+        mock_device_client.session_id = b"new"
+        session_store.set("DEVICE_ID", SESSION_ID)
+        assert registry.acquire() == mock_device_client
+        patch_create_default_client.assert_called_once_with(session_id=SESSION_ID)
+        mock_device_client.init_device.assert_not_called()
+        assert session_store.get("DEVICE_ID") == b"new"
+
+    def test_acquire_resumes_session_of_other_device(
+        self, registry, session_store, patch_create_default_client, mock_device_client
+    ):
+        mock_device_client.features.device_id = "DEVICE_ID"
+        mock_device_client.session_id = b"new"
+        session_store.set("DEVICE_ID", SESSION_ID)
+        session_store.set("OTHER_DEVICE_ID", b"other")
+        registry.acquire()
+        patch_create_default_client.assert_called_once_with(session_id=b"other")
+        mock_device_client.init_device.assert_called_once_with(session_id=SESSION_ID)
+
+    @pytest.fixture
+    def emulator_clients(self, mocker):
+        clients = {
+            f"emulator:{device_id}": create_emulator_client(device_id=device_id)
+            for device_id in ("DEVICE_A", "DEVICE_B")
+        }
+        transports = [client.transport for client in clients.values()]
+        mocker.patch("ape_trezor.client.enumerate_devices", return_value=transports)
+        mocker.patch(
+            "ape_trezor.client.get_default_client",
+            side_effect=lambda path=None, **kwargs: clients[path or "emulator:DEVICE_A"],
+        )
+        return clients
+
+    def test_acquire_routes_to_device(self, registry, emulator_clients):
+        assert registry.acquire("DEVICE_B") is emulator_clients["emulator:DEVICE_B"]
+        assert registry.acquire("DEVICE_A") is emulator_clients["emulator:DEVICE_A"]
+        assert registry.acquire("DEVICE_B") is emulator_clients["emulator:DEVICE_B"]
+        assert len(registry) == 2
+
+    def test_busy_device_does_not_block_others(self, registry, emulator_clients):
+        client_a = registry.acquire("DEVICE_A")
+        started, busy = threading.Event(), threading.Event()
+        get_device_scheduler("DEVICE_A").submit(lambda: started.set() or busy.wait(5))
+        started.wait(5)
+        releasing = threading.Thread(target=registry.release, args=(client_a,))
+        try:
+            # Closing DEVICE_A waits for its pending request.
+            releasing.start()
+            releasing.join(0.2)
+            assert releasing.is_alive()
+
+            start = time.perf_counter()
+            assert registry.acquire("DEVICE_B") is emulator_clients["emulator:DEVICE_B"]
+            assert time.perf_counter() - start < 1
+
+        finally:
+            busy.set()
+            releasing.join()
+
+    def test_enumerate_devices(self, registry, emulator_clients):
+        assert registry.enumerate_devices() == ["DEVICE_A", "DEVICE_B"]
+        assert len(registry) == 0
+
+        registry.acquire("DEVICE_B")
+        assert registry.enumerate_devices() == ["DEVICE_B", "DEVICE_A"]
+
+    def test_release_saves_session(
+        self, registry, session_store, patch_create_default_client, mock_device_client
+    ):
+        mock_device_client.features.device_id = "DEVICE_ID"
+        mock_device_client.session_id = None
+        client = registry.acquire()
+        assert session_store.get("DEVICE_ID") is None
+
+        # A session ID is allocated on first use.
+        client.session_id = SESSION_ID
+        registry.release(client)
+        assert session_store.get("DEVICE_ID") == SESSION_ID
+
+
+class TestTransportResolver:
+    @pytest.fixture
+    def resolver(self, tmp_path):
+        return TransportResolver(tmp_path / "transport.json")
+
+    def test_connect_remembers_transport(
+        self, resolver, patch_create_default_client, mock_device_client
+    ):
+        assert resolver.connect() == mock_device_client
+        patch_create_default_client.assert_called_once_with()
+        assert resolver.last_path == TRANSPORT_PATH
+
+        # Tries the last transport first.
+        resolver.connect()
+        patch_create_default_client.assert_called_with(TRANSPORT_PATH)
+
+    def test_connect_when_transport_changed(
+        self, mocker, resolver, patch_create_default_client, mock_device_client
+    ):
+        resolver._save("hid:0001")
+        patch_create_default_client.side_effect = (
+            TransportException("hid device not found"),
+            mock_device_client,
+        )
+        assert resolver.connect() == mock_device_client
+        assert patch_create_default_client.call_args_list == [
+            mocker.call("hid:0001"),
+            mocker.call(),
+        ]
+        assert resolver.last_path == TRANSPORT_PATH
+
+    def test_connect_when_pinned(self, tmp_path, patch_create_default_client):
+        resolver = TransportResolver(tmp_path / "transport.json", pinned_path="udp:127.0.0.1:21324")
+        resolver.connect()
+        patch_create_default_client.assert_called_once_with("udp:127.0.0.1:21324")
+        assert resolver.last_path is None
+
 
 def test_extract_signature_vrs_bytes(signature, constants):
     v, r, s = extract_signature_vrs_bytes(signature)
@@ -100,6 +397,45 @@ class TestTrezorAccountClient:
     def account_client(self, address, account_hd_path, mock_device_client):
         return TrezorAccountClient(address, account_hd_path, client=mock_device_client)
 
+    def test_async_get_address(self, account_client, mock_get_address, address, account_hd_path):
+        threads = []
+
+        def get_address(*args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return address
+
+        mock_get_address.side_effect = get_address
+        assert asyncio.run(account_client.async_get_address()) == address
+        mock_get_address.assert_called_once_with(
+            account_client.client, account_hd_path.address_n, show_display=False
+        )
+        assert threads[0].startswith("trezor-")
+
+    def test_run_async_timeout(self, account_client, mock_device_client):
+        cancelled = threading.Event()
+        mock_device_client.cancel.side_effect = cancelled.set
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(account_client.run_async(cancelled.wait, 5, timeout=0.05))
+
+        # The request was aborted on the device.
+        mock_device_client.cancel.assert_called_once_with()
+        assert cancelled.is_set()
+
+    def test_run_async_cancelled_after_call(self, mocker, account_client, mock_device_client):
+        async def run():
+            task = asyncio.create_task(account_client.run_async(mocker.MagicMock()))
+            await asyncio.sleep(0)
+            # Blocks the loop, so the call finishes before the task sees its result.
+            time.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        # The next request on the device is not aborted.
+        mock_device_client.cancel.assert_not_called()
+
     def test_sign_personal_message(
         self, mocker, account_client, account_hd_path, signature, constants
     ):
@@ -197,3 +533,59 @@ class TestTrezorAccountClient:
             "Please ensure you are only using addresses on the Ethereum ecosystem."
         )
         assert caplog.records[-1].message == expected_warning
+
+    @pytest.mark.parametrize(
+        "level", (SafetyCheckLevel.PromptTemporarily, SafetyCheckLevel.PromptAlways)
+    )
+    def test_sign_transaction_when_default_hd_path_and_checks_already_lenient(
+        self,
+        mocker,
+        account_client,
+        dynamic_fee_transaction,
+        mock_device_client,
+        apply_settings_patch,
+        level,
+    ):
+        mock_device_client.features.safety_checks = level
+        sign_eip1559_patch = mocker.patch("ape_trezor.client.sign_tx_eip1559")
+        account_client.sign_dynamic_fee_transaction(**dynamic_fee_transaction)
+        assert sign_eip1559_patch.call_count == 1
+        assert apply_settings_patch.call_count == 0
+
+    def test_sign_transaction_when_not_default_hd_path(
+        self, mocker, address, mock_device_client, dynamic_fee_transaction, apply_settings_patch
+    ):
+        account_client = TrezorAccountClient(
+            address, HDPath("m/44'/1'/0'/0/0"), client=mock_device_client
+        )
+        mocker.patch("ape_trezor.client.sign_tx_eip1559")
+        account_client.sign_dynamic_fee_transaction(**dynamic_fee_transaction)
+        assert apply_settings_patch.call_count == 0
+
+    def test_sign_batch(
+        self,
+        mocker,
+        account_client,
+        static_fee_transaction,
+        dynamic_fee_transaction,
+        mock_device_client,
+        apply_settings_patch,
+        constants,
+    ):
+        signature = (constants.SIG_V, constants.SIG_R, constants.SIG_S)
+        sign_tx_patch = mocker.patch("ape_trezor.client.sign_tx")
+        sign_tx_patch.return_value = signature
+        sign_eip1559_patch = mocker.patch("ape_trezor.client.sign_tx_eip1559")
+        sign_eip1559_patch.return_value = signature
+        transactions = [static_fee_transaction, dynamic_fee_transaction, dynamic_fee_transaction]
+
+        actual = account_client.sign_batch(transactions)
+        assert actual == [signature] * 3
+        assert sign_tx_patch.call_count == 1
+        assert sign_eip1559_patch.call_count == 2
+
+        # Safety checks are switched only once for the whole batch.
+        assert apply_settings_patch.call_count == 2
+        # The registry keeps the device's transport session open.
+        mock_device_client.open.assert_not_called()
+        mock_device_client.close.assert_not_called()
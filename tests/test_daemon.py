@@ -0,0 +1,110 @@
+import stat
+import threading
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from ape_trezor.accounts import _create_client
+from ape_trezor.client import TrezorAccountClient
+from ape_trezor.daemon import DaemonAccountClient, TrezorDaemon
+from ape_trezor.emulator import create_emulator_client
+from ape_trezor.exceptions import TrezorAccountError
+from ape_trezor.hdpath import HDPath
+
+HD_PATH = HDPath("m/44'/1'/0'/0/0")
+
+
+@pytest.fixture
+def emulator_client():
+    return create_emulator_client()
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    return tmp_path / "daemon.sock"
+
+
+@pytest.fixture
+def daemon(emulator_client, socket_path):
+    trezor_daemon = TrezorDaemon(socket_path, client=emulator_client)
+    trezor_daemon.start()
+    thread = threading.Thread(target=trezor_daemon.serve_forever, daemon=True)
+    thread.start()
+    yield trezor_daemon
+    trezor_daemon.shutdown()
+    thread.join()
+
+
+@pytest.fixture
+def address(emulator_client):
+    return emulator_client.transport.get_address(HD_PATH.address_n)
+
+
+@pytest.fixture
+def daemon_client(daemon, address, socket_path):
+    client = DaemonAccountClient.connect(address, HD_PATH, socket_path=socket_path)
+    assert client is not None, "Setup failed: daemon not running"
+    yield client
+    client.close()
+
+
+def test_connect_when_not_running(address, socket_path):
+    assert DaemonAccountClient.connect(address, HD_PATH, socket_path=socket_path) is None
+
+    # Stale socket file.
+    socket_path.touch()
+    assert DaemonAccountClient.connect(address, HD_PATH, socket_path=socket_path) is None
+
+
+def test_sign_personal_message(daemon_client, address, emulator_client):
+    v, r, s = daemon_client.sign_personal_message(b"Hello Apes")
+    signature = r + s + bytes([v])
+    message = encode_defunct(text="Hello Apes")
+    assert Account.recover_message(message, signature=signature) == address
+
+    # Same as signing directly.
+    direct_client = TrezorAccountClient(address, HD_PATH, client=emulator_client)
+    assert direct_client.sign_personal_message(b"Hello Apes") == (v, r, s)
+
+
+def test_sign_batch(daemon_client, address, emulator_client):
+    txn = {
+        "nonce": 0,
+        "gas_price": 1,
+        "gas_limit": 21000,
+        "to": address,
+        "value": 1,
+        "data": b"\x01\x02",
+        "chain_id": 1,
+    }
+    signatures = daemon_client.sign_batch([txn, {**txn, "nonce": 1}])
+    direct_client = TrezorAccountClient(address, HD_PATH, client=emulator_client)
+    assert signatures == [
+        direct_client.sign_static_fee_transaction(**txn),
+        direct_client.sign_static_fee_transaction(**{**txn, "nonce": 1}),
+    ]
+
+
+def test_error(daemon_client):
+    with pytest.raises(TrezorAccountError, match="Unknown Trezor daemon method 'unknown'."):
+        daemon_client._request("unknown")
+
+    # Still connected.
+    assert daemon_client._request("ping") == "pong"
+
+
+def test_already_running(daemon, socket_path, emulator_client):
+    with pytest.raises(TrezorAccountError, match="already running"):
+        TrezorDaemon(socket_path, client=emulator_client).start()
+
+
+def test_create_client_uses_daemon(mocker, daemon, address, socket_path):
+    mocker.patch("ape_trezor.daemon.get_socket_path", return_value=socket_path)
+    client = _create_client(address, HD_PATH)
+    assert isinstance(client, DaemonAccountClient)
+    client.close()
+
+
+def test_socket_is_private(daemon, socket_path):
+    assert stat.S_IMODE(socket_path.stat().st_mode) == 0o600
@@ -0,0 +1,76 @@
+import ape
+import pytest
+from ape.exceptions import ProviderError
+from eth_utils import to_checksum_address
+
+from ape_trezor.discovery import discover_accounts, make_batch_request
+
+USED_INDICES = (0, 2, 9)
+
+
+class AddressClient:
+    def __init__(self):
+        self.derived: list[int] = []
+
+    def get_account_path(self, account_id: int) -> str:
+        self.derived.append(account_id)
+        return to_checksum_address(f"0x{account_id + 0x1000:040x}")
+
+    def get_account_paths(self, account_ids) -> list[str]:
+        return [self.get_account_path(i) for i in account_ids]
+
+
+@pytest.fixture(scope="module")
+def provider():
+    with ape.networks.ethereum.local.use_provider("test") as provider:
+        yield provider
+
+
+@pytest.fixture(scope="module")
+def used_addresses(provider, accounts):
+    client = AddressClient()
+    sender = accounts.test_accounts[0]
+    addresses = [client.get_account_path(i) for i in USED_INDICES]
+    for address in addresses:
+        sender.transfer(address, 1)
+
+    return addresses
+
+
+def test_discover_accounts(provider, used_addresses):
+    client = AddressClient()
+    used = list(discover_accounts(client, provider, gap_limit=7, window_size=3))
+    assert used == list(zip(USED_INDICES, used_addresses))
+
+    # Stops after 7 consecutive unused accounts (10 to 16), checked in windows of 3.
+    assert client.derived == list(range(18))
+
+
+def test_discover_accounts_when_gap_exceeded(provider, used_addresses):
+    client = AddressClient()
+    used = list(discover_accounts(client, provider, gap_limit=5, window_size=1))
+    assert used == [(0, used_addresses[0]), (2, used_addresses[1])]
+    assert client.derived == list(range(8))
+
+
+def test_make_batch_request(mocker):
+    provider = mocker.MagicMock()
+    provider.web3.provider.make_batch_request.return_value = [
+        {"id": 0, "result": "0x1"},
+        {"id": 1, "result": "0x2"},
+    ]
+    requests = [("eth_getBalance", ["0x1", "latest"]), ("eth_getBalance", ["0x2", "latest"])]
+    assert make_batch_request(provider, requests) == ["0x1", "0x2"]
+    provider.make_request.assert_not_called()
+
+    provider.web3.provider.make_batch_request.return_value = {"error": {"message": "Too big"}}
+    with pytest.raises(ProviderError, match="Too big"):
+        make_batch_request(provider, requests)
+
+
+def test_make_batch_request_when_not_supported(mocker):
+    provider = mocker.MagicMock()
+    provider.web3.provider.make_batch_request.side_effect = NotImplementedError
+    provider.make_request.side_effect = lambda method, params: params[0]
+    requests = [("eth_getBalance", ["0x1", "latest"]), ("eth_getBalance", ["0x2", "latest"])]
+    assert make_batch_request(provider, requests) == ["0x1", "0x2"]
@@ -0,0 +1,198 @@
+import time
+
+import pytest
+from eth_account import Account
+from eth_account._utils.legacy_transactions import encode_transaction
+from eth_account._utils.signing import serializable_unsigned_transaction_from_dict
+from eth_account.messages import encode_defunct, encode_typed_data
+from trezorlib.messages import SafetyCheckLevel
+
+from ape_trezor.client import TrezorAccountClient, TrezorClient
+from ape_trezor.emulator import create_emulator_client
+from ape_trezor.hdpath import HDPath
+
+TYPED_DATA = {
+    "types": {
+        "EIP712Domain": [
+            {"name": "name", "type": "string"},
+            {"name": "version", "type": "string"},
+            {"name": "chainId", "type": "uint256"},
+            {"name": "verifyingContract", "type": "address"},
+        ],
+        "Person": [
+            {"name": "name", "type": "string"},
+            {"name": "wallets", "type": "address[]"},
+        ],
+        "Mail": [
+            {"name": "from", "type": "Person"},
+            {"name": "to", "type": "Person[]"},
+            {"name": "contents", "type": "string"},
+            {"name": "nonce", "type": "int8"},
+            {"name": "data", "type": "bytes"},
+            {"name": "tag", "type": "bytes4"},
+            {"name": "urgent", "type": "bool"},
+        ],
+    },
+    "primaryType": "Mail",
+    "domain": {
+        "name": "Ether Mail",
+        "version": "1",
+        "chainId": 1,
+        "verifyingContract": "0xCcCCccccCCCCcCCCCCCcCcCccCcCCCcCcccccccC",
+    },
+    "message": {
+        "from": {
+            "name": "Cow",
+            "wallets": ["0xCD2a3d9F938E13CD947Ec05AbC7FE734Df8DD826"],
+        },
+        "to": [
+            {
+                "name": "Bob",
+                "wallets": [
+                    "0xbBbBBBBbbBBBbbbBbbBbbbbBBbBbbbbBbBbbBBbB",
+                    "0xB0BdaBea57B0BDABeA57b0bdABEA57b0BDabEa57",
+                ],
+            }
+        ],
+        "contents": "Hello, Bob!",
+        "nonce": -3,
+        "data": "0x" + "ab" * 100,
+        "tag": "0xdeadbeef",
+        "urgent": True,
+    },
+}
+
+
+@pytest.fixture
+def emulator_client():
+    return create_emulator_client()
+
+
+@pytest.fixture
+def emulator(emulator_client):
+    return emulator_client.transport
+
+
+@pytest.fixture
+def account_client(emulator, emulator_client):
+    hd_path = HDPath("m/44'/1'/0'/0/0")
+    address = emulator.get_address(hd_path.address_n)
+    return TrezorAccountClient(address, hd_path, client=emulator_client)
+
+
+def test_get_account_path(hd_path, emulator_client):
+    client = TrezorClient(hd_path, client=emulator_client)
+    local_client = TrezorClient(hd_path, client=emulator_client, derive_locally=True)
+    expected = "0x9858EfFD232B4033E47d90003D41EC34EcaEda94"
+    assert client.get_account_path(0) == local_client.get_account_path(0) == expected
+
+
+def test_sign_personal_message(account_client):
+    v, r, s = account_client.sign_personal_message(b"Hello Apes")
+    signature = r + s + bytes([v])
+    message = encode_defunct(text="Hello Apes")
+    assert Account.recover_message(message, signature=signature) == account_client.address
+
+
+@pytest.mark.parametrize("data_size", (0, 1024, 3000))
+def test_sign_static_fee_transaction(account_client, emulator, data_size):
+    txn = {
+        "nonce": 6,
+        "gasPrice": 1,
+        "gas": 21000,
+        "to": "0xE3747e6341E0d3430e6Ea9e2346cdDCc2F8a4b5b",
+        "value": 100000000000,
+        "data": b"\x01" * data_size,
+        "chainId": 4,
+    }
+    v, r, s = account_client.sign_static_fee_transaction(
+        nonce=txn["nonce"],
+        gas_price=txn["gasPrice"],
+        gas_limit=txn["gas"],
+        to=txn["to"],
+        value=txn["value"],
+        data=txn["data"],
+        chain_id=txn["chainId"],
+    )
+    assert _recover_transaction(txn, v, r, s) == account_client.address
+
+    # Data after the initial chunk is requested in 1024 byte chunks.
+    assert emulator.message_counts["EthereumTxAck"] == max(0, (data_size - 1) // 1024)
+
+
+def test_sign_dynamic_fee_transaction(account_client, emulator):
+    txn = {
+        "type": 2,
+        "nonce": 6,
+        "maxFeePerGas": 1500000008,
+        "maxPriorityFeePerGas": 1500000000,
+        "gas": 21000,
+        "to": "0xE3747e6341E0d3430e6Ea9e2346cdDCc2F8a4b5b",
+        "value": 100000000000,
+        "data": b"\x01" * 2000,
+        "chainId": 4,
+        "accessList": [
+            {
+                "address": "0xE3747e6341E0d3430e6Ea9e2346cdDCc2F8a4b5b",
+                "storageKeys": ["0x" + "00" * 31 + "01"],
+            }
+        ],
+    }
+    v, r, s = account_client.sign_dynamic_fee_transaction(
+        nonce=txn["nonce"],
+        gas_limit=txn["gas"],
+        to=txn["to"],
+        value=txn["value"],
+        data=txn["data"],
+        chain_id=txn["chainId"],
+        max_gas_fee=txn["maxFeePerGas"],
+        max_priority_fee=txn["maxPriorityFeePerGas"],
+        access_list=txn["accessList"],
+    )
+    assert _recover_transaction(txn, v, r, s) == account_client.address
+
+    # Signing on a non-default path does not change the settings.
+    assert emulator.message_counts["ApplySettings"] == 0
+
+
+def test_sign_transaction_when_default_hd_path(emulator, emulator_client):
+    hd_path = HDPath("m/44'/60'/0'/0/0")
+    address = emulator.get_address(hd_path.address_n)
+    account_client = TrezorAccountClient(address, hd_path, client=emulator_client)
+    account_client.sign_static_fee_transaction(
+        nonce=0, gas_price=1, gas_limit=21000, to=address, value=0, chain_id=1
+    )
+    assert emulator.message_counts["ApplySettings"] == 2
+    assert emulator.safety_checks == SafetyCheckLevel.Strict
+
+
+def test_sign_typed_data(account_client):
+    v, r, s = account_client.sign_typed_data(TYPED_DATA)
+    message = encode_typed_data(full_message=TYPED_DATA)
+    signature = r + s + bytes([v])
+    assert Account.recover_message(message, signature=signature) == account_client.address
+
+
+def test_sign_typed_data_hash(account_client):
+    message = encode_typed_data(full_message=TYPED_DATA)
+    v, r, s = account_client.sign_typed_data_hash(message.header, message.body)
+    signature = r + s + bytes([v])
+    assert Account.recover_message(message, signature=signature) == account_client.address
+
+
+def test_latency(hd_path):
+    latency = {"EthereumGetAddress": 0.05}
+    client = TrezorClient(hd_path, client=create_emulator_client(latency=latency))
+    start = time.perf_counter()
+    client.get_account_path(0)
+    client.get_account_path(1)
+    assert time.perf_counter() - start >= 0.1
+    assert client.client.transport.message_counts["EthereumGetAddress"] == 2
+
+
+def _recover_transaction(txn: dict, v: int, r: bytes, s: bytes) -> str:
+    unsigned_txn = serializable_unsigned_transaction_from_dict(txn)
+    encoded = encode_transaction(
+        unsigned_txn, (v, int.from_bytes(r, "big"), int.from_bytes(s, "big"))
+    )
+    return Account.recover_transaction(encoded)
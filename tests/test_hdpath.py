@@ -0,0 +1,57 @@
+import pickle
+
+import pytest
+
+from ape_trezor.hdpath import HDBasePath, HDPath
+
+
+def test_address_n():
+    hd_path = HDPath("m/44'/60'/0'/0/1/")
+    assert hd_path.path == "m/44'/60'/0'/0/1"
+    assert hd_path.address_n == [0x8000002C, 0x8000003C, 0x80000000, 0, 1]
+
+
+def test_invalid():
+    with pytest.raises(ValueError):
+        HDPath("44'/60'/0'/0/1")
+
+
+def test_interned():
+    assert HDPath("m/44'/60'/0'/0/1") is HDPath("m/44'/60'/0'/0/1")
+    assert HDBasePath("m/44'/60'/0'/0") is HDBasePath()
+    assert HDBasePath("m/44'/60'/0'/0") is not HDPath("m/44'/60'/0'/0")
+    assert pickle.loads(pickle.dumps(HDPath("m/44'/60'/0'/0/1"))) is HDPath("m/44'/60'/0'/0/1")
+
+
+def test_immutable():
+    hd_path = HDPath("m/44'/60'/0'/0/1")
+    with pytest.raises(AttributeError):
+        hd_path.path = "m/44'/60'/0'/0/2"
+
+    assert HDPath("m/44'/60'/0'/0/1").path == "m/44'/60'/0'/0/1"
+
+
+def test_address_n_is_not_shared():
+    hd_path = HDPath("m/44'/60'/0'/0/1")
+    hd_path.address_n.append(2)
+    assert hd_path.address_n[-1] == 1
+
+
+def test_get_account_path():
+    base_path = HDBasePath("m/44'/1'/0'/0")
+    account_path = base_path.get_account_path(7)
+    assert account_path.path == "m/44'/1'/0'/0/7"
+    assert account_path.address_n == [*base_path.address_n, 7]
+    assert account_path is HDPath("m/44'/1'/0'/0/7")
+
+
+@pytest.mark.parametrize("account_id", (-1, 2**31, True, 1.0, "1"))
+def test_get_account_path_invalid(account_id):
+    with pytest.raises(ValueError, match="Invalid account index"):
+        HDBasePath("m/44'/1'/0'/0").get_account_path(account_id)
+
+
+def test_iter_children():
+    base_path = HDBasePath("m/44'/1'/0'/0")
+    children = list(base_path.iter_children(3, 6))
+    assert [str(c) for c in children] == [f"m/44'/1'/0'/0/{i}" for i in range(3, 6)]
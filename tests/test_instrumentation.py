@@ -0,0 +1,126 @@
+import pytest
+
+from ape_trezor.client import TrezorAccountClient, TrezorClient
+from ape_trezor.emulator import create_emulator_client
+from ape_trezor.hdpath import HDPath
+from ape_trezor.instrumentation import DeviceCallHistogram, add_hook, call_device, remove_hook
+
+
+@pytest.fixture
+def events():
+    recorded: list = []
+    add_hook(recorded.append)
+    yield recorded
+    remove_hook(recorded.append)
+
+
+@pytest.fixture
+def emulator_client():
+    return create_emulator_client()
+
+
+def test_call_device_without_hooks(mocker):
+    lib_call = mocker.MagicMock(return_value="result")
+    assert call_device(lib_call, "client", hd_path=HDPath("m/0")) == "result"
+    lib_call.assert_called_once_with("client")
+
+
+def test_get_address(events, emulator_client, hd_path):
+    client = TrezorClient(hd_path, client=emulator_client)
+    client.get_account_path(0)
+
+    event = events[-1]
+    assert event.name == "get_address"
+    assert event.message_type == "EthereumGetAddress"
+    assert event.hd_path == f"{hd_path.path}/0"
+    assert event.payload_size == 0
+    assert event.duration > 0
+    assert event.outcome == "ok"
+
+
+def test_sign_personal_message(events, emulator_client):
+    hd_path = HDPath("m/44'/1'/0'/0/0")
+    address = emulator_client.transport.get_address(hd_path.address_n)
+    account_client = TrezorAccountClient(address, hd_path, client=emulator_client)
+    account_client.sign_personal_message(b"Hello Apes")
+
+    event = events[-1]
+    assert event.name == "sign_message"
+    assert event.message_type == "EthereumSignMessage"
+    assert event.hd_path == hd_path.path
+    assert event.payload_size == len(b"Hello Apes")
+
+
+def test_sign_transaction_when_default_hd_path(events, emulator_client):
+    hd_path = HDPath("m/44'/60'/0'/0/0")
+    address = emulator_client.transport.get_address(hd_path.address_n)
+    account_client = TrezorAccountClient(address, hd_path, client=emulator_client)
+    account_client.sign_static_fee_transaction(
+        nonce=0, gas_price=1, gas_limit=21000, to=address, value=0, chain_id=1, data=b"\x01" * 64
+    )
+
+    names = [e.name for e in events]
+    assert names == ["apply_settings", "sign_tx", "apply_settings"]
+    assert events[1].payload_size == 64
+
+
+def test_failure(events):
+    def get_address(*args, **kwargs):
+        raise ValueError("Device is gone")
+
+    with pytest.raises(ValueError):
+        call_device(get_address, "client")
+
+    event = events[-1]
+    assert event.outcome == "error"
+    assert isinstance(event.error, ValueError)
+
+
+def test_failing_hook(mocker, events):
+    def failing_hook(event):
+        raise RuntimeError("Exporter is down")
+
+    add_hook(failing_hook)
+    try:
+        assert call_device(mocker.MagicMock(return_value="result"), "client") == "result"
+
+    finally:
+        remove_hook(failing_hook)
+
+    # The other hooks still run.
+    assert len(events) == 1
+
+
+def test_init_device(mocker, events):
+    init_device = mocker.MagicMock(__name__="init_device")
+    call_device(init_device, session_id=b"session")
+    assert events[-1].message_type == "Initialize"
+
+
+def test_histogram(emulator_client, hd_path):
+    histogram = DeviceCallHistogram()
+    add_hook(histogram)
+    try:
+        client = TrezorClient(hd_path, client=emulator_client)
+        for account_id in range(3):
+            client.get_account_path(account_id)
+
+    finally:
+        remove_hook(histogram)
+
+    assert histogram.get_count("get_address") == 3
+    assert histogram.get_mean("get_address") > 0
+    assert histogram.errors["get_address"] == 0
+    assert histogram.get_count("sign_tx") == 0
+
+    # No longer recording.
+    client.get_account_path(3)
+    assert histogram.get_count("get_address") == 3
+
+
+def test_remove_hook(mocker):
+    recorded: list = []
+    add_hook(recorded.append)
+    remove_hook(recorded.append)
+    call_device(mocker.MagicMock(), "client")
+    assert recorded == []
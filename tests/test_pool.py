@@ -0,0 +1,55 @@
+import threading
+from typing import cast
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+from eth_utils import to_checksum_address
+
+from ape_trezor.accounts import TrezorAccount
+from ape_trezor.client import TrezorAccountClient
+from ape_trezor.emulator import EmulatorTransport, create_emulator_client
+from ape_trezor.hdpath import HDPath
+from ape_trezor.pool import map_accounts, sign_message_batches
+
+HD_PATH = HDPath("m/44'/1'/0'/0/0")
+
+
+def create_account(tmp_path, device_id: str, passphrase: str) -> TrezorAccount:
+    emulator_client = create_emulator_client(device_id=device_id, passphrase=passphrase)
+    transport = cast(EmulatorTransport, emulator_client.transport)
+    address = to_checksum_address(transport.get_address(HD_PATH.address_n))
+    account_data = {"address": address, "hdpath": HD_PATH.path, "device_id": device_id}
+    account = TrezorAccount(
+        account_file_path=tmp_path / f"{device_id}.json", account_data=account_data
+    )
+    account.__dict__["client"] = TrezorAccountClient(address, HD_PATH, client=emulator_client)
+    return account
+
+
+@pytest.fixture
+def trezor_accounts(tmp_path):
+    return [
+        create_account(tmp_path, "DEVICE_A", "a"),
+        create_account(tmp_path, "DEVICE_B", "b"),
+    ]
+
+
+def test_map_accounts(trezor_accounts):
+    threads = map_accounts(lambda _: threading.current_thread().name, trezor_accounts * 2)
+    assert threads[:2] == threads[2:]
+    assert threads[0] != threads[1]
+    assert all(t.startswith("trezor-DEVICE_") for t in threads)
+
+
+def test_sign_message_batches(trezor_accounts):
+    messages = ["hello", "apes"]
+    batches = [(account, messages) for account in trezor_accounts]
+    results = sign_message_batches(batches)
+    assert [len(signatures) for signatures in results] == [2, 2]
+    for account, signatures in zip(trezor_accounts, results):
+        for message, signature in zip(messages, signatures):
+            signer = Account.recover_message(
+                encode_defunct(text=message), vrs=(signature.v, signature.r, signature.s)
+            )
+            assert signer == account.address
@@ -0,0 +1,112 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from eth_account import Account
+from eth_account.messages import encode_defunct
+
+from ape_trezor.client import TrezorAccountClient
+from ape_trezor.emulator import create_emulator_client
+from ape_trezor.hdpath import HDPath
+from ape_trezor.scheduler import DeviceScheduler, RequestPriority
+
+
+@pytest.fixture
+def scheduler():
+    return DeviceScheduler("DEVICE_ID")
+
+
+@pytest.fixture
+def blocked(scheduler):
+    # Holds the scheduler's thread until set.
+    event = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        event.wait(5)
+
+    future = scheduler.submit(block)
+    started.wait(5)
+    yield event
+    event.set()
+    future.result()
+
+
+def test_call(scheduler):
+    assert scheduler.call(threading.current_thread) is not threading.current_thread()
+    assert scheduler.call(lambda x, y=0: x + y, 1, y=2) == 3
+
+
+def test_call_raises(scheduler):
+    def fail():
+        raise ValueError("device error")
+
+    with pytest.raises(ValueError, match="device error"):
+        scheduler.call(fail)
+
+
+def test_call_nested(scheduler):
+    assert scheduler.call(lambda: scheduler.call(lambda: "nested")) == "nested"
+
+
+def test_priority_order(scheduler, blocked):
+    order: list[str] = []
+    priorities = (
+        RequestPriority.BACKGROUND,
+        RequestPriority.MESSAGE,
+        RequestPriority.BACKGROUND,
+        RequestPriority.TRANSACTION,
+    )
+    futures = [
+        scheduler.submit(order.append, f"{p.name}-{i}", priority=p)
+        for i, p in enumerate(priorities)
+    ]
+    assert scheduler.queue_depth == 4
+
+    blocked.set()
+    for future in futures:
+        future.result()
+
+    assert order == ["TRANSACTION-3", "MESSAGE-1", "BACKGROUND-0", "BACKGROUND-2"]
+
+
+def test_cancel_queued(scheduler, blocked):
+    calls: list[int] = []
+    future = scheduler.submit(calls.append, 1)
+    assert future.cancel()
+
+    blocked.set()
+    scheduler.call(calls.append, 2)
+    assert calls == [2]
+
+
+def test_get_stats(scheduler, blocked):
+    future = scheduler.submit(int, priority=RequestPriority.BACKGROUND)
+    stats = scheduler.get_stats()
+    assert stats[RequestPriority.BACKGROUND].queued == 1
+    assert stats[RequestPriority.BACKGROUND].completed == 0
+
+    # Not completed while running.
+    assert scheduler.get_stats()[RequestPriority.DEFAULT].completed == 0
+
+    blocked.set()
+    future.result()
+    stats = scheduler.get_stats()[RequestPriority.BACKGROUND]
+    assert stats.queued == 0
+    assert stats.completed == 1
+    assert stats.max_wait > 0
+    assert stats.mean_wait == stats.total_wait
+
+
+def test_account_client_from_many_threads():
+    hd_path = HDPath("m/44'/1'/0'/0/0")
+    emulator_client = create_emulator_client(device_id="SCHEDULER_DEVICE")
+    address = emulator_client.transport.get_address(hd_path.address_n)
+    account_client = TrezorAccountClient(address, hd_path, client=emulator_client)
+    messages = [f"message {i}".encode() for i in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        signatures = list(executor.map(account_client.sign_personal_message, messages))
+
+    for message, vrs in zip(messages, signatures):
+        assert Account.recover_message(encode_defunct(primitive=message), vrs=vrs) == address
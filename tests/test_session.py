@@ -0,0 +1,70 @@
+import stat
+import time
+
+import pytest
+
+from ape_trezor.session import SessionStore
+
+DEVICE_ID = "DEVICE_ID"
+SESSION_ID = bytes(range(32))
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(tmp_path / "sessions.json")
+
+
+def test_get_when_not_stored(store):
+    assert store.get(DEVICE_ID) is None
+    assert store.get_latest() is None
+
+
+def test_set(store):
+    store.set(DEVICE_ID, SESSION_ID)
+    assert store.get(DEVICE_ID) == SESSION_ID
+    assert store.get_latest() == (DEVICE_ID, SESSION_ID)
+
+    # Persisted to disk, readable only by the owner.
+    assert SessionStore(store.path).get(DEVICE_ID) == SESSION_ID
+    assert stat.S_IMODE(store.path.stat().st_mode) == 0o600
+
+
+def test_get_latest(store):
+    store.set(DEVICE_ID, SESSION_ID)
+    store.set("OTHER_DEVICE_ID", b"other")
+    assert store.get_latest() == ("OTHER_DEVICE_ID", b"other")
+
+
+def test_get_when_expired(store, mocker):
+    store.set(DEVICE_ID, SESSION_ID)
+    mocker.patch("ape_trezor.session.time.time", return_value=time.time() + store.ttl + 1)
+    assert store.get(DEVICE_ID) is None
+
+
+def test_set_when_disabled(tmp_path):
+    store = SessionStore(tmp_path / "sessions.json", ttl=0)
+    store.set(DEVICE_ID, SESSION_ID)
+    assert store.get(DEVICE_ID) is None
+    assert not store.path.exists()
+
+
+def test_delete(store):
+    store.set(DEVICE_ID, SESSION_ID)
+    store.delete(DEVICE_ID)
+    assert store.get(DEVICE_ID) is None
+
+
+def test_get_when_corrupted(store):
+    store.path.write_text("{not json")
+    assert store.get(DEVICE_ID) is None
+
+
+def test_from_data_folder_not_an_account(accounts, existing_key_file):
+    store = SessionStore.from_data_folder()
+    store.set(DEVICE_ID, SESSION_ID)
+    container = accounts.containers["trezor"]
+    try:
+        assert "sessions" not in container.aliases
+        assert all(account.address for account in container.accounts)
+    finally:
+        store.delete(DEVICE_ID)
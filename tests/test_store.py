@@ -0,0 +1,161 @@
+import json
+import os
+import sqlite3
+
+import pytest
+
+from ape_trezor.accounts import AccountContainer, TrezorAccount
+from ape_trezor.store import JSONAccountStore, SQLiteAccountStore
+
+ALIAS = "trezor-store"
+HD_PATH = "m/44'/60'/0'/0/0"
+
+
+@pytest.fixture(params=("json", "sqlite"))
+def store(request, tmp_path):
+    if request.param == "json":
+        return JSONAccountStore(tmp_path)
+
+    return SQLiteAccountStore(tmp_path / "accounts.sqlite")
+
+
+def test_save(store, address):
+    assert store.get(ALIAS) is None
+    store.save(ALIAS, address, HD_PATH)
+    assert store.get(ALIAS) == {"address": address, "hdpath": HD_PATH}
+    assert list(store.aliases) == [ALIAS]
+    assert len(store) == 1
+
+    # Saving again replaces the account.
+    store.save(ALIAS, address, "m/44'/60'/0'/0/1")
+    assert store.get(ALIAS) == {"address": address, "hdpath": "m/44'/60'/0'/0/1"}
+    assert len(store) == 1
+
+
+def test_save_many(store, address):
+    store.save_many((f"{ALIAS}-{i}", address, f"{HD_PATH}{i}") for i in range(3))
+    assert sorted(store.aliases) == [f"{ALIAS}-{i}" for i in range(3)]
+    assert store.get(f"{ALIAS}-2") == {"address": address, "hdpath": f"{HD_PATH}2"}
+    assert store.find_record(address)[0] == f"{ALIAS}-0"
+
+
+def test_save_with_device_id(store, address):
+    store.save(ALIAS, address, HD_PATH, device_id="DEVICE_ID")
+    expected = {"address": address, "hdpath": HD_PATH, "device_id": "DEVICE_ID"}
+    assert store.get(ALIAS) == expected
+    assert store.find_record(address)[0] == ALIAS
+
+    store.save_many([(f"{ALIAS}-0", address, HD_PATH)], device_id="OTHER_DEVICE_ID")
+    assert store.get(f"{ALIAS}-0")["device_id"] == "OTHER_DEVICE_ID"
+
+
+def test_delete(store, address):
+    store.save(ALIAS, address, HD_PATH)
+    store.delete(ALIAS)
+    assert store.get(ALIAS) is None
+    assert len(store) == 0
+
+    # Deleting a missing account does nothing.
+    store.delete(ALIAS)
+
+
+def test_find_record(store, address):
+    assert store.find_record(address) is None
+    store.save(ALIAS, address, HD_PATH)
+    assert store.find_record(address)[0] == ALIAS
+    assert store.find_record(address.lower())[0] == ALIAS
+
+    # Updated when the account's address changes.
+    other_address = "0xAb5801a7D398351b8bE11C439e05C5B3259aeC9B"
+    store.save(ALIAS, other_address, HD_PATH)
+    assert store.find_record(address) is None
+    assert store.find_record(other_address)[0] == ALIAS
+
+    store.delete(ALIAS)
+    assert store.find_record(other_address) is None
+
+
+def test_json_find_record_when_changed_elsewhere(tmp_path, address, key_file_data):
+    store = JSONAccountStore(tmp_path)
+    assert store.find_record(address) is None
+
+    # Account file added by something else.
+    (tmp_path / "external.json").write_text(json.dumps({**key_file_data, "address": address}))
+    assert store.find_record(address) == ("external", None)
+
+
+def test_json_find_record_when_rewritten_elsewhere(tmp_path, address, key_file_data):
+    store = JSONAccountStore(tmp_path)
+    store.save(ALIAS, address, HD_PATH)
+    path = store.get_path(ALIAS)
+    stat = path.stat()
+    assert store.find_record(address)[0] == ALIAS
+
+    # Rewritten in place, keeping the modification times (e.g. on a filesystem
+    # with coarse modification times).
+    path.write_text(json.dumps({**key_file_data, "device_id": "DEVICE_ID"}))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert store.find_record(address) is None
+    assert store.find_record(key_file_data["address"])[0] == ALIAS
+
+
+def test_sqlite_migrates_json_files(tmp_path, address, key_file_data):
+    (tmp_path / "from_json.json").write_text(json.dumps(key_file_data))
+    (tmp_path / "invalid.json").write_text("{}")
+    store = SQLiteAccountStore(tmp_path / "accounts.sqlite", json_folder=tmp_path)
+    assert list(store.aliases) == ["from_json"]
+    assert store.get("from_json") == key_file_data
+
+    # Only migrates once: deleted accounts do not come back.
+    store.delete("from_json")
+    store.close()
+    store = SQLiteAccountStore(tmp_path / "accounts.sqlite", json_folder=tmp_path)
+    assert len(store) == 0
+
+
+def test_sqlite_delete_migrated_account(tmp_path, key_file_data):
+    (tmp_path / "from_json.json").write_text(json.dumps(key_file_data))
+    store = SQLiteAccountStore(tmp_path / "accounts.sqlite", json_folder=tmp_path)
+    store.delete("from_json")
+
+    # Does not come back when switching to the JSON store.
+    json_store = JSONAccountStore(tmp_path)
+    assert json_store.get("from_json") is None
+    assert json_store.find_record(key_file_data["address"]) is None
+
+
+def test_sqlite_adds_device_id_column(tmp_path, address):
+    path = tmp_path / "accounts.sqlite"
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE accounts (alias TEXT PRIMARY KEY, address, hdpath)")
+        connection.execute("INSERT INTO accounts VALUES (?, ?, ?)", (ALIAS, address, HD_PATH))
+
+    connection.close()
+    store = SQLiteAccountStore(path)
+    assert store.get(ALIAS) == {"address": address, "hdpath": HD_PATH}
+    store.save(ALIAS, address, HD_PATH, device_id="DEVICE_ID")
+    assert store.get(ALIAS)["device_id"] == "DEVICE_ID"
+    store.close()
+
+
+def test_container_with_sqlite_store(tmp_path, address):
+    container = AccountContainer(name="trezor", account_type=TrezorAccount)
+    container.__dict__["_store"] = SQLiteAccountStore(tmp_path / "accounts.sqlite")
+    container.save_account(ALIAS, address, HD_PATH)
+
+    assert list(container.aliases) == [ALIAS]
+    assert len(container) == 1
+    account = next(container.accounts)
+    assert account.alias == ALIAS
+    assert account.address.lower() == address.lower()
+    assert account.hd_path.path == HD_PATH
+
+    assert address in container
+    assert container[address].alias == ALIAS
+    assert container.get_alias(address) == ALIAS
+
+    container.delete_account(ALIAS)
+    assert len(container) == 0
+    assert address not in container
+    with pytest.raises(KeyError):
+        _ = container[address]